@@ -1,6 +1,47 @@
 # ICON URL
 ASSET_URL = "https://spaceone-custom-assets.s3.ap-northeast-2.amazonaws.com/console-assets/icons/cloud-services/google_cloud"
 
+# Collector Settings
+DEFAULT_MAX_WORKERS = 8
+RESPONSE_QUEUE_SIZE_PER_WORKER = 100
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_PROJECT_MAX_WORKERS = 4
+# Budget of the thread pools of a collection, shared by the pools run by managers
+DEFAULT_MAX_CONCURRENT_REQUESTS = 32
+
+# Google API Request Settings
+# OAuth scopes of the service account credentials (every collected API accepts them)
+GOOGLE_API_SCOPES = ["https://www.googleapis.com/auth/cloud-platform"]
+DEFAULT_MAX_RETRIES = 5
+RETRY_BACKOFF_BASE_SECONDS = 1
+RETRY_BACKOFF_MAX_SECONDS = 60
+RETRYABLE_STATUS_CODES = [429, 500, 502, 503, 504]
+RETRYABLE_REASONS = ["rateLimitExceeded", "userRateLimitExceeded"]
+# HTTP transport shared by every Google API client of the process
+DEFAULT_HTTP_POOL_CONNECTIONS = 10
+HTTP_TIMEOUT_SECONDS = 120
+# Requests per second of each Google API in each project (shared by the whole process)
+DEFAULT_API_RATE_LIMIT = 10
+API_RATE_LIMITS = {
+    "compute": 20,
+    "storage": 50,
+    "monitoring": 20,
+    "pubsub": 50,
+    "sqladmin": 10,
+    "bigquery": 20,
+    "cloudfunctions": 10,
+    "eventarc": 10,
+    "cloudresourcemanager": 10,
+}
+
+# Partial Response Settings (fields masks of one item of a list request)
+# Instances listed by the Networking managers, only to find the instances of their resources.
+# It is the union of the fields those managers read, so that they share one listing.
+NETWORKING_INSTANCE_FIELDS = (
+    "id,name,zone,selfLink,creationTimestamp,labels,tags(items),serviceAccounts(email),"
+    "networkInterfaces(network,subnetwork,networkIP,accessConfigs(natIP,networkTier))"
+)
+
 # Cloud Logging Settings
 CLOUD_LOGGING_RESOURCE_TYPE_MAP = {
     "ComputeEngine": {
@@ -1,12 +1,31 @@
-import google.oauth2.service_account
-import googleapiclient
-import googleapiclient.discovery
+import googleapiclient.errors
+import json
 import logging
+import queue
+import random
+import threading
+import time
 
 from spaceone.core.connector import BaseConnector
 
+from cloudforet.plugin.config.global_conf import (
+    API_RATE_LIMITS,
+    DEFAULT_API_RATE_LIMIT,
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_MAX_RETRIES,
+    RETRY_BACKOFF_BASE_SECONDS,
+    RETRY_BACKOFF_MAX_SECONDS,
+    RETRYABLE_REASONS,
+    RETRYABLE_STATUS_CODES,
+)
+from cloudforet.plugin.connector.cache import cached_resources
+from cloudforet.plugin.connector.client_factory import ClientFactory
+from cloudforet.plugin.connector.rate_limiter import RateLimiter
+from cloudforet.plugin.connector.scope import CollectionScope
+
 DEFAULT_SCHEMA = "google_oauth_client_id"
 _LOGGER = logging.getLogger(__name__)
+_LAST_PAGE = object()
 
 
 class GoogleCloudConnector(BaseConnector):
@@ -19,6 +38,18 @@ class GoogleCloudConnector(BaseConnector):
             - schema
             - options
             - secret_data
+            - cache: ResourceCache shared by the current collection (optional)
+
+        options(dict)
+            - max_results: page size of list requests (optional)
+            - page_prefetch: number of pages fetched ahead in the background (optional)
+            - batch_size: number of requests sent in one batch HTTP request (optional)
+            - max_retries: retries of a request failed with a retryable error (optional)
+            - api_rate_limits: requests per second by API, e.g. {"compute": 20} (optional)
+            - http_pool_connections: number of hosts with a connection pool (optional)
+            - http_pool_maxsize: connections kept alive per host
+              (optional, sized from the WorkerBudget of the options by default)
+            - region_codes, zones, labels: scope of the collection (optional, see CollectionScope)
 
         secret_data(dict)
             - type: ..
@@ -30,15 +61,24 @@ class GoogleCloudConnector(BaseConnector):
         super().__init__(*args, **kwargs)
         secret_data = kwargs.get("secret_data")
         self.project_id = secret_data.get("project_id")
-        self.credentials = (
-            google.oauth2.service_account.Credentials.from_service_account_info(
-                secret_data
-            )
-        )
-        self.client = googleapiclient.discovery.build(
+        self.cache = kwargs.get("cache")
+        options = kwargs.get("options") or {}
+        self.max_results = options.get("max_results")
+        self.page_prefetch = int(options.get("page_prefetch") or 0)
+        self.batch_size = int(options.get("batch_size") or DEFAULT_BATCH_SIZE)
+        self.max_retries = int(options.get("max_retries", DEFAULT_MAX_RETRIES))
+        self.scope = CollectionScope(options)
+        self.rate_limiter = RateLimiter.get(
             self.google_client_service,
-            self.version,
-            credentials=self.credentials,
+            self.project_id,
+            (options.get("api_rate_limits") or {}).get(
+                self.google_client_service,
+                API_RATE_LIMITS.get(self.google_client_service, DEFAULT_API_RATE_LIMIT),
+            ),
+        )
+        self.credentials = ClientFactory.get_credentials(secret_data)
+        self.client = ClientFactory.get_client(
+            self.google_client_service, self.version, secret_data, options
         )
 
     def generate_query(self, **query):
@@ -49,7 +89,247 @@ class GoogleCloudConnector(BaseConnector):
         )
         return query
 
+    def paginate(
+        self,
+        resource,
+        method="list",
+        items_key="items",
+        fields=None,
+        page_size_key="maxResults",
+        **query,
+    ):
+        """Yields the items of every page of `resource.<method>(**query)` lazily.
+
+        - aggregatedList responses are flattened over their scopes, with `items_key`
+          as the item key of each scope (e.g. "disks").
+        - fields: partial response mask of a single item (e.g. "name,selfLink")
+        - page_size_key: page size parameter of the API, set from `options.max_results`.
+          None if the API has no page size.
+        """
+        is_aggregated = method == "aggregatedList"
+        if fields:
+            items_path = f"items/*/{items_key}" if is_aggregated else items_key
+            query["fields"] = f"nextPageToken,{items_path}({fields})"
+        if page_size_key and self.max_results:
+            query.setdefault(page_size_key, self.max_results)
+
+        list_next = getattr(resource, f"{method}_next", None)
+        request = getattr(resource, method)(**query)
+        if self.page_prefetch > 0 and list_next:
+            pages = self._prefetch_pages(request, list_next)
+        else:
+            pages = self._iter_pages(request, list_next)
+
+        for response in pages:
+            if is_aggregated:
+                for scoped_list in response.get("items", {}).values():
+                    yield from scoped_list.get(items_key, [])
+            else:
+                yield from response.get(items_key, [])
+
+    def paginate_in_scope(
+        self,
+        resource,
+        items_key,
+        zonal=None,
+        regional=None,
+        labeled=True,
+        filters=None,
+        **query,
+    ):
+        """Yields the items of `resource.aggregatedList(**query)` within the collection scope.
+
+        - items_key: item key of each scope of the aggregatedList response
+        - zonal, regional: resources listing the items of one zone / region
+          (e.g. client.disks(), client.regionDisks()). If the collection is limited to
+          regions or zones, the items are listed by them per zone / region instead.
+        - labeled: the items have labels, so the label selector of the scope applies
+        - filters: other filters, [{"key": "status", "values": ["RUNNING"]}]
+        """
+        filters = (self.scope.label_filters if labeled else []) + (filters or [])
+        if filters:
+            query["filter"] = self.make_filter(filters)
+
+        if not self.scope.is_regional:
+            yield from self.paginate(resource, "aggregatedList", items_key, **query)
+            return
+
+        query.pop("includeAllScopes", None)
+        query.pop("returnPartialSuccess", None)
+        if zonal is not None:
+            for zone in self.scope.list_zones(self._list_scope_zones()):
+                yield from self.paginate(zonal, zone=zone, **query)
+        if regional is not None:
+            for region in self.scope.list_regions():
+                yield from self.paginate(regional, region=region, **query)
+
+    @cached_resources("zones")
+    def _list_scope_zones(self):
+        return list(
+            self.paginate(
+                self.client.zones(), fields="name,region", project=self.project_id
+            )
+        )
+
+    def make_filter(self, filters):
+        """Compute API filter expression of [{"key": ..., "values": [...]}], all of them matched"""
+        filter_strings = [
+            self._get_full_filter_string(
+                single_filter.get("key", ""), single_filter.get("values", [])
+            )
+            for single_filter in filters
+        ]
+        return " AND ".join(
+            filter_string for filter_string in filter_strings if filter_string != ""
+        )
+
+    def execute(self, request):
+        """Executes `request` within the rate limit of the API, retrying retryable errors.
+
+        Retryable errors (429, 5xx, rate limit reasons, connection errors) are retried up to
+        `max_retries` times with exponential backoff and full jitter, or after the
+        Retry-After of the response.
+        """
+        return self._call_with_retry(request.execute)
+
+    def execute_batch(self, requests):
+        """Executes `requests` ({key: request}) with batch HTTP requests of up to `batch_size` calls.
+
+        Requests failed with a retryable error are sent again in the next batch round.
+        Returns {key: response} in the order of `requests`.
+        A request that failed has its exception (e.g. HttpError) as the response.
+        """
+        keys = list(requests)
+        responses = {}
+
+        def _callback(request_id, response, exception):
+            responses[keys[int(request_id)]] = (
+                exception if exception is not None else response
+            )
+
+        pending = list(range(len(keys)))
+        for retry in range(self.max_retries + 1):
+            for start in range(0, len(pending), self.batch_size):
+                indexes = pending[start : start + self.batch_size]
+                batch = self.client.new_batch_http_request(callback=_callback)
+                for index in indexes:
+                    batch.add(requests[keys[index]], request_id=str(index))
+                self._call_with_retry(batch.execute, tokens=len(indexes))
+
+            failed = [
+                index for index in pending if self._is_retryable(responses[keys[index]])
+            ]
+            if not failed or retry == self.max_retries:
+                break
+
+            pending = failed
+            time.sleep(
+                max(self._get_retry_delay(responses[keys[i]], retry) for i in failed)
+            )
+
+        return {key: responses[key] for key in keys}
+
+    def _call_with_retry(self, call, tokens=1):
+        retry = 0
+        while True:
+            self.rate_limiter.acquire(tokens)
+            try:
+                return call()
+            except Exception as e:
+                if retry >= self.max_retries or not self._is_retryable(e):
+                    raise
+
+                delay = self._get_retry_delay(e, retry)
+                _LOGGER.warning(
+                    f"[{self.google_client_service}] retry {retry + 1}/{self.max_retries} in {delay:.1f}s: {e}"
+                )
+                time.sleep(delay)
+                retry += 1
+
+    @staticmethod
+    def _is_retryable(error):
+        if isinstance(error, (ConnectionError, TimeoutError)):
+            return True
+        if not isinstance(error, googleapiclient.errors.HttpError):
+            return False
+        if error.resp.status in RETRYABLE_STATUS_CODES:
+            return True
+        if error.resp.status == 403:
+            try:
+                errors = json.loads(error.content).get("error", {}).get("errors", [])
+            except (ValueError, AttributeError):
+                return False
+            return any(e.get("reason") in RETRYABLE_REASONS for e in errors)
+        return False
+
+    @staticmethod
+    def _get_retry_delay(error, retry):
+        # Retry-After is limited like the backoff, invalid values fall back to the backoff
+        if isinstance(error, googleapiclient.errors.HttpError):
+            try:
+                retry_after = float(error.resp.get("retry-after"))
+            except (TypeError, ValueError):
+                retry_after = None
+            if retry_after is not None and 0 <= retry_after < float("inf"):
+                return min(retry_after, RETRY_BACKOFF_MAX_SECONDS)
+
+        backoff = RETRY_BACKOFF_BASE_SECONDS * 2**retry
+        return random.uniform(0, min(backoff, RETRY_BACKOFF_MAX_SECONDS))
+
+    def _iter_pages(self, request, list_next):
+        while request is not None:
+            response = self.execute(request)
+            yield response
+            request = list_next(request, response) if list_next else None
+
+    def _prefetch_pages(self, request, list_next):
+        """Fetches up to `page_prefetch` pages ahead of the caller on a background thread."""
+        pages = queue.Queue(maxsize=self.page_prefetch)
+        stopped = threading.Event()
+
+        def _put(page):
+            while not stopped.is_set():
+                try:
+                    pages.put(page, timeout=1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def _fetch_pages():
+            try:
+                for response in self._iter_pages(request, list_next):
+                    if not _put(response):
+                        return
+                _put(_LAST_PAGE)
+            except Exception as e:
+                _put(e)
+
+        threading.Thread(target=_fetch_pages, name="page-prefetch", daemon=True).start()
+        try:
+            while (page := pages.get()) is not _LAST_PAGE:
+                if isinstance(page, Exception):
+                    raise page
+                yield page
+        finally:
+            stopped.set()
+
+    @staticmethod
+    def _get_full_filter_string(filter_key, filter_values):
+        filter_string = ""
+        if filter_key != "" and filter_values != [] and isinstance(filter_values, list):
+            single_filter_list = [f"{filter_key}={x}" for x in filter_values]
+            join_string = " OR ".join(single_filter_list)
+            filter_string = f"({join_string})"
+        elif (
+            filter_key != ""
+            and filter_values != []
+            and not isinstance(filter_values, dict)
+        ):
+            filter_string = f"({filter_key}={filter_values})"
+        return filter_string
+
     def list_zones(self, **query):
         query = self.generate_query(**query)
-        result = self.client.zones().list(**query).execute()
+        result = self.execute(self.client.zones().list(**query))
         return result.get("items", [])
@@ -14,52 +14,33 @@ class SQLWorkspaceConnector(GoogleCloudConnector):
         super().__init__(**kwargs)
 
     def list_dataset(self, **query):
-        dataset_list = []
         query.update({"projectId": self.project_id, "all": True})
-        request = self.client.datasets().list(**query)
-        while request is not None:
-            response = request.execute()
-            for dataset in response.get("datasets", []):
-                dataset_list.append(dataset)
-            request = self.client.datasets().list_next(
-                previous_request=request, previous_response=response
-            )
-
-        return dataset_list
+        return list(
+            self.paginate(self.client.datasets(), items_key="datasets", **query)
+        )
 
     def get_dataset(self, dataset_id, **query):
         query.update({"projectId": self.project_id, "datasetId": dataset_id})
         response = {}
-        response = self.client.datasets().get(**query).execute()
+        response = self.execute(self.client.datasets().get(**query))
 
         return response
 
-    def list_projects(self, **query):
-        project_list = []
-        request = self.client.projects().list(**query)
-
-        while request is not None:
-            response = request.execute()
-            for project in response.get("projects", []):
-                project_list.append(project)
-            request = self.client.projects().list_next(
-                previous_request=request, previous_response=response
-            )
+    def get_datasets(self, dataset_ids, **query):
+        query.update({"projectId": self.project_id})
+        dataset_service = self.client.datasets()
+        return self.execute_batch(
+            {
+                dataset_id: dataset_service.get(datasetId=dataset_id, **query)
+                for dataset_id in dataset_ids
+            }
+        )
 
-        return project_list
+    def list_projects(self, **query):
+        return list(
+            self.paginate(self.client.projects(), items_key="projects", **query)
+        )
 
     def list_tables(self, dataset_id, **query):
-        table_list = []
-
         query.update({"projectId": self.project_id, "datasetId": dataset_id})
-
-        request = self.client.tables().list(**query)
-        while request is not None:
-            response = request.execute()
-            for table in response.get("tables", []):
-                table_list.append(table)
-            request = self.client.tables().list_next(
-                previous_request=request, previous_response=response
-            )
-
-        return table_list
+        return list(self.paginate(self.client.tables(), items_key="tables", **query))
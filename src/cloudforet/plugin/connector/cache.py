@@ -0,0 +1,91 @@
+import functools
+import logging
+import threading
+from concurrent.futures import Future
+
+__all__ = ["ResourceCache", "cached_resources"]
+_LOGGER = logging.getLogger(__name__)
+
+
+class ResourceCache:
+    """Collection-scoped cache of Google API list results.
+
+    One cache is created per `Collector.collect` call and shared by every manager.
+    Concurrent callers of the same key wait for a single fetch. Every caller gets the
+    same cached result, so it is read-only: callers copy the items they change.
+    A failed fetch is not cached; the next caller fetches again.
+
+    catalog: cache of the collections that do not depend on the collected project
+    (e.g. public images), shared by the caches of every project of a multi-project
+    collection. The cache itself by default.
+    """
+
+    def __init__(self, catalog=None):
+        self._lock = threading.Lock()
+        self._results = {}
+        self.catalog = catalog or self
+
+    def get_or_fetch(self, key, fetch):
+        with self._lock:
+            result = self._results.get(key)
+            is_owner = result is None
+            if is_owner:
+                result = self._results[key] = Future()
+
+        if is_owner:
+            try:
+                result.set_result(fetch())
+            except Exception as e:
+                with self._lock:
+                    self._results.pop(key, None)
+                result.set_exception(e)
+        else:
+            _LOGGER.debug(f"[ResourceCache] hit: {key}")
+
+        return result.result()
+
+    @classmethod
+    def make_key(cls, *args, **query):
+        return tuple(cls._freeze(arg) for arg in args) + (cls._freeze(query),)
+
+    @classmethod
+    def _freeze(cls, value):
+        if isinstance(value, dict):
+            return tuple(sorted((k, cls._freeze(v)) for k, v in value.items()))
+        if isinstance(value, (list, tuple)):
+            return tuple(cls._freeze(v) for v in value)
+        return value
+
+
+def cached_resources(collection, shared=False, scoped=False):
+    """Serves a connector list method from the connector's ResourceCache.
+
+    The key is (project, API, version, collection, query), so every connector method
+    decorated with the same collection must return the same result for the same query.
+    shared: the result does not depend on the collected project, so it is kept in the
+    catalog of the cache without the project in its key.
+    scoped: the result is limited to the scope of the collection (CollectionScope),
+    so the scope is in its key if the collection is scoped.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **query):
+            if self.cache is None:
+                return func(self, *args, **query)
+
+            cache = self.cache.catalog if shared else self.cache
+            key = ResourceCache.make_key(
+                None if shared else self.project_id,
+                self.google_client_service,
+                self.version,
+                collection,
+                *((self.scope.key,) if scoped and self.scope else ()),
+                *args,
+                **query,
+            )
+            return cache.get_or_fetch(key, lambda: func(self, *args, **query))
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,103 @@
+import google.oauth2.service_account
+import googleapiclient
+import googleapiclient.discovery
+import logging
+import threading
+
+from cloudforet.plugin.config.global_conf import (
+    DEFAULT_HTTP_POOL_CONNECTIONS,
+    GOOGLE_API_SCOPES,
+    HTTP_TIMEOUT_SECONDS,
+)
+from cloudforet.plugin.connector.concurrency import WorkerBudget
+from cloudforet.plugin.connector.transport import AuthorizedSessionHttp
+
+__all__ = ["ClientFactory"]
+_LOGGER = logging.getLogger(__name__)
+
+
+class ClientFactory:
+    """Process-wide factory of Google API clients.
+
+    Credentials are created once per service account key, with GOOGLE_API_SCOPES,
+    and shared by every connector. Their token is refreshed by the transport when it
+    is missing or expired. Each service account key has one pooled, thread-safe http
+    transport (AuthorizedSessionHttp), and built clients are cached per
+    (service, version, transport), so every connector and thread shares them.
+    Clients are built from the discovery documents bundled with google-api-python-client.
+    """
+
+    _lock = threading.Lock()
+    _credentials = {}
+    _transports = {}
+    _clients = {}
+
+    @classmethod
+    def get_client(cls, service, version, secret_data, options=None):
+        transport_key = cls._get_transport_key(secret_data, options or {})
+        key = (service, version, transport_key)
+
+        client = cls._clients.get(key)
+        if client is None:
+            _LOGGER.debug(f"[ClientFactory] build client: {service}.{version}")
+            client = googleapiclient.discovery.build(
+                service,
+                version,
+                http=cls.get_transport(secret_data, options),
+                static_discovery=True,
+                cache_discovery=False,
+            )
+            with cls._lock:
+                client = cls._clients.setdefault(key, client)
+        return client
+
+    @classmethod
+    def get_transport(cls, secret_data, options=None):
+        """Pooled http transport of the service account key
+
+        options(dict)
+            - http_pool_connections: number of hosts with a connection pool (optional)
+            - http_pool_maxsize: connections kept alive per host
+              (optional, sized from the WorkerBudget of the options by default)
+        """
+        key = cls._get_transport_key(secret_data, options or {})
+        credentials = cls.get_credentials(secret_data)
+        with cls._lock:
+            transport = cls._transports.get(key)
+            if transport is None:
+                _, pool_connections, pool_maxsize = key
+                transport = AuthorizedSessionHttp(
+                    credentials, pool_connections, pool_maxsize, HTTP_TIMEOUT_SECONDS
+                )
+                cls._transports[key] = transport
+        return transport
+
+    @classmethod
+    def get_credentials(cls, secret_data):
+        identity = cls._get_identity(secret_data)
+        with cls._lock:
+            credentials = cls._credentials.get(identity)
+            if credentials is None:
+                credentials = (
+                    google.oauth2.service_account.Credentials.from_service_account_info(
+                        secret_data, scopes=GOOGLE_API_SCOPES
+                    )
+                )
+                cls._credentials[identity] = credentials
+
+        return credentials
+
+    @classmethod
+    def _get_transport_key(cls, secret_data, options):
+        return (
+            cls._get_identity(secret_data),
+            int(options.get("http_pool_connections") or DEFAULT_HTTP_POOL_CONNECTIONS),
+            int(
+                options.get("http_pool_maxsize")
+                or WorkerBudget(options).http_pool_maxsize
+            ),
+        )
+
+    @staticmethod
+    def _get_identity(secret_data):
+        return secret_data.get("client_email"), secret_data.get("private_key_id")
@@ -1,6 +1,7 @@
 import logging
 
 from cloudforet.plugin.connector.base import GoogleCloudConnector
+from cloudforet.plugin.connector.cache import cached_resources
 
 __all__ = ["EventarcConnector"]
 _LOGGER = logging.getLogger(__name__)
@@ -13,19 +14,17 @@ class EventarcConnector(GoogleCloudConnector):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
+    @cached_resources("providers", shared=True)
     def list_providers(self):
-        providers = []
         query = {"parent": self._make_parent()}
-        eventarc_provider_service = self.client.projects().locations().providers()
-        request = eventarc_provider_service.list(**query)
-
-        while request is not None:
-            response = request.execute()
-            providers = response.get("providers", [])
-            request = eventarc_provider_service.list_next(
-                previous_request=request, previous_response=response
+        return list(
+            self.paginate(
+                self.client.projects().locations().providers(),
+                items_key="providers",
+                page_size_key="pageSize",
+                **query,
             )
-        return providers
+        )
 
     def _make_parent(self):
         return f"projects/{self.project_id}/locations/-"
@@ -14,18 +14,15 @@ class FunctionGen2Connector(GoogleCloudConnector):
         super().__init__(**kwargs)
 
     def list_functions(self):
-        functions = []
         query = {"parent": self._make_parent()}
-        functions_service = self.client.projects().locations().functions()
-        request = functions_service.list(**query)
-
-        while request is not None:
-            response = request.execute()
-            functions = response.get("functions", [])
-            request = functions_service.list_next(
-                previous_request=request, previous_response=response
+        return list(
+            self.paginate(
+                self.client.projects().locations().functions(),
+                items_key="functions",
+                page_size_key="pageSize",
+                **query,
             )
-        return functions
+        )
 
     def _make_parent(self):
         return f"projects/{self.project_id}/locations/-"
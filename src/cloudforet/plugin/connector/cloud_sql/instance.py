@@ -14,54 +14,17 @@ class CloudSQLInstanceConnector(GoogleCloudConnector):
         super().__init__(**kwargs)
 
     def list_instances(self, **query):
-        instance_list = []
         query.update({"project": self.project_id})
-
-        request = self.client.instances().list(**query)
-        while request is not None:
-            response = request.execute()
-            for instance in response.get("items", []):
-                instance_list.append(instance)
-            request = self.client.instances().list_next(
-                previous_request=request, previous_response=response
-            )
-
-        return instance_list
+        return list(self.paginate(self.client.instances(), **query))
 
     def list_databases(self, instance_name, **query):
-        database_list = []
         query.update({"project": self.project_id, "instance": instance_name})
-
-        request = self.client.databases().list(**query)
-        while request is not None:
-            response = request.execute()
-            for database in response.get("items", []):
-                database_list.append(database)
-            request = self.client.instances().list_next(
-                previous_request=request, previous_response=response
-            )
-
-        return database_list
+        return list(self.paginate(self.client.databases(), page_size_key=None, **query))
 
     def list_users(self, instance_name, **query):
-        user_list = []
         query.update({"project": self.project_id, "instance": instance_name})
-        response = self.client.users().list(**query).execute()
-        user_list = response.get("items", [])
-
-        return user_list
+        return list(self.paginate(self.client.users(), page_size_key=None, **query))
 
     def list_backup_runs(self, instance_name, **query):
-        backup_runs_list = []
         query.update({"project": self.project_id, "instance": instance_name})
-        request = self.client.backup_runs().list(**query)
-
-        while request is not None:
-            response = request.execute()
-            for backup in response.get("items", []):
-                backup_runs_list.append(backup)
-            request = self.client.backup_runs().list_next(
-                previous_request=request, previous_response=response
-            )
-
-        return backup_runs_list
+        return list(self.paginate(self.client.backupRuns(), **query))
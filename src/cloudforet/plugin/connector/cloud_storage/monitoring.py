@@ -52,12 +52,46 @@ class MonitoringConnector(GoogleCloudConnector):
     def list_metrics_time_series(self, bucket_name, metric, start, end, **query):
         query = self.get_metric_data_query(bucket_name, metric, start, end, **query)
 
-        response = self.client.projects().timeSeries().list(**query).execute()
+        response = self.execute(self.client.projects().timeSeries().list(**query))
         if "timeSeries" in response:
             return response.get("timeSeries")[0]
         else:
             return {}
 
+    def list_bucket_metric_values(self, metric, start, end, **query):
+        """Latest value of `metric` for every bucket of the project, in one paginated query.
+
+        Each time series is aligned to its latest point in [start, end] and summed over
+        the other labels (e.g. storage_class).
+        Returns {bucket_name: TypedValue} (e.g. {"int64Value": "10"})
+        """
+        alignment_period = max(int((end - start).total_seconds()), 60)
+        query.update(
+            {
+                "name": f"projects/{self.project_id}",
+                "filter": f'metric.type="{metric}" AND resource.type="gcs_bucket"',
+                "interval_endTime": self.date_time_to_iso(end),
+                "interval_startTime": self.date_time_to_iso(start),
+                "aggregation_alignmentPeriod": f"{alignment_period}s",
+                "aggregation_perSeriesAligner": "ALIGN_NEXT_OLDER",
+                "aggregation_crossSeriesReducer": "REDUCE_SUM",
+                "aggregation_groupByFields": ["resource.label.bucket_name"],
+            }
+        )
+
+        metric_values = {}
+        for time_series in self.paginate(
+            self.client.projects().timeSeries(),
+            items_key="timeSeries",
+            page_size_key="pageSize",
+            **query,
+        ):
+            labels = time_series.get("resource", {}).get("labels", {})
+            if points := time_series.get("points", []):
+                metric_values[labels.get("bucket_name")] = points[0].get("value", {})
+
+        return metric_values
+
     @staticmethod
     def date_time_to_iso(date_time):
         date_format = date_time.isoformat()
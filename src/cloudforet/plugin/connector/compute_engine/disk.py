@@ -1,6 +1,7 @@
 import logging
 
 from cloudforet.plugin.connector.base import GoogleCloudConnector
+from cloudforet.plugin.connector.cache import cached_resources
 
 __all__ = ["DiskConnector"]
 _LOGGER = logging.getLogger(__name__)
@@ -13,33 +14,30 @@ class DiskConnector(GoogleCloudConnector):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
+    @cached_resources("disks", scoped=True)
     def list_disks(self, **query):
-        disk_list = []
         query.update({"project": self.project_id})
-        request = self.client.disks().aggregatedList(**query)
-
-        while request is not None:
-            response = request.execute()
-            for key, _disk in response["items"].items():
-                if "disks" in _disk:
-                    disk_list.extend(_disk.get("disks"))
-            request = self.client.disks().aggregatedList_next(
-                previous_request=request, previous_response=response
+        return list(
+            self.paginate_in_scope(
+                self.client.disks(),
+                "disks",
+                zonal=self.client.disks(),
+                regional=self.client.regionDisks(),
+                **query,
             )
-        return disk_list
+        )
 
     def list_resource_policies(self, **query):
         resource_policy_vo = {}
         query.update({"project": self.project_id})
-        request = self.client.resourcePolicies().aggregatedList(**query)
-        while request is not None:
-            response = request.execute()
-            for key, _disk in response["items"].items():
-                if "resourcePolicies" in _disk:
-                    _key = key[key.rfind("/") + 1 :]
-                    resource_policy_vo.update({_key: _disk.get("resourcePolicies")})
-            request = self.client.resourcePolicies().aggregatedList_next(
-                previous_request=request, previous_response=response
-            )
+        for resource_policy in self.paginate(
+            self.client.resourcePolicies(),
+            "aggregatedList",
+            "resourcePolicies",
+            **query,
+        ):
+            region = resource_policy.get("region", "")
+            _key = region[region.rfind("/") + 1 :]
+            resource_policy_vo.setdefault(_key, []).append(resource_policy)
 
         return resource_policy_vo
@@ -1,6 +1,9 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 from cloudforet.plugin.connector.base import GoogleCloudConnector
+from cloudforet.plugin.connector.cache import cached_resources
+from cloudforet.plugin.connector.concurrency import WorkerBudget
 
 __all__ = ["InstanceGroupConnector"]
 _LOGGER = logging.getLogger(__name__)
@@ -12,80 +15,100 @@ class InstanceGroupConnector(GoogleCloudConnector):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        options = kwargs.get("options") or {}
+        self.max_workers = WorkerBudget(options).get_inner_max_workers(
+            "instance_group_max_workers"
+        )
 
     def list_instances(self, instance_group, loc, loc_type, **query):
         query.update(
             {"project": self.project_id, "instanceGroup": instance_group, loc_type: loc}
         )
 
-        request = (
-            self.client.instanceGroups().listInstances(**query)
+        resource = (
+            self.client.instanceGroups()
             if loc_type == "zone"
-            else self.client.regionInstanceGroups().listInstances(**query)
+            else self.client.regionInstanceGroups()
         )
-        response = request.execute()
-
-        return response.get("items", [])
+        return list(self.paginate(resource, "listInstances", **query))
+
+    @cached_resources("instanceGroupMembers")
+    def list_instance_group_members(self):
+        """Instances of every instance group (managed or not) of the project.
+
+        The instances of the groups are listed concurrently by up to
+        `options.instance_group_max_workers` threads.
+        Returns ({instance group selfLink: [InstanceWithNamedPorts]},
+        {instance group selfLink: error} of the groups whose listing failed).
+        """
+
+        def _list_instances(instance_group):
+            loc_type = "zone" if "zone" in instance_group else "region"
+            return self.list_instances(
+                instance_group.get("name"),
+                instance_group.get(loc_type, "").split("/")[-1],
+                loc_type,
+            )
 
+        instance_groups = self.list_instance_groups()
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="instance-group"
+        ) as executor:
+            futures = {
+                instance_group.get("selfLink"): executor.submit(
+                    _list_instances, instance_group
+                )
+                for instance_group in instance_groups
+            }
+
+        instance_group_members = {}
+        failed_instance_groups = {}
+        for self_link, future in futures.items():
+            try:
+                instance_group_members[self_link] = future.result()
+            except Exception as e:
+                _LOGGER.error(
+                    f"[list_instance_group_members] Error on instance group {self_link}: {e}"
+                )
+                failed_instance_groups[self_link] = e
+        return instance_group_members, failed_instance_groups
+
+    @cached_resources("instanceTemplates")
     def list_instance_templates(self, **query):
-        instance_template_list = []
         query.update({"project": self.project_id})
-        request = self.client.instanceTemplates().list(**query)
-        while request is not None:
-            response = request.execute()
-            for template in response.get("items", []):
-                instance_template_list.append(template)
-            request = self.client.instanceTemplates().list_next(
-                previous_request=request, previous_response=response
-            )
-
-        return instance_template_list
+        return list(self.paginate(self.client.instanceTemplates(), **query))
 
+    @cached_resources("instanceGroups", scoped=True)
     def list_instance_groups(self, **query):
-        instance_group_list = []
         query.update({"project": self.project_id})
-        request = self.client.instanceGroups().aggregatedList(**query)
-        while request is not None:
-            response = request.execute()
-            for key, _instance_group_list in response["items"].items():
-                if "instanceGroups" in _instance_group_list:
-                    instance_group_list.extend(
-                        _instance_group_list.get("instanceGroups")
-                    )
-            request = self.client.instanceGroups().aggregatedList_next(
-                previous_request=request, previous_response=response
+        return list(
+            self.paginate_in_scope(
+                self.client.instanceGroups(),
+                "instanceGroups",
+                zonal=self.client.instanceGroups(),
+                regional=self.client.regionInstanceGroups(),
+                labeled=False,
+                **query
             )
+        )
 
-        return instance_group_list
-
+    @cached_resources("instanceGroupManagers")
     def list_instance_group_managers(self, **query):
-        instance_group_manager_list = []
         query.update({"project": self.project_id})
-        request = self.client.instanceGroupManagers().aggregatedList(**query)
-        while request is not None:
-            response = request.execute()
-            for key, _instance_group_manager_list in response["items"].items():
-                if "instanceGroupManagers" in _instance_group_manager_list:
-                    instance_group_manager_list.extend(
-                        _instance_group_manager_list.get("instanceGroupManagers")
-                    )
-            request = self.client.instanceGroupManagers().aggregatedList_next(
-                previous_request=request, previous_response=response
+        return list(
+            self.paginate(
+                self.client.instanceGroupManagers(),
+                "aggregatedList",
+                "instanceGroupManagers",
+                **query
             )
+        )
 
-        return instance_group_manager_list
-
+    @cached_resources("autoscalers")
     def list_autoscalers(self, **query):
-        autoscaler_list = []
         query.update({"project": self.project_id})
-        request = self.client.autoscalers().aggregatedList(**query)
-        while request is not None:
-            response = request.execute()
-            for key, _autoscaler_list in response["items"].items():
-                if "autoscalers" in _autoscaler_list:
-                    autoscaler_list.extend(_autoscaler_list.get("autoscalers"))
-            request = self.client.autoscalers().aggregatedList_next(
-                previous_request=request, previous_response=response
+        return list(
+            self.paginate(
+                self.client.autoscalers(), "aggregatedList", "autoscalers", **query
             )
-
-        return autoscaler_list
+        )
@@ -14,34 +14,20 @@ class MachineImageConnector(GoogleCloudConnector):
         super().__init__(**kwargs)
 
     def list_machine_images(self, **query):
-        machine_image_list = []
         query.update({"project": self.project_id})
-        request = self.client.machineImages().list(**query)
-        while request is not None:
-            response = request.execute()
-            for image in response.get("items", []):
-                machine_image_list.append(image)
-            request = self.client.machineImages().list_next(
-                previous_request=request, previous_response=response
-            )
-
-        return machine_image_list
+        if self.scope.labels:
+            query["filter"] = self.make_filter(self.scope.label_filters)
+        return list(self.paginate(self.client.machineImages(), **query))
 
     def list_machine_types(self, zone, **query):
         query.update({"zone": zone})
         query = self.generate_query(**query)
-        result = {"items": []}
-        result = self.client.machineTypes().list(**query).execute()
-
-        return result.get("items", [])
+        return list(self.paginate(self.client.machineTypes(), **query))
 
     def list_disks(self, zone, **query):
         query.update({"zone": zone})
         query = self.generate_query(**query)
-        result = {"items": []}
-        result = self.client.disks().list(**query).execute()
-
-        return result.get("items", [])
+        return list(self.paginate(self.client.disks(), **query))
 
     def list_public_images(self, **query) -> dict:
         public_images = {}
@@ -65,7 +51,7 @@ class MachineImageConnector(GoogleCloudConnector):
                     "orderBy": "creationTimestamp desc",
                 }
             )
-            response = self.client.images().list(**query).execute()
+            response = self.execute(self.client.images().list(**query))
             image = response.get("items", [])
             k = public_image.get("key")
             public_images[k] = image
@@ -1,6 +1,7 @@
 import logging
 
 from cloudforet.plugin.connector.base import GoogleCloudConnector
+from cloudforet.plugin.connector.cache import cached_resources
 
 __all__ = ["SnapshotConnector"]
 _LOGGER = logging.getLogger(__name__)
@@ -14,46 +15,33 @@ class SnapshotConnector(GoogleCloudConnector):
         super().__init__(**kwargs)
 
     def list_snapshot(self, **query):
-        snapshot_list = []
         query = self.generate_query(**query)
-        request = self.client.snapshots().list(**query)
-        while request is not None:
-            response = request.execute()
-            for snapshot in response.get("items", []):
-                snapshot_list.append(snapshot)
-            request = self.client.snapshots().list_next(
-                previous_request=request, previous_response=response
-            )
-
-        return snapshot_list
+        if self.scope.labels:
+            query["filter"] = self.make_filter(self.scope.label_filters)
+        return list(self.paginate(self.client.snapshots(), **query))
 
     def list_resource_policies(self, **query):
         resource_policies = {}
         query = self.generate_query(**query)
-        result = self.client.resourcePolicies().aggregatedList(**query).execute()
-        all_results = result.get("items", {})
-        for region in all_results.keys():
-            if "resourcePolicies" in all_results.get(region):
-                for single_policy in all_results.get(region).get(
-                    "resourcePolicies", []
-                ):
-                    resource_policies[single_policy.get("selfLink")] = single_policy
+        for single_policy in self.paginate(
+            self.client.resourcePolicies(),
+            "aggregatedList",
+            "resourcePolicies",
+            **query,
+        ):
+            resource_policies[single_policy.get("selfLink")] = single_policy
         return resource_policies
 
-    def list_all_disks_for_snapshots(self, **query):
-        disks = []
-        disk_with_schedule = {}
+    @cached_resources("disks")
+    def list_disks(self, **query):
         query = self.generate_query(**query)
-        request = self.client.disks().aggregatedList(**query)
-        while request is not None:
-            response = request.execute()
-            for name, disks_scoped_list in response["items"].items():
-                if "disks" in disks_scoped_list:
-                    disks.extend(disks_scoped_list.get("disks"))
-            request = self.client.disks().aggregatedList_next(
-                previous_request=request, previous_response=response
-            )
+        return list(
+            self.paginate(self.client.disks(), "aggregatedList", "disks", **query)
+        )
 
+    def list_all_disks_for_snapshots(self, **query):
+        disk_with_schedule = {}
+        disks = self.list_disks(**query)
         for disk in disks:
             if "resourcePolicies" in disk:
                 zone_name_only = self._get_zone(disk.get("zone"))
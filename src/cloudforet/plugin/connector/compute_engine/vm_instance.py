@@ -1,10 +1,10 @@
 import logging
 import os
-import google.oauth2.service_account
-import googleapiclient
-import googleapiclient.discovery
+import threading
 
 from cloudforet.plugin.connector.base import GoogleCloudConnector
+from cloudforet.plugin.connector.client_factory import ClientFactory
+from cloudforet.plugin.connector.cache import cached_resources
 
 __all__ = ["VMInstanceConnector"]
 _LOGGER = logging.getLogger(__name__)
@@ -12,14 +12,29 @@ INSTANCE_TYPE_FILE = "%s/conf/%s" % (
     os.path.dirname(os.path.abspath(__file__)),
     "instances.json",
 )
+INSTANCE_STATUSES = [
+    "PROVISIONING",
+    "STAGING",
+    "RUNNING",
+    "STOPPING",
+    "REPAIRING",
+    "SUSPENDING",
+    "SUSPENDED",
+    "TERMINATED",
+]
 
 
 class VMInstanceConnector(GoogleCloudConnector):
     google_client_service = "compute"
     version = "v1"
+    # Machine types by (zone, name), kept for the whole process (specs don't change)
+    _machine_types = {}
+    _machine_types_lock = threading.Lock()
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        options = kwargs.get("options") or {}
+        self.instance_statuses = options.get("instance_statuses") or INSTANCE_STATUSES
 
     def verify(self, options, secret_data):
         self.get_connect(secret_data)
@@ -34,152 +49,96 @@ class VMInstanceConnector(GoogleCloudConnector):
             - ...
         """
         self.project_id = secret_data.get("project_id")
-        credentials = (
-            google.oauth2.service_account.Credentials.from_service_account_info(
-                secret_data
-            )
-        )
-        self.client = googleapiclient.discovery.build(
-            "compute", "v1", credentials=credentials
-        )
+        self.client = ClientFactory.get_client("compute", "v1", secret_data)
 
     def list_regions(self):
-        result = self.client.regions().list(project=self.project_id).execute()
+        result = self.execute(self.client.regions().list(project=self.project_id))
         return result.get("items", [])
 
     def list_zones(self):
-        result = self.client.zones().list(project=self.project_id).execute()
+        result = self.execute(self.client.zones().list(project=self.project_id))
         return result.get("items", [])
 
     def list_instances(self, **query):
-        status_filter = {
-            "key": "status",
-            "values": [
-                "PROVISIONING",
-                "STAGING",
-                "RUNNING",
-                "STOPPING",
-                "REPAIRING",
-                "SUSPENDING",
-                "SUSPENDED",
-                "TERMINATED",
-            ],
-        }
-        if "filter" in query:
-            query.get("filter").append(status_filter)
-        else:
-            query.update({"filter": [status_filter]})
+        """Instances of `options.instance_statuses` (default: INSTANCE_STATUSES) in the scope
 
-        query = self.generate_key_query(
-            "filter", self._get_filter_to_params(**query), "", is_default=True, **query
-        )
+        The statuses are filtered by the API, so instances in the other statuses are
+        never downloaded.
+        """
+        filters = query.pop("filter", None) or []
+        filters = filters + [{"key": "status", "values": self.instance_statuses}]
+        return self._list_all_instances(filter=filters, **query)
 
-        instance_list = []
+    @cached_resources("instances", scoped=True)
+    def _list_all_instances(self, **query):
+        """
+        filter: [{"key": "status", "values": ["RUNNING", "STOPPING"]}, ...]
+        """
         query.update({"project": self.project_id})
-        request = self.client.instances().aggregatedList(**query)
-
-        while request is not None:
-            response = request.execute()
-            for key, _instance_list in response["items"].items():
-                if "instances" in _instance_list:
-                    instance_list.extend(_instance_list.get("instances"))
-            request = self.client.instances().aggregatedList_next(
-                previous_request=request, previous_response=response
+        return list(
+            self.paginate_in_scope(
+                self.client.instances(),
+                "instances",
+                zonal=self.client.instances(),
+                filters=query.pop("filter", None),
+                **query,
             )
-        return instance_list
+        )
 
     def list_machine_types(self, **query):
-        machine_type_list = []
         query.update({"project": self.project_id})
-        request = self.client.machineTypes().aggregatedList(**query)
-        while request is not None:
-            response = request.execute()
-            for key, machine_type in response["items"].items():
-                if "machineTypes" in machine_type:
-                    machine_type_list.extend(machine_type.get("machineTypes"))
-            request = self.client.machineTypes().aggregatedList_next(
-                previous_request=request, previous_response=response
+        return list(
+            self.paginate(
+                self.client.machineTypes(), "aggregatedList", "machineTypes", **query
             )
+        )
 
-        return machine_type_list
-
+    @cached_resources("urlMaps")
     def list_url_maps(self, **query):
-        url_map_list = []
         query.update({"project": self.project_id})
-        request = self.client.urlMaps().aggregatedList(**query)
-
-        while request is not None:
-            response = request.execute()
-            for key, url_scoped_list in response["items"].items():
-                if "urlMaps" in url_scoped_list:
-                    url_map_list.extend(url_scoped_list.get("urlMaps"))
-            request = self.client.urlMaps().aggregatedList_next(
-                previous_request=request, previous_response=response
-            )
-
-        return url_map_list
+        return list(
+            self.paginate(self.client.urlMaps(), "aggregatedList", "urlMaps", **query)
+        )
 
+    @cached_resources("backendServices")
     def list_back_end_services(self, **query):
-        backend_svc_list = []
         query.update({"project": self.project_id})
-        request = self.client.backendServices().aggregatedList(**query)
-        while request is not None:
-            response = request.execute()
-            for key, url_scoped_list in response["items"].items():
-                if "backendServices" in url_scoped_list:
-                    backend_svc_list.extend(url_scoped_list.get("backendServices"))
-            request = self.client.backendServices().aggregatedList_next(
-                previous_request=request, previous_response=response
+        return list(
+            self.paginate(
+                self.client.backendServices(),
+                "aggregatedList",
+                "backendServices",
+                **query,
             )
+        )
 
-        return backend_svc_list
-
+    @cached_resources("disks")
     def list_disks(self, **query):
-        disk_list = []
         query.update({"project": self.project_id})
-        request = self.client.disks().aggregatedList(**query)
-        while request is not None:
-            response = request.execute()
-            for key, _disk in response["items"].items():
-                if "disks" in _disk:
-                    disk_list.extend(_disk.get("disks"))
-            request = self.client.disks().aggregatedList_next(
-                previous_request=request, previous_response=response
-            )
-
-        return disk_list
+        return list(
+            self.paginate(self.client.disks(), "aggregatedList", "disks", **query)
+        )
 
+    @cached_resources("autoscalers")
     def list_autoscalers(self, **query):
-        autoscaler_list = []
         query.update({"project": self.project_id})
-        request = self.client.autoscalers().aggregatedList(**query)
-        while request is not None:
-            response = request.execute()
-            for key, _autoscaler_list in response["items"].items():
-                if "autoscalers" in _autoscaler_list:
-                    autoscaler_list.extend(_autoscaler_list.get("autoscalers"))
-            request = self.client.autoscalers().aggregatedList_next(
-                previous_request=request, previous_response=response
+        return list(
+            self.paginate(
+                self.client.autoscalers(), "aggregatedList", "autoscalers", **query
             )
+        )
 
-        return autoscaler_list
-
+    @cached_resources("firewalls")
     def list_firewall(self, **query):
-        firewalls_list = []
         query.update({"project": self.project_id})
-        request = self.client.firewalls().list(**query)
-
-        while request is not None:
-            response = request.execute()
-            for backend_bucket in response.get("items", []):
-                firewalls_list.append(backend_bucket)
-            request = self.client.firewalls().list_next(
-                previous_request=request, previous_response=response
-            )
-
-        return firewalls_list
+        return list(self.paginate(self.client.firewalls(), **query))
 
-    def list_images(self, public_id, **query) -> dict:
+    def list_images(self, public_id, licenses=None, **query) -> dict:
+        """
+        licenses: license lists (tuples) of the boot disks to resolve.
+            If given, only the image projects those licenses belong to are listed,
+            and only the latest image of each of those license lists is returned.
+        """
         public_images = {}
         public_image_list = [
             {"key": "centos", "value": "centos-cloud"},
@@ -193,45 +152,97 @@ class VMInstanceConnector(GoogleCloudConnector):
             {"key": "windows", "value": "windows-cloud"},
             {"key": "custom", "value": public_id},
         ]
+        if licenses is not None:
+            licenses = {tuple(license_list) for license_list in licenses}
+            license_projects = {
+                self._get_license_project(license_url)
+                for license_list in licenses
+                for license_url in license_list
+            }
 
         for public_image in public_image_list:
-            query.update(
-                {
-                    "project": public_image.get("value"),
-                    "orderBy": "creationTimestamp desc",
-                }
-            )
-            response = self.client.images().list(**query).execute()
-            public_images[public_image.get("key")] = response.get("items", [])
+            public_images[public_image.get("key")] = []
+            if licenses is not None and public_image["value"] not in license_projects:
+                continue
+
+            found_licenses = set()
+            for image in self.list_project_images(public_image["value"], **query):
+                image_licenses = tuple(image.get("licenses", []))
+                if licenses is None:
+                    public_images[public_image.get("key")].append(image)
+                elif (
+                    image_licenses in licenses and image_licenses not in found_licenses
+                ):
+                    found_licenses.add(image_licenses)
+                    public_images[public_image.get("key")].append(image)
 
         return public_images
 
+    @cached_resources("images", shared=True)
+    def list_project_images(self, project, **query):
+        """Images of `project` (newest first), with the fields needed to resolve VM OS images"""
+        query.update({"project": project, "orderBy": "creationTimestamp desc"})
+        return list(
+            self.paginate(self.client.images(), fields="description,licenses", **query)
+        )
+
+    @cached_resources("instanceGroups")
     def list_instance_groups(self, **query):
-        instance_group_list = []
         query.update({"project": self.project_id})
-        request = self.client.instanceGroups().aggregatedList(**query)
-        while request is not None:
-            response = request.execute()
-            for key, _instance_group_list in response["items"].items():
-                if "instanceGroups" in _instance_group_list:
-                    instance_group_list.extend(
-                        _instance_group_list.get("instanceGroups")
-                    )
-            request = self.client.instanceGroups().aggregatedList_next(
-                previous_request=request, previous_response=response
+        return list(
+            self.paginate(
+                self.client.instanceGroups(),
+                "aggregatedList",
+                "instanceGroups",
+                **query,
             )
-
-        return instance_group_list
+        )
 
     def get_machine_type(self, zone, machine_type, **query):
         response = {}
         query.update(
             {"project": self.project_id, "zone": zone, "machineType": machine_type}
         )
-        response = self.client.machineTypes().get(**query).execute()
+        response = self.execute(self.client.machineTypes().get(**query))
 
         return response
 
+    def get_machine_types(self, zone_machine_types):
+        """Machine types of the given (zone, machine type name) pairs.
+
+        Pairs not fetched yet by this process are fetched with batch requests.
+        Returns {(zone, machine type name): machineType}, without the pairs that failed.
+        """
+        zone_machine_types = set(zone_machine_types)
+        with self._machine_types_lock:
+            missing = zone_machine_types - self._machine_types.keys()
+
+        machine_type_service = self.client.machineTypes()
+        responses = self.execute_batch(
+            {
+                (zone, machine_type): machine_type_service.get(
+                    project=self.project_id, zone=zone, machineType=machine_type
+                )
+                for zone, machine_type in sorted(missing)
+            }
+        )
+        for key, response in responses.items():
+            if isinstance(response, Exception):
+                _LOGGER.error(
+                    f"[get_machine_types] Error on machine type {key}: {response}"
+                )
+                continue
+
+            with self._machine_types_lock:
+                self._machine_types[key] = response
+
+        with self._machine_types_lock:
+            return {
+                key: self._machine_types[key]
+                for key in zone_machine_types
+                if key in self._machine_types
+            }
+
     """
     Query all instance list from managed instance group
     """
@@ -241,105 +252,71 @@ class VMInstanceConnector(GoogleCloudConnector):
     ):
         query = self.generate_query(**query)
         query.update({key: loc, "instanceGroup": instance_group_name})
-        response = []
-
-        request = (
-            self.client.instanceGroups().listInstances(**query).execute()
+        resource = (
+            self.client.instanceGroups()
             if key == "zone"
-            else self.client.regionInstanceGroups().listInstances(**query).execute()
+            else self.client.regionInstanceGroups()
         )
-        response = request.get("items", [])
-
-        return response
+        return list(self.paginate(resource, "listInstances", **query))
 
     # Queries managed instance groups
+    @cached_resources("instanceGroupManagers")
     def list_instance_group_managers(self, **query):
-        instance_group_manager_list = []
         query.update({"project": self.project_id})
-        request = self.client.instanceGroupManagers().aggregatedList(**query)
-
-        while request is not None:
-            response = request.execute()
-            for key, _instance_group_manager_list in response["items"].items():
-                if "instanceGroupManagers" in _instance_group_manager_list:
-                    instance_group_manager_list.extend(
-                        _instance_group_manager_list.get("instanceGroupManagers")
-                    )
-            request = self.client.instanceGroupManagers().aggregatedList_next(
-                previous_request=request, previous_response=response
+        return list(
+            self.paginate(
+                self.client.instanceGroupManagers(),
+                "aggregatedList",
+                "instanceGroupManagers",
+                **query,
             )
-        return instance_group_manager_list
+        )
 
+    @cached_resources("networks")
     def list_vpcs(self, **query):
-        network_list = []
         query.update({"project": self.project_id})
-        request = self.client.networks().list(**query)
-        while request is not None:
-            response = request.execute()
-            for network in response.get("items", []):
-                network_list.append(network)
-            request = self.client.networks().list_next(
-                previous_request=request, previous_response=response
-            )
-
-        return network_list
+        return list(self.paginate(self.client.networks(), **query))
 
+    @cached_resources("subnetworks")
     def list_subnetworks(self, **query):
-        subnetworks_list = []
         query = self.generate_query(**query)
-        request = self.client.subnetworks().aggregatedList(**query)
-        while request is not None:
-            response = request.execute()
-            for name, _sbworks_list in response["items"].items():
-                if "subnetworks" in _sbworks_list:
-                    subnetworks_list.extend(_sbworks_list.get("subnetworks"))
-            request = self.client.addresses().aggregatedList_next(
-                previous_request=request, previous_response=response
+        return list(
+            self.paginate(
+                self.client.subnetworks(), "aggregatedList", "subnetworks", **query
             )
+        )
 
-        return subnetworks_list
-
+    @cached_resources("targetPools")
     def list_target_pools(self, **query):
-        target_pool_list = []
         query.update({"project": self.project_id})
-        request = self.client.targetPools().aggregatedList(**query)
-
-        while request is not None:
-            response = request.execute()
-            for key, pool_scoped_list in response["items"].items():
-                if "targetPools" in pool_scoped_list:
-                    target_pool_list.extend(pool_scoped_list.get("targetPools"))
-            request = self.client.targetPools().aggregatedList_next(
-                previous_request=request, previous_response=response
+        return list(
+            self.paginate(
+                self.client.targetPools(), "aggregatedList", "targetPools", **query
             )
+        )
 
-        return target_pool_list
-
+    @cached_resources("forwardingRules")
     def list_forwarding_rules(self, **query):
-        forwarding_rule_list = []
         query.update({"project": self.project_id})
-        request = self.client.forwardingRules().aggregatedList(**query)
-        while request is not None:
-            response = request.execute()
-            for key, forwarding_scoped_list in response["items"].items():
-                if "forwardingRules" in forwarding_scoped_list:
-                    forwarding_rule_list.extend(
-                        forwarding_scoped_list.get("forwardingRules")
-                    )
-            request = self.client.forwardingRules().aggregatedList_next(
-                previous_request=request, previous_response=response
+        return list(
+            self.paginate(
+                self.client.forwardingRules(),
+                "aggregatedList",
+                "forwardingRules",
+                **query,
             )
-        return forwarding_rule_list
+        )
 
     def get_instance_in_group(self, key, value, instance_group, **query):
         query.update(
             {"project": self.project_id, key: value, "instanceGroup": instance_group}
         )
-        response = (
-            self.client.instanceGroups().listInstances(**query).execute()
+        resource = (
+            self.client.instanceGroups()
             if key == "zone"
-            else self.client.regionInstanceGroups().listInstances(**query).execute()
+            else self.client.regionInstanceGroups()
         )
+        response = self.execute(resource.listInstances(**query))
         # NoneType error occurs sometimes. To prevent them insert default value.
         if response is None:
             _LOGGER.debug(f"[get_instance_in_group] response is None")
@@ -348,19 +325,6 @@ class VMInstanceConnector(GoogleCloudConnector):
             _LOGGER.debug(f"[get_instance_in_group] response => {response}")
         return response
 
-    def _get_filter_to_params(self, **query):
-        filtering_list = []
-        filters = query.get("filter", None)
-        if filters and isinstance(filters, list):
-            for single_filter in filters:
-                filter_key = single_filter.get("key", "")
-                filter_values = single_filter.get("values", [])
-                filter_str = self._get_full_filter_string(filter_key, filter_values)
-                if filter_str != "":
-                    filtering_list.append(filter_str)
-
-            return " AND ".join(filtering_list)
-
     def generate_query(self, **query):
         query.update(
             {
@@ -385,16 +349,9 @@ class VMInstanceConnector(GoogleCloudConnector):
         return region
 
     @staticmethod
-    def _get_full_filter_string(filter_key, filter_values):
-        filter_string = ""
-        if filter_key != "" and filter_values != [] and isinstance(filter_values, list):
-            single_filter_list = [f"{filter_key}={x}" for x in filter_values]
-            join_string = " OR ".join(single_filter_list)
-            filter_string = f"({join_string})"
-        elif (
-            filter_key != ""
-            and filter_values != []
-            and not isinstance(filter_values, dict)
-        ):
-            filter_string = f"({filter_key}={filter_values})"
-        return filter_string
+    def _get_license_project(license_url):
+        # .../projects/{project}/global/licenses/{license}
+        license_path = license_url.split("/")
+        if "projects" in license_path:
+            return license_path[license_path.index("projects") + 1]
+        return ""
@@ -0,0 +1,79 @@
+import logging
+
+from cloudforet.plugin.config.global_conf import (
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_PROJECT_MAX_WORKERS,
+)
+
+__all__ = ["WorkerBudget", "get_max_workers"]
+_LOGGER = logging.getLogger(__name__)
+
+INNER_MAX_WORKERS_OPTIONS = [
+    "prefetch_max_workers",
+    "bucket_max_workers",
+    "instance_group_max_workers",
+]
+
+
+class WorkerBudget:
+    """Thread pool sizes of a collection, derived from one budget of concurrent requests.
+
+    options(dict)
+        - max_concurrent_requests: Google API requests sent at the same time by the
+          collection (default: DEFAULT_MAX_CONCURRENT_REQUESTS)
+        - project_max_workers: projects collected at the same time, if the collection
+          has several projects (default: DEFAULT_PROJECT_MAX_WORKERS)
+        - max_workers: managers running at the same time in each project
+          (default: DEFAULT_MAX_WORKERS)
+        - prefetch_max_workers, bucket_max_workers, instance_group_max_workers: size of
+          the pools run by a manager (optional)
+
+    The outer pools (projects x managers) run the managers, and every manager thread
+    may run one inner pool. An inner pool without its option gets the share of the
+    budget left to each manager thread, at least one worker. The HTTP transport keeps
+    a connection alive for every request the pools can send at the same time.
+    """
+
+    def __init__(self, options):
+        self.options = options
+        self.max_concurrent_requests = get_max_workers(
+            options, "max_concurrent_requests", DEFAULT_MAX_CONCURRENT_REQUESTS
+        )
+        self.max_workers = get_max_workers(options, "max_workers", DEFAULT_MAX_WORKERS)
+        if options.get("organization_id") or options.get("folder_id"):
+            self.project_max_workers = get_max_workers(
+                options, "project_max_workers", DEFAULT_PROJECT_MAX_WORKERS
+            )
+        else:
+            self.project_max_workers = 1
+
+    @property
+    def outer_workers(self):
+        return self.project_max_workers * self.max_workers
+
+    @property
+    def inner_workers(self):
+        return max(self.max_concurrent_requests // self.outer_workers, 1)
+
+    def get_inner_max_workers(self, key):
+        """Size of the inner pool of `key` (e.g. prefetch_max_workers)"""
+        return get_max_workers(self.options, key, self.inner_workers)
+
+    @property
+    def http_pool_maxsize(self):
+        return self.outer_workers * max(
+            self.get_inner_max_workers(key) for key in INNER_MAX_WORKERS_OPTIONS
+        )
+
+
+def get_max_workers(options, key, default):
+    if options.get(key) is None:
+        return default
+
+    try:
+        max_workers = int(options.get(key))
+    except (TypeError, ValueError):
+        _LOGGER.warning(f"[WorkerBudget] invalid {key} option: {options.get(key)}")
+        max_workers = default
+    return max(max_workers, 1)
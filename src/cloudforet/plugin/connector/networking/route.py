@@ -1,6 +1,7 @@
 import logging
 
 from cloudforet.plugin.connector.base import GoogleCloudConnector
+from cloudforet.plugin.connector.cache import cached_resources
 
 __all__ = ["RouteConnector"]
 _LOGGER = logging.getLogger(__name__)
@@ -13,34 +14,18 @@ class RouteConnector(GoogleCloudConnector):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
+    @cached_resources("routes")
     def list_routes(self, **query):
-        route_list = []
         query.update({"project": self.project_id})
-        request = self.client.routes().list(**query)
-        while request is not None:
-            response = request.execute()
-            for template in response.get("items", []):
-                route_list.append(template)
-            request = self.client.routes().list_next(
-                previous_request=request, previous_response=response
-            )
-
-        return route_list
+        return list(self.paginate(self.client.routes(), **query))
 
+    @cached_resources("instances")
     def list_instance(self, **query):
-        instance_list = []
         query.update(
             {"project": self.project_id, "includeAllScopes": False, "maxResults": 500}
         )
-
-        request = self.client.instances().aggregatedList(**query)
-        while request is not None:
-            response = request.execute()
-            for name, instances_scoped_list in response["items"].items():
-                if "instances" in instances_scoped_list:
-                    instance_list.extend(instances_scoped_list.get("instances"))
-            request = self.client.instances().aggregatedList_next(
-                previous_request=request, previous_response=response
+        return list(
+            self.paginate(
+                self.client.instances(), "aggregatedList", "instances", **query
             )
-
-        return instance_list
+        )
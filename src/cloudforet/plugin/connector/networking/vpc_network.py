@@ -1,6 +1,7 @@
 import logging
 
 from cloudforet.plugin.connector.base import GoogleCloudConnector
+from cloudforet.plugin.connector.cache import cached_resources
 
 __all__ = ["VPCNetworkConnector"]
 _LOGGER = logging.getLogger(__name__)
@@ -13,113 +14,60 @@ class VPCNetworkConnector(GoogleCloudConnector):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
+    @cached_resources("instances")
     def list_instance_for_networks(self, **query):
-        instance_list = []
         query.update(
             {"project": self.project_id, "includeAllScopes": False, "maxResults": 500}
         )
-
-        request = self.client.instances().aggregatedList(**query)
-        while request is not None:
-            response = request.execute()
-            for name, instances_scoped_list in response["items"].items():
-                if "instances" in instances_scoped_list:
-                    instance_list.extend(instances_scoped_list.get("instances"))
-            request = self.client.instances().aggregatedList_next(
-                previous_request=request, previous_response=response
+        return list(
+            self.paginate(
+                self.client.instances(), "aggregatedList", "instances", **query
             )
+        )
 
-        return instance_list
-
+    @cached_resources("forwardingRules")
     def list_forwarding_rule(self, **query):
-        forwarding_rule_list = []
         query.update(
             {"project": self.project_id, "includeAllScopes": False, "maxResults": 500}
         )
-
-        request = self.client.forwardingRules().aggregatedList(**query)
-        while request is not None:
-            response = request.execute()
-            for name, forwarding_rules_scoped_list in response["items"].items():
-                if "forwardingRules" in forwarding_rules_scoped_list:
-                    forwarding_rule_list.extend(
-                        forwarding_rules_scoped_list.get("forwardingRules")
-                    )
-            request = self.client.instances().aggregatedList_next(
-                previous_request=request, previous_response=response
+        return list(
+            self.paginate(
+                self.client.forwardingRules(),
+                "aggregatedList",
+                "forwardingRules",
+                **query
             )
+        )
 
-        return forwarding_rule_list
-
+    @cached_resources("networks")
     def list_networks(self, **query):
-        network_list = []
         query.update({"project": self.project_id})
-        request = self.client.networks().list(**query)
-        while request is not None:
-            response = request.execute()
-            for network in response.get("items", []):
-                network_list.append(network)
-            request = self.client.networks().list_next(
-                previous_request=request, previous_response=response
-            )
-
-        return network_list
+        return list(self.paginate(self.client.networks(), **query))
 
+    @cached_resources("addresses")
     def list_regional_addresses(self, **query):
-        address_list = []
         query = self.generate_query(**query)
-        request = self.client.addresses().aggregatedList(**query)
-        while request is not None:
-            response = request.execute()
-            for name, _address_list in response["items"].items():
-                if "addresses" in _address_list:
-                    address_list.extend(_address_list.get("addresses"))
-            request = self.client.addresses().aggregatedList_next(
-                previous_request=request, previous_response=response
+        return list(
+            self.paginate(
+                self.client.addresses(), "aggregatedList", "addresses", **query
             )
+        )
 
-        return address_list
-
+    @cached_resources("subnetworks")
     def list_subnetworks(self, **query):
-        subnetworks_list = []
         query = self.generate_query(**query)
-        request = self.client.subnetworks().aggregatedList(**query)
-        while request is not None:
-            response = request.execute()
-            for name, _subnetworks_list in response["items"].items():
-                if "subnetworks" in _subnetworks_list:
-                    subnetworks_list.extend(_subnetworks_list.get("subnetworks"))
-            request = self.client.addresses().aggregatedList_next(
-                previous_request=request, previous_response=response
+        return list(
+            self.paginate(
+                self.client.subnetworks(), "aggregatedList", "subnetworks", **query
             )
+        )
 
-        return subnetworks_list
-
+    @cached_resources("routes")
     def list_routes(self, **query):
-        route_list = []
         query.update({"project": self.project_id})
-        request = self.client.routes().list(**query)
-
-        while request is not None:
-            response = request.execute()
-            for route in response.get("items", []):
-                route_list.append(route)
-            request = self.client.routes().list_next(
-                previous_request=request, previous_response=response
-            )
-
-        return route_list
+        return list(self.paginate(self.client.routes(), **query))
 
+    @cached_resources("firewalls")
     def list_firewall(self, **query):
-        firewall_list = []
         query.update({"project": self.project_id})
-        request = self.client.firewalls().list(**query)
-        while request is not None:
-            response = request.execute()
-            for fire_wall in response.get("items", []):
-                firewall_list.append(fire_wall)
-            request = self.client.firewalls().list_next(
-                previous_request=request, previous_response=response
-            )
-
-        return firewall_list
+        return list(self.paginate(self.client.firewalls(), **query))
@@ -15,26 +15,33 @@ class SchemaConnector(GoogleCloudConnector):
         super().__init__(**kwargs)
 
     def list_schema_names(self, **query):
-        schema_names = []
         query.update({"parent": self._make_parent()})
-        request = self.client.projects().schemas().list(**query)
-
-        while request is not None:
-            response = request.execute()
-            schema_names = [schema["name"] for schema in response.get("schemas", [])]
-            request = (
-                self.client.projects()
-                .schemas()
-                .list_next(previous_request=request, previous_response=response)
+        return [
+            schema["name"]
+            for schema in self.paginate(
+                self.client.projects().schemas(),
+                items_key="schemas",
+                fields="name",
+                page_size_key="pageSize",
+                **query,
             )
-        return schema_names
+        ]
 
     def get_schema(self, schema_name):
         query = {"name": schema_name}
         schema_service = self.client.projects().schemas()
         request = schema_service.get(**query)
-        response = request.execute()
+        response = self.execute(request)
         return response
 
+    def get_schemas(self, schema_names):
+        schema_service = self.client.projects().schemas()
+        return self.execute_batch(
+            {
+                schema_name: schema_service.get(name=schema_name)
+                for schema_name in schema_names
+            }
+        )
+
     def _make_parent(self):
         return f"projects/{self.project_id}"
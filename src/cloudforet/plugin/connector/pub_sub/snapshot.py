@@ -14,19 +14,15 @@ class SnapshotConnector(GoogleCloudConnector):
         super().__init__(**kwargs)
 
     def list_snapshots(self, **query):
-        snapshots = []
         query.update({"project": self._make_project_fmt()})
-        request = self.client.projects().snapshots().list(**query)
-
-        while request is not None:
-            response = request.execute()
-            snapshots = response.get("snapshots", [])
-            request = (
-                self.client.projects()
-                .snapshots()
-                .list_next(previous_request=request, previous_response=response)
+        return list(
+            self.paginate(
+                self.client.projects().snapshots(),
+                items_key="snapshots",
+                page_size_key="pageSize",
+                **query,
             )
-        return snapshots
+        )
 
     def _make_project_fmt(self):
         return f"projects/{self.project_id}"
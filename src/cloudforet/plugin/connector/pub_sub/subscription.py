@@ -14,19 +14,15 @@ class SubscriptionConnector(GoogleCloudConnector):
         super().__init__(**kwargs)
 
     def list_subscriptions(self, **query):
-        subscriptions = []
         query.update({"project": self._make_project_fmt()})
-        request = self.client.projects().subscriptions().list(**query)
-
-        while request is not None:
-            response = request.execute()
-            subscriptions = response.get("subscriptions", [])
-            request = (
-                self.client.projects()
-                .subscriptions()
-                .list_next(previous_request=request, previous_response=response)
+        return list(
+            self.paginate(
+                self.client.projects().subscriptions(),
+                items_key="subscriptions",
+                page_size_key="pageSize",
+                **query,
             )
-        return subscriptions
+        )
 
     def _make_project_fmt(self):
         return f"projects/{self.project_id}"
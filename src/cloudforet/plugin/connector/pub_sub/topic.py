@@ -14,61 +14,71 @@ class TopicConnector(GoogleCloudConnector):
         super().__init__(**kwargs)
 
     def list_topics(self, **query):
-        topics = []
         query.update({"project": self._make_project_fmt()})
-        request = self.client.projects().topics().list(**query)
-
-        while request is not None:
-            response = request.execute()
-            topics = response.get("topics", [])
-            request = (
-                self.client.projects()
-                .topics()
-                .list_next(previous_request=request, previous_response=response)
+        return list(
+            self.paginate(
+                self.client.projects().topics(),
+                items_key="topics",
+                page_size_key="pageSize",
+                **query,
             )
-        return topics
+        )
 
     def list_snapshot_names(self, topic_name):
-        snapshots = []
         query = {"topic": topic_name}
-        snapshot_service = self.client.projects().topics().snapshots()
-        request = snapshot_service.list(**query)
-
-        while request is not None:
-            response = request.execute()
-            snapshots = response.get("snapshots", [])
-            request = snapshot_service.list_next(
-                previous_request=request, previous_response=response
+        return list(
+            self.paginate(
+                self.client.projects().topics().snapshots(),
+                items_key="snapshots",
+                page_size_key="pageSize",
+                **query,
             )
-        return snapshots
+        )
 
     def list_subscription_names(self, topic_name):
-        subscriptions = []
         query = {"topic": topic_name}
-        subscription_service = self.client.projects().topics().subscriptions()
-        request = subscription_service.list(**query)
-
-        while request is not None:
-            response = request.execute()
-            subscriptions = response.get("subscriptions", [])
-            request = subscription_service.list_next(
-                previous_request=request, previous_response=response
+        return list(
+            self.paginate(
+                self.client.projects().topics().subscriptions(),
+                items_key="subscriptions",
+                page_size_key="pageSize",
+                **query,
             )
-        return subscriptions
+        )
 
     def get_subscription(self, subscription_name):
         query = {"subscription": subscription_name}
         subscription_service = self.client.projects().subscriptions()
         request = subscription_service.get(**query)
-        response = request.execute()
+        response = self.execute(request)
         return response
 
     def get_snapshot(self, snapshot_name):
         query = {"snapshot": snapshot_name}
         snapshot_service = self.client.projects().snapshots()
         request = snapshot_service.get(**query)
-        response = request.execute()
+        response = self.execute(request)
         return response
 
+    def get_subscriptions(self, subscription_names):
+        subscription_service = self.client.projects().subscriptions()
+        return self.execute_batch(
+            {
+                subscription_name: subscription_service.get(
+                    subscription=subscription_name
+                )
+                for subscription_name in subscription_names
+            }
+        )
+
+    def get_snapshots(self, snapshot_names):
+        snapshot_service = self.client.projects().snapshots()
+        return self.execute_batch(
+            {
+                snapshot_name: snapshot_service.get(snapshot=snapshot_name)
+                for snapshot_name in snapshot_names
+            }
+        )
+
     def _make_project_fmt(self):
         return f"projects/{self.project_id}"
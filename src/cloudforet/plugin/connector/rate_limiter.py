@@ -0,0 +1,51 @@
+import threading
+import time
+
+__all__ = ["RateLimiter"]
+
+
+class RateLimiter:
+    """Token bucket of one Google API in one project, shared by every connector and
+    thread of the process that calls the API for the project.
+
+    Google API quotas are per project, so each project of a collection has its own
+    buckets. A bucket is also keyed by its rate, so a collection with its own
+    `api_rate_limits` never changes the rate of another collection.
+    `rate` tokens are added per second, up to `rate` tokens (one second of burst).
+    A caller takes its tokens at once and waits until the bucket is out of debt, so
+    a batch request of N calls waits for N tokens.
+    """
+
+    _lock = threading.Lock()
+    _limiters = {}
+
+    def __init__(self, rate):
+        self.rate = float(rate)
+        self._lock = threading.Lock()
+        self._tokens = self.rate
+        self._updated_at = time.monotonic()
+
+    @classmethod
+    def get(cls, api, project_id, rate):
+        key = (api, project_id, float(rate))
+        with cls._lock:
+            limiter = cls._limiters.get(key)
+            if limiter is None:
+                limiter = cls._limiters[key] = cls(rate)
+            return limiter
+
+    def acquire(self, tokens=1):
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+
+        if wait > 0:
+            time.sleep(wait)
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(
+            self._tokens + (now - self._updated_at) * self.rate, self.rate
+        )
+        self._updated_at = now
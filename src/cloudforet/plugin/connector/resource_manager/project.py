@@ -0,0 +1,58 @@
+import logging
+
+from cloudforet.plugin.connector.base import GoogleCloudConnector
+
+__all__ = ["ProjectConnector"]
+_LOGGER = logging.getLogger(__name__)
+
+
+class ProjectConnector(GoogleCloudConnector):
+    google_client_service = "cloudresourcemanager"
+    version = "v3"
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+    def list_projects(self, parent, **query):
+        query.update({"parent": parent})
+        return list(
+            self.paginate(
+                self.client.projects(),
+                items_key="projects",
+                fields="projectId,state",
+                page_size_key="pageSize",
+                **query,
+            )
+        )
+
+    def list_folders(self, parent, **query):
+        query.update({"parent": parent})
+        return list(
+            self.paginate(
+                self.client.folders(),
+                items_key="folders",
+                fields="name,state",
+                page_size_key="pageSize",
+                **query,
+            )
+        )
+
+    def list_project_ids_in(self, parent):
+        """IDs of the active projects under `parent` (organizations/{id} or folders/{id})
+        and all of its subfolders.
+        """
+        project_ids = []
+        parents = [parent]
+        while parents:
+            parent = parents.pop(0)
+            project_ids.extend(
+                project["projectId"]
+                for project in self.list_projects(parent)
+                if project.get("state") == "ACTIVE"
+            )
+            parents.extend(
+                folder["name"]
+                for folder in self.list_folders(parent)
+                if folder.get("state") == "ACTIVE"
+            )
+        return project_ids
@@ -0,0 +1,65 @@
+__all__ = ["CollectionScope"]
+
+
+class CollectionScope:
+    """Regions, zones and labels that a collection is limited to.
+
+    options(dict)
+        - region_codes: regions to collect (e.g. ["asia-northeast3", "global"])
+        - zones: zones to collect (e.g. ["asia-northeast3-a"])
+        - labels: label selector, {key: value or [values]}, e.g. {"env": ["prod", "stage"]}
+          A resource matches if it has one of the values of every key.
+
+    Connectors push the scope down to the Compute API of the resources they collect:
+    per zone / per region list calls instead of aggregatedList, and `filter` expressions.
+    """
+
+    def __init__(self, options):
+        self.region_codes = set(options.get("region_codes") or [])
+        self.zones = set(options.get("zones") or [])
+        self.labels = options.get("labels") or {}
+
+    def __bool__(self):
+        return bool(self.region_codes or self.zones or self.labels)
+
+    @property
+    def is_regional(self):
+        return bool(self.region_codes or self.zones)
+
+    @property
+    def key(self):
+        return (
+            tuple(sorted(self.region_codes)),
+            tuple(sorted(self.zones)),
+            tuple(sorted((key, str(value)) for key, value in self.labels.items())),
+        )
+
+    @property
+    def label_filters(self):
+        return [
+            {
+                "key": f"labels.{key}",
+                "values": value if isinstance(value, list) else [value],
+            }
+            for key, value in self.labels.items()
+        ]
+
+    def list_zones(self, zones):
+        """Names of `zones` (Zone resources) within the scope"""
+        return [
+            zone["name"]
+            for zone in zones
+            if self.match_zone(zone["name"], zone.get("region", "").split("/")[-1])
+        ]
+
+    def list_regions(self):
+        regions = self.region_codes - {"global"}
+        if self.zones:
+            zone_regions = {zone.rsplit("-", 1)[0] for zone in self.zones}
+            regions = regions & zone_regions if regions else zone_regions
+        return sorted(regions)
+
+    def match_zone(self, zone, region):
+        if self.zones and zone not in self.zones:
+            return False
+        return not self.region_codes or region in self.region_codes
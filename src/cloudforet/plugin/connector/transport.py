@@ -0,0 +1,65 @@
+import google.auth.transport.requests
+import httplib2
+import requests
+import requests.adapters
+
+__all__ = ["AuthorizedSessionHttp"]
+
+
+class AuthorizedSessionHttp:
+    """Thread-safe authorized transport of the discovery clients.
+
+    Adapts an `AuthorizedSession` (requests/urllib3) to the `httplib2.Http` interface
+    used by googleapiclient, so one instance is shared by every client and thread.
+    Connections are kept alive in pools of up to `pool_maxsize` connections per host,
+    for up to `pool_connections` hosts.
+    Discovery clients do not scope the credentials of a custom http, so the
+    credentials must already be scoped (see ClientFactory).
+    """
+
+    def __init__(self, credentials, pool_connections, pool_maxsize, timeout):
+        self.credentials = credentials
+        self.timeout = timeout
+        self.session = google.auth.transport.requests.AuthorizedSession(credentials)
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def request(
+        self,
+        uri,
+        method="GET",
+        body=None,
+        headers=None,
+        redirections=httplib2.DEFAULT_MAX_REDIRECTS,
+        connection_type=None,
+    ):
+        # Errors of requests are raised as the builtin errors retried by the connectors
+        try:
+            response = self.session.request(
+                method,
+                uri,
+                data=body,
+                headers=headers,
+                timeout=self.timeout,
+                allow_redirects=redirections > 0,
+            )
+        except requests.exceptions.Timeout as e:
+            raise TimeoutError(str(e)) from e
+        except requests.exceptions.ConnectionError as e:
+            raise ConnectionError(str(e)) from e
+
+        # The content is already decoded, as httplib2 does
+        info = {key.lower(): value for key, value in response.headers.items()}
+        if "content-encoding" in info:
+            info["-content-encoding"] = info.pop("content-encoding")
+        info["content-length"] = str(len(response.content))
+        info["status"] = str(response.status_code)
+        resp = httplib2.Response(info)
+        resp.reason = response.reason
+        return resp, response.content
+
+    def close(self):
+        self.session.close()
@@ -4,6 +4,10 @@ import time
 from spaceone.inventory.plugin.collector.lib.server import CollectorPluginServer
 
 from cloudforet.plugin.manager import ResourceManager
+from cloudforet.plugin.manager.collector import (
+    ConcurrentCollector,
+    MultiProjectCollector,
+)
 
 app = CollectorPluginServer()
 
@@ -26,24 +30,23 @@ def collector_collect(params: dict) -> dict:
     secret_data = params["secret_data"]
     schema = params.get("schema")
 
+    if task_options := params.get("task_options") or options.get("task_options"):
+        options = _apply_task_options(options, task_options)
+
     if services := options.get("cloud_service_types"):
-        for service in services:
-            resource_mgrs = ResourceManager.get_manager_by_service(service)
-            for resource_mgr in resource_mgrs:
-                results = resource_mgr().collect_resources(options, secret_data, schema)
-                for result in results:
-                    yield result
+        resource_mgrs = ResourceManager.list_managers(services)
+        yield from _create_collector(
+            resource_mgrs, options, secret_data, schema
+        ).collect()
     else:
         start_time = time.time()
         _LOGGER.debug(
             f"[START] Start collecting all cloud resources (project_id: {secret_data.get('project_id')})"
         )
         resource_mgrs = ResourceManager.list_managers()
-        for manager in resource_mgrs:
-            results = manager().collect_resources(options, secret_data, schema)
-
-            for result in results:
-                yield result
+        yield from _create_collector(
+            resource_mgrs, options, secret_data, schema
+        ).collect()
         _LOGGER.debug(
             f"[DONE] All Cloud Resources Collected Time: {time.time() - start_time:.2f}s (project_id: {secret_data.get('project_id')})"
         )
@@ -51,7 +54,59 @@ def collector_collect(params: dict) -> dict:
 
 @app.route("Job.get_tasks")
 def job_get_tasks(params: dict) -> dict:
-    pass
+    options = params.get("options", {})
+    services = options.get("cloud_service_types") or ResourceManager.list_services()
+    region_codes = options.get("region_codes")
+
+    tasks = []
+    for service in services:
+        if not region_codes:
+            tasks.append({"task_options": {"service": service}})
+            continue
+
+        # Only the region scoped cloud service types are split by region, the others
+        # list the whole project once for every region code
+        region_scoped, others = ResourceManager.split_region_scoped(service)
+        for cloud_service_type in region_scoped:
+            for region_code in region_codes:
+                # Region scoped resources are never global
+                if region_code != "global":
+                    tasks.append(
+                        {
+                            "task_options": {
+                                "service": cloud_service_type,
+                                "region_code": region_code,
+                            }
+                        }
+                    )
+        for cloud_service_type in others:
+            tasks.append(
+                {
+                    "task_options": {
+                        "service": cloud_service_type,
+                        "region_codes": region_codes,
+                    }
+                }
+            )
+
+    return {"tasks": tasks}
+
+
+def _apply_task_options(options: dict, task_options: dict) -> dict:
+    options = options.copy()
+    if service := task_options.get("service"):
+        options["cloud_service_types"] = [service]
+    if region_code := task_options.get("region_code"):
+        options["region_codes"] = [region_code]
+    elif region_codes := task_options.get("region_codes"):
+        options["region_codes"] = region_codes
+    return options
+
+
+def _create_collector(resource_mgrs, options, secret_data, schema):
+    if options.get("organization_id") or options.get("folder_id"):
+        return MultiProjectCollector(resource_mgrs, options, secret_data, schema)
+    return ConcurrentCollector(resource_mgrs, options, secret_data, schema)
 
 
 def _create_init_metadata():
@@ -1,39 +1 @@
 from cloudforet.plugin.manager.base import ResourceManager
-
-from cloudforet.plugin.manager.pub_sub.schema import SchemaManager
-
-from cloudforet.plugin.manager.pub_sub.snapshot import SnapshotManager
-from cloudforet.plugin.manager.pub_sub.subscription import SubscriptionManager
-from cloudforet.plugin.manager.pub_sub.topic import TopicManager
-
-from cloudforet.plugin.manager.cloud_functions.function_gen1 import FunctionGen1Manager
-from cloudforet.plugin.manager.cloud_functions.function_gen2 import FunctionGen2Manager
-
-from cloudforet.plugin.manager.cloud_sql.instance import CloudSQLManager
-
-from cloudforet.plugin.manager.cloud_storage.bucket import BucketManager
-
-from cloudforet.plugin.manager.bigquery.sql_workspace import SQLWorkspaceManager
-
-from cloudforet.plugin.manager.networking.vpc_network import VPCNetworkManager
-
-from cloudforet.plugin.manager.networking.route import RouteManager
-from cloudforet.plugin.manager.networking.load_balancing import LoadBalancingManager
-
-from cloudforet.plugin.manager.networking.firewall import FirewallManager
-from cloudforet.plugin.manager.networking.external_ip_address import (
-    ExternalIPAddressManager,
-)
-
-from cloudforet.plugin.manager.compute_engine.disk import DiskManager
-from cloudforet.plugin.manager.compute_engine.instance_group import InstanceGroupManager
-
-from cloudforet.plugin.manager.compute_engine.instance_template import (
-    InstanceTemplateManager,
-)
-
-from cloudforet.plugin.manager.compute_engine.machine_image import MachineImageManager
-
-from cloudforet.plugin.manager.compute_engine.snapshot import SnapshotManager
-
-from cloudforet.plugin.manager.compute_engine.instance import VMInstanceManager
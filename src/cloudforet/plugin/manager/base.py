@@ -1,6 +1,8 @@
 import abc
+import copy
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from spaceone.core.manager import BaseManager
 from spaceone.inventory.plugin.collector.lib import *
 
@@ -8,6 +10,9 @@ from cloudforet.plugin.config.global_conf import (
     CLOUD_LOGGING_RESOURCE_TYPE_MAP,
     REGION_INFO,
 )
+from cloudforet.plugin.connector.concurrency import WorkerBudget
+from cloudforet.plugin.manager.context import CollectionContext
+from cloudforet.plugin.manager.registry import ManagerRegistry
 
 _LOGGER = logging.getLogger("spaceone")
 
@@ -16,7 +21,6 @@ __all__ = ["ResourceManager"]
 
 class ResourceManager(BaseManager):
     service = None
-    collected_region_codes = []
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -24,19 +28,27 @@ class ResourceManager(BaseManager):
         self.provider = "google_cloud"
         self.cloud_service_group = ""
         self.cloud_service_type = ""
+        self.context = kwargs.get("context") or CollectionContext()
+        self.cache = self.context.cache
 
     def __repr__(self):
         return f"{self.__class__.__name__}({self.cloud_service_group}, {self.cloud_service_type})"
 
     @classmethod
-    def list_managers(cls):
-        return cls.__subclasses__()
+    def list_managers(cls, cloud_service_types=None):
+        return ManagerRegistry.list_managers(cloud_service_types)
+
+    @classmethod
+    def list_services(cls):
+        return ManagerRegistry.list_services()
+
+    @classmethod
+    def split_region_scoped(cls, cloud_service_type):
+        return ManagerRegistry.split_region_scoped(cloud_service_type)
 
     @classmethod
     def get_manager_by_service(cls, service):
-        for manager in cls.list_managers():
-            if manager.service == service:
-                yield manager
+        yield from ManagerRegistry.list_managers([service])
 
     def collect_resources(self, options, secret_data, schema):
         project_id = secret_data.get("project_id")
@@ -48,14 +60,12 @@ class ResourceManager(BaseManager):
         try:
             yield from self.collect_cloud_service_type()
 
-            cloud_services, total_count = self.collect_cloud_service(
-                options, secret_data, schema
-            )
-            for cloud_service in cloud_services:
-                yield cloud_service
-            success_count, error_count = total_count
-
-            yield from self.collect_region()
+            for response in self.collect_cloud_service(options, secret_data, schema):
+                if response.get("state") == "FAILURE":
+                    error_count += 1
+                else:
+                    success_count += 1
+                yield response
 
         except Exception as e:
             yield make_error_response(
@@ -78,36 +88,73 @@ class ResourceManager(BaseManager):
         )
 
     def collect_cloud_service(self, options, secret_data, schema):
-        total_resources = []
-        cloud_services, error_resources = self.create_cloud_service(
-            options, secret_data, schema
+        region_codes = options.get("region_codes")
+        for resource in self.create_cloud_service(options, secret_data, schema):
+            if resource.get("state") == "FAILURE":
+                yield resource
+                continue
+
+            if region_codes and resource.get("region_code") not in region_codes:
+                continue
+
+            yield make_response(
+                cloud_service=resource,
+                match_keys=[
+                    [
+                        "reference.resource_id",
+                        "provider",
+                        "cloud_service_type",
+                        "cloud_service_group",
+                    ]
+                ],
+            )
+
+    def prefetch(self, options, collections, required=(), defaults=None):
+        """Fetches independent collections concurrently and returns once all of them are fetched.
+
+        - collections: {name: function returning the collection}
+        - required: names of the collections the manager cannot do without.
+          If one of them failed, its error is raised.
+        - defaults: {name: value} of the other collections if they failed (default: [])
+
+        Up to `options.prefetch_max_workers` (default: share of the WorkerBudget)
+        collections are fetched at the same time.
+        Returns ({name: collection}, error responses of the failed collections), the
+        manager yields the error responses so that missing data is reported.
+        """
+        defaults = defaults or {}
+        max_workers = WorkerBudget(options).get_inner_max_workers(
+            "prefetch_max_workers"
         )
-        for cloud_service in cloud_services:
-            total_resources.append(
-                make_response(
-                    cloud_service=cloud_service,
-                    match_keys=[
-                        [
-                            "reference.resource_id",
-                            "provider",
-                            "cloud_service_type",
-                            "cloud_service_group",
-                        ]
-                    ],
+        with ThreadPoolExecutor(
+            max_workers=max(min(max_workers, len(collections)), 1),
+            thread_name_prefix="prefetch",
+        ) as executor:
+            futures = {
+                name: executor.submit(fetch) for name, fetch in collections.items()
+            }
+
+        results = {}
+        errors = []
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                if name in required:
+                    raise
+                _LOGGER.error(
+                    f"[prefetch] {self.__repr__()} failed to fetch {name}: {e}"
                 )
-            )
-        total_resources.extend(error_resources)
-        total_count = [len(cloud_services), len(error_resources)]
-        return total_resources, total_count
-
-    def collect_region(self):
-        for region_code in self.collected_region_codes:
-            if region := self.match_region_info(region_code):
-                yield make_response(
-                    region=region,
-                    match_keys=[["region_code", "provider"]],
-                    resource_type="inventory.Region",
+                results[name] = copy.copy(defaults.get(name, []))
+                errors.append(
+                    make_error_response(
+                        error=e,
+                        provider=self.provider,
+                        cloud_service_group=self.cloud_service_group,
+                        cloud_service_type=self.cloud_service_type,
+                    )
                 )
+        return results, errors
 
     @staticmethod
     def set_google_cloud_monitoring(project_id, metric_type, resource_id, filters):
@@ -150,11 +197,7 @@ class ResourceManager(BaseManager):
         return None
 
     def set_region_code(self, region):
-        if region not in REGION_INFO:
-            region = "global"
-
-        if region not in self.collected_region_codes:
-            self.collected_region_codes.append(region)
+        self.context.add_region_code(region)
 
     @staticmethod
     def convert_labels_format(labels):
@@ -171,4 +214,5 @@ class ResourceManager(BaseManager):
 
     @abc.abstractmethod
     def create_cloud_service(self, options, secret_data, schema):
+        """Yields cloud services made by make_cloud_service, and make_error_response for failed ones"""
         raise NotImplementedError("method `create_cloud_service` should be implemented")
@@ -35,16 +35,27 @@ class SQLWorkspaceManager(ResourceManager):
     def create_cloud_service(self, options, secret_data, schema):
         project_id = secret_data["project_id"]
         big_query_conn = SQLWorkspaceConnector(
-            options=options, secret_data=secret_data, schema=schema
+            options=options,
+            secret_data=secret_data,
+            schema=schema,
+            cache=self.cache,
         )
-        cloud_services = []
-        error_responses = []
-        for data_set in big_query_conn.list_dataset():
+        data_sets = big_query_conn.list_dataset(fields="datasetReference")
+        bq_datasets = big_query_conn.get_datasets(
+            [
+                data_set.get("datasetReference", {}).get("datasetId", "")
+                for data_set in data_sets
+            ]
+        )
+        for data_set in data_sets:
             try:
                 updated_bq_tables = []
                 data_refer = data_set.get("datasetReference", {})
                 data_set_id = data_refer.get("datasetId", "")
-                bq_dataset = big_query_conn.get_dataset(data_set_id)
+                bq_dataset = bq_datasets[data_set_id]
+                if isinstance(bq_dataset, Exception):
+                    raise bq_dataset
+
                 creation_time = bq_dataset.get("creationTime", "")
                 last_modified_time = bq_dataset.get("lastModifiedTime")
                 region = self._get_region(bq_dataset.get("location", ""))
@@ -87,34 +98,29 @@ class SQLWorkspaceManager(ResourceManager):
                 )
 
                 self.set_region_code(region)
-                cloud_services.append(
-                    make_cloud_service(
-                        name=data_set_id,
-                        cloud_service_type=self.cloud_service_type,
-                        cloud_service_group=self.cloud_service_group,
-                        provider=self.provider,
-                        account=project_id,
-                        data=bq_dataset,
-                        region_code=region,
-                        reference={
-                            "resource_id": data_set_id,
-                            "external_link": f"https://console.cloud.google.com/bigquery?project={project_id}&p={project_id}&page=dataset&d={data_set_id}",
-                        },
-                    )
+                yield make_cloud_service(
+                    name=data_set_id,
+                    cloud_service_type=self.cloud_service_type,
+                    cloud_service_group=self.cloud_service_group,
+                    provider=self.provider,
+                    account=project_id,
+                    data=bq_dataset,
+                    region_code=region,
+                    reference={
+                        "resource_id": data_set_id,
+                        "external_link": f"https://console.cloud.google.com/bigquery?project={project_id}&p={project_id}&page=dataset&d={data_set_id}",
+                    },
                 )
             except Exception as e:
                 _LOGGER.error(
                     f"[create_cloud_service] Error on BigQuery Workspace {data_set.get('datasetId')}: {e}"
                 )
-                error_responses.append(
-                    make_error_response(
-                        error=e,
-                        provider=self.provider,
-                        cloud_service_group=self.cloud_service_group,
-                        cloud_service_type=self.cloud_service_type,
-                    )
+                yield make_error_response(
+                    error=e,
+                    provider=self.provider,
+                    cloud_service_group=self.cloud_service_group,
+                    cloud_service_type=self.cloud_service_type,
                 )
-        return cloud_services, error_responses
 
     def _get_region(self, location):
         matched_info = self.match_region_info(location)
@@ -40,11 +40,12 @@ class FunctionGen1Manager(ResourceManager):
     def create_cloud_service(self, options, secret_data, schema):
         project_id = secret_data["project_id"]
         function_conn = FunctionGen1Connector(
-            options=options, secret_data=secret_data, schema=schema
+            options=options,
+            secret_data=secret_data,
+            schema=schema,
+            cache=self.cache,
         )
 
-        cloud_services = []
-        error_responses = []
         for function in function_conn.list_functions():
             try:
                 function_name = function.get("name")
@@ -112,36 +113,31 @@ class FunctionGen1Manager(ResourceManager):
                     }
                 )
 
-                cloud_services.append(
-                    make_cloud_service(
-                        name=function_name,
-                        cloud_service_type=self.cloud_service_type,
-                        cloud_service_group=self.cloud_service_group,
-                        provider=self.provider,
-                        account=project_id,
-                        data=function,
-                        region_code=location,
-                        instance_type="",
-                        instance_size=0,
-                        reference={
-                            "resource_id": function_name,
-                            "external_link": f"https://console.cloud.google.com/functions/details/{location}/{function_id}?env=gen1&project={project_id}",
-                        },
-                        tags=labels,
-                    )
+                yield make_cloud_service(
+                    name=function_name,
+                    cloud_service_type=self.cloud_service_type,
+                    cloud_service_group=self.cloud_service_group,
+                    provider=self.provider,
+                    account=project_id,
+                    data=function,
+                    region_code=location,
+                    instance_type="",
+                    instance_size=0,
+                    reference={
+                        "resource_id": function_name,
+                        "external_link": f"https://console.cloud.google.com/functions/details/{location}/{function_id}?env=gen1&project={project_id}",
+                    },
+                    tags=labels,
                 )
             except Exception as e:
                 _LOGGER.error(f"Error on Function {function.get('name')}: {e}")
 
-                error_responses.append(
-                    make_error_response(
-                        error=e,
-                        provider=self.provider,
-                        cloud_service_group=self.cloud_service_group,
-                        cloud_service_type=self.cloud_service_type,
-                    )
+                yield make_error_response(
+                    error=e,
+                    provider=self.provider,
+                    cloud_service_group=self.cloud_service_group,
+                    cloud_service_type=self.cloud_service_type,
                 )
-        return cloud_services, error_responses
 
     @staticmethod
     def _make_location_and_id(function_name, project_id):
@@ -41,7 +41,10 @@ class FunctionGen2Manager(ResourceManager):
     def create_cloud_service(self, options, secret_data, schema):
         project_id = secret_data["project_id"]
         function_conn = FunctionGen2Connector(
-            options=options, secret_data=secret_data, schema=schema
+            options=options,
+            secret_data=secret_data,
+            schema=schema,
+            cache=self.cache,
         )
         trigger_provider_map = self._create_trigger_provider_map(
             options, secret_data, schema
@@ -53,8 +56,6 @@ class FunctionGen2Manager(ResourceManager):
             if function.get("environment") == "GEN_2"
         ]
 
-        cloud_services = []
-        error_responses = []
         for function in functions:
             try:
                 function_name = function.get("name")
@@ -148,43 +149,37 @@ class FunctionGen2Manager(ResourceManager):
                     }
                 )
 
-                cloud_services.append(
-                    make_cloud_service(
-                        name=function_name,
-                        cloud_service_type=self.cloud_service_type,
-                        cloud_service_group=self.cloud_service_group,
-                        provider=self.provider,
-                        account=project_id,
-                        data=function,
-                        region_code=location,
-                        instance_type="",
-                        instance_size=0,
-                        reference={
-                            "resource_id": function_name,
-                            "external_link": f"https://console.cloud.google.com/functions/details/{location}/{function_id}?env=gen2&project={project_id}",
-                        },
-                        tags=labels,
-                    )
+                yield make_cloud_service(
+                    name=function_name,
+                    cloud_service_type=self.cloud_service_type,
+                    cloud_service_group=self.cloud_service_group,
+                    provider=self.provider,
+                    account=project_id,
+                    data=function,
+                    region_code=location,
+                    instance_type="",
+                    instance_size=0,
+                    reference={
+                        "resource_id": function_name,
+                        "external_link": f"https://console.cloud.google.com/functions/details/{location}/{function_id}?env=gen2&project={project_id}",
+                    },
+                    tags=labels,
                 )
             except Exception as e:
                 _LOGGER.error(
                     f"Error on Gen2 Cloud Functions {function.get('name')}: {e}"
                 )
 
-                error_responses.append(
-                    make_error_response(
-                        error=e,
-                        provider=self.provider,
-                        cloud_service_group=self.cloud_service_group,
-                        cloud_service_type=self.cloud_service_type,
-                    )
+                yield make_error_response(
+                    error=e,
+                    provider=self.provider,
+                    cloud_service_group=self.cloud_service_group,
+                    cloud_service_type=self.cloud_service_type,
                 )
-        return cloud_services, error_responses
 
-    @staticmethod
-    def _list_providers_from_eventarc(options, secret_data, schema):
+    def _list_providers_from_eventarc(self, options, secret_data, schema):
         eventarc_conn = EventarcConnector(
-            options=options, secret_data=secret_data, schema=schema
+            options=options, secret_data=secret_data, schema=schema, cache=self.cache
         )
 
         providers = eventarc_conn.list_providers()
@@ -34,11 +34,12 @@ class CloudSQLManager(ResourceManager):
     def create_cloud_service(self, options, secret_data, schema):
         project_id = secret_data["project_id"]
         cloud_sql_conn = CloudSQLInstanceConnector(
-            options=options, secret_data=secret_data, schema=schema
+            options=options,
+            secret_data=secret_data,
+            schema=schema,
+            cache=self.cache,
         )
 
-        cloud_services = []
-        error_responses = []
         for instance in cloud_sql_conn.list_instances():
             try:
                 instance_name = instance["name"]
@@ -81,20 +82,18 @@ class CloudSQLManager(ResourceManager):
 
                 self.set_region_code(region)
 
-                cloud_services.append(
-                    make_cloud_service(
-                        name=instance_name,
-                        cloud_service_type=self.cloud_service_type,
-                        cloud_service_group=self.cloud_service_group,
-                        provider=self.provider,
-                        account=project_id,
-                        data=instance,
-                        region_code=region,
-                        reference={
-                            "resource_id": instance_name,
-                            "external_link": f"https://console.cloud.google.com/sql/instances/{instance_name}/overview?authuser=1&project={project_id}",
-                        },
-                    )
+                yield make_cloud_service(
+                    name=instance_name,
+                    cloud_service_type=self.cloud_service_type,
+                    cloud_service_group=self.cloud_service_group,
+                    provider=self.provider,
+                    account=project_id,
+                    data=instance,
+                    region_code=region,
+                    reference={
+                        "resource_id": instance_name,
+                        "external_link": f"https://console.cloud.google.com/sql/instances/{instance_name}/overview?authuser=1&project={project_id}",
+                    },
                 )
 
             except Exception as e:
@@ -102,17 +101,13 @@ class CloudSQLManager(ResourceManager):
                     f"Error on Instance of Cloud SQL {instance.get('name')}: {e}"
                 )
 
-                error_responses.append(
-                    make_error_response(
-                        error=e,
-                        provider=self.provider,
-                        cloud_service_group=self.cloud_service_group,
-                        cloud_service_type=self.cloud_service_type,
-                    )
+                yield make_error_response(
+                    error=e,
+                    provider=self.provider,
+                    cloud_service_group=self.cloud_service_group,
+                    cloud_service_type=self.cloud_service_type,
                 )
 
-        return cloud_services, error_responses
-
     def _check_sql_instance_is_available(self, instance):
         power_state = self._get_display_state(instance)
         create_state = instance.get("state", "")
@@ -1,4 +1,5 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from spaceone.inventory.plugin.collector.lib import *
 
@@ -7,6 +8,7 @@ from cloudforet.plugin.connector.cloud_storage import (
     MonitoringConnector,
     StorageConnector,
 )
+from cloudforet.plugin.connector.concurrency import WorkerBudget
 from cloudforet.plugin.manager import ResourceManager
 
 _LOGGER = logging.getLogger("spaceone")
@@ -44,25 +46,53 @@ class BucketManager(ResourceManager):
             options=options,
             secret_data=secret_data,
             schema=schema,
+            cache=self.cache,
         )
         monitoring_conn = MonitoringConnector(
             options=options,
             secret_data=secret_data,
             schema=schema,
+            cache=self.cache,
         )
 
-        cloud_services = []
-        error_responses = []
-        for bucket in storage_conn.list_buckets():
+        object_counts = self._list_bucket_metric_values(
+            monitoring_conn, "storage.googleapis.com/storage/object_count"
+        )
+        object_sizes = self._list_bucket_metric_values(
+            monitoring_conn, "storage.googleapis.com/storage/total_bytes"
+        )
+
+        buckets = storage_conn.list_buckets()
+        executor = ThreadPoolExecutor(
+            max_workers=WorkerBudget(options).get_inner_max_workers(
+                "bucket_max_workers"
+            ),
+            thread_name_prefix="bucket",
+        )
+        try:
+            # IAM policies are fetched ahead by the workers, in the order of buckets
+            iam_policies = executor.map(
+                lambda bucket: self._list_iam_policy(storage_conn, bucket), buckets
+            )
+            yield from self._collect_buckets(
+                project_id, buckets, iam_policies, object_counts, object_sizes
+            )
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _collect_buckets(
+        self, project_id, buckets, iam_policies, object_counts, object_sizes
+    ):
+        for bucket, iam_policy in zip(buckets, iam_policies):
             try:
+                if isinstance(iam_policy, Exception):
+                    raise iam_policy
+
                 bucket_name = bucket.get("name", "")
                 bucket_id = bucket.get("id")
 
-                object_count = self._get_object_total_count(
-                    monitoring_conn, bucket_name
-                )
-                object_size = self._get_bucket_total_size(monitoring_conn, bucket_name)
-                iam_policy = storage_conn.list_iam_policy(bucket_name)
+                object_count = self._get_object_total_count(object_counts, bucket_name)
+                object_size = self._get_bucket_total_size(object_sizes, bucket_name)
                 st_class = bucket.get("storageClass").lower()
                 region = self.get_matching_region(bucket)
                 labels = self.convert_labels_format(bucket.get("labels", {}))
@@ -102,62 +132,60 @@ class BucketManager(ResourceManager):
                 )
                 region_code = region.get("region_code")
                 self.set_region_code(region_code)
-                cloud_services.append(
-                    make_cloud_service(
-                        name=bucket_name,
-                        cloud_service_type=self.cloud_service_type,
-                        cloud_service_group=self.cloud_service_group,
-                        provider=self.provider,
-                        account=project_id,
-                        instance_type="",
-                        instance_size=bucket.get("size"),
-                        data=bucket,
-                        region_code=region_code,
-                        reference={
-                            "resource_id": bucket_id,
-                            "external_link": f"https://console.cloud.google.com/storage/browser/{bucket_name}",
-                        },
-                    )
+                yield make_cloud_service(
+                    name=bucket_name,
+                    cloud_service_type=self.cloud_service_type,
+                    cloud_service_group=self.cloud_service_group,
+                    provider=self.provider,
+                    account=project_id,
+                    instance_type="",
+                    instance_size=bucket.get("size"),
+                    data=bucket,
+                    region_code=region_code,
+                    reference={
+                        "resource_id": bucket_id,
+                        "external_link": f"https://console.cloud.google.com/storage/browser/{bucket_name}",
+                    },
                 )
             except Exception as e:
                 _LOGGER.error(f"Error on Bucket {bucket.get('name')}: {e}")
-                error_responses.append(
-                    make_error_response(
-                        error=e,
-                        provider=self.provider,
-                        cloud_service_group=self.cloud_service_group,
-                        cloud_service_type=self.cloud_service_type,
-                    )
+                yield make_error_response(
+                    error=e,
+                    provider=self.provider,
+                    cloud_service_group=self.cloud_service_group,
+                    cloud_service_type=self.cloud_service_type,
                 )
-        return cloud_services, error_responses
 
     @staticmethod
-    def _get_object_total_count(monitoring_conn, bucket_name):
-        metric = "storage.googleapis.com/storage/object_count"
-        start = datetime.now() - timedelta(days=1)
+    def _list_iam_policy(storage_conn, bucket):
+        try:
+            return storage_conn.list_iam_policy(bucket.get("name", ""))
+        except Exception as e:
+            return e
+
+    @staticmethod
+    def _list_bucket_metric_values(monitoring_conn, metric):
         end = datetime.now()
-        response = monitoring_conn.get_metric_data(bucket_name, metric, start, end)
+        start = end - timedelta(days=1)
+        try:
+            return monitoring_conn.list_bucket_metric_values(metric, start, end)
+        except Exception as e:
+            _LOGGER.error(f"[_list_bucket_metric_values] Error on metric {metric}: {e}")
+            return {}
 
-        if response.get("points", []):
-            object_total_count = (
-                response.get("points", [])[0].get("value", {}).get("int64Value", "")
-            )
+    @staticmethod
+    def _get_object_total_count(object_counts, bucket_name):
+        if bucket_name in object_counts:
+            object_total_count = object_counts[bucket_name].get("int64Value", "")
         else:
             object_total_count = None
 
         return object_total_count
 
     @staticmethod
-    def _get_bucket_total_size(monitoring_conn, bucket_name):
-        metric = "storage.googleapis.com/storage/total_bytes"
-        start = datetime.now() - timedelta(days=1)
-        end = datetime.now()
-        response = monitoring_conn.get_metric_data(bucket_name, metric, start, end)
-
-        if response.get("points", []):
-            object_total_size = (
-                response.get("points", [])[0].get("value", {}).get("doubleValue", "")
-            )
+    def _get_bucket_total_size(object_sizes, bucket_name):
+        if bucket_name in object_sizes:
+            object_total_size = object_sizes[bucket_name].get("doubleValue", "")
         else:
             object_total_size = None
 
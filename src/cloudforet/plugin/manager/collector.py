@@ -0,0 +1,218 @@
+import functools
+import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from spaceone.inventory.plugin.collector.lib import *
+
+from cloudforet.plugin.config.global_conf import (
+    REGION_INFO,
+    RESPONSE_QUEUE_SIZE_PER_WORKER,
+)
+from cloudforet.plugin.connector.concurrency import WorkerBudget
+from cloudforet.plugin.manager.context import CollectionContext
+
+_LOGGER = logging.getLogger("spaceone")
+
+__all__ = ["ConcurrentCollector", "MultiProjectCollector"]
+
+_STREAM_DONE = object()
+
+
+class ConcurrentCollector:
+    """Runs `collect_resources` of several resource managers at once.
+
+    Responses are merged into a single stream as soon as any manager yields them.
+    Ordering guarantees:
+        - Responses of one manager keep the order that manager yields them in
+          (CloudServiceType -> CloudService/ErrorResource -> Region).
+        - Responses of different managers are interleaved in no particular order.
+        - Region responses come last, once per collected region.
+
+    The number of managers running at the same time is limited by
+    `options["max_workers"]` (default: DEFAULT_MAX_WORKERS). `max_workers: 1` keeps the
+    previous sequential behaviour.
+
+    Every manager shares one CollectionContext, so a Google API collection listed by
+    several managers is fetched once per collection and every region is reported once.
+    """
+
+    def __init__(self, managers, options, secret_data, schema, context=None):
+        self.managers = list(managers)
+        self.options = options
+        self.secret_data = secret_data
+        self.schema = schema
+        self.max_workers = WorkerBudget(options).max_workers
+        self.context = context or CollectionContext()
+
+    def collect(self):
+        yield from self.collect_managers()
+        yield from _collect_regions(self.context, self.options)
+
+    def collect_managers(self):
+        yield from _merge_streams(
+            [
+                functools.partial(self._collect_manager, manager)
+                for manager in self.managers
+            ],
+            self.max_workers,
+            "collector",
+        )
+
+    def _collect_manager(self, manager):
+        try:
+            yield from manager(context=self.context).collect_resources(
+                self.options, self.secret_data, self.schema
+            )
+        except Exception as e:
+            yield make_error_response(
+                error=e,
+                provider="google_cloud",
+                cloud_service_group=manager.service,
+                cloud_service_type=manager.__name__,
+            )
+
+
+class MultiProjectCollector:
+    """Collects every active project of an organization or a folder (and its subfolders).
+
+    options(dict)
+        - organization_id / folder_id: parent of the collected projects
+        - project_max_workers: number of projects collected at the same time
+          (default: DEFAULT_PROJECT_MAX_WORKERS)
+        - max_workers: number of managers running at the same time in each project
+
+    Each project is collected by a ConcurrentCollector with its own context, and
+    `secret_data` with the project as project_id, so the service account must have
+    access to every project. The projects share the clients, the catalog collections
+    of the cache (e.g. public images, Eventarc providers) and the region codes, which
+    are reported once at the end.
+    A failed project only yields error responses; the other projects are collected.
+    """
+
+    def __init__(self, managers, options, secret_data, schema):
+        self.managers = list(managers)
+        self.options = options
+        self.secret_data = secret_data
+        self.schema = schema
+        self.max_workers = WorkerBudget(options).project_max_workers
+        self.context = CollectionContext()
+
+    def collect(self):
+        try:
+            project_ids = self.list_project_ids()
+        except Exception as e:
+            yield make_error_response(
+                error=e,
+                provider="google_cloud",
+                cloud_service_group="ResourceManager",
+                cloud_service_type="Project",
+            )
+            return
+
+        _LOGGER.debug(f"[MultiProjectCollector] collect {len(project_ids)} projects")
+        yield from _merge_streams(
+            [
+                functools.partial(self._collect_project, project_id)
+                for project_id in project_ids
+            ],
+            self.max_workers,
+            "project",
+        )
+        yield from _collect_regions(self.context, self.options)
+
+    def list_project_ids(self):
+        # Imported here so that no connector is imported until a collection starts
+        from cloudforet.plugin.connector.resource_manager.project import (
+            ProjectConnector,
+        )
+
+        if organization_id := self.options.get("organization_id"):
+            parent = f"organizations/{organization_id}"
+        else:
+            parent = f"folders/{self.options['folder_id']}"
+
+        project_conn = ProjectConnector(
+            options=self.options, secret_data=self.secret_data, schema=self.schema
+        )
+        return project_conn.list_project_ids_in(parent)
+
+    def _collect_project(self, project_id):
+        secret_data = self.secret_data.copy()
+        secret_data["project_id"] = project_id
+        yield from ConcurrentCollector(
+            self.managers,
+            self.options,
+            secret_data,
+            self.schema,
+            context=self.context.create_project_context(),
+        ).collect_managers()
+
+
+def _merge_streams(streams, max_workers, thread_name_prefix):
+    """Yields the responses of `streams` (functions returning an iterable of responses)
+    run by up to `max_workers` threads, as soon as any stream yields them.
+
+    Streams must handle their own errors.
+    """
+    if max_workers == 1 or len(streams) <= 1:
+        for stream in streams:
+            yield from stream()
+        return
+
+    max_workers = min(max_workers, len(streams))
+    responses = queue.Queue(maxsize=max_workers * RESPONSE_QUEUE_SIZE_PER_WORKER)
+    stopped = threading.Event()
+    executor = ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix=thread_name_prefix
+    )
+
+    try:
+        for stream in streams:
+            executor.submit(_run_stream, stream, responses, stopped)
+
+        remaining = len(streams)
+        while remaining > 0:
+            response = responses.get()
+            if response is _STREAM_DONE:
+                remaining -= 1
+            else:
+                yield response
+    finally:
+        # The stream can be closed before every stream is done (e.g. the client cancelled)
+        stopped.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _run_stream(stream, responses, stopped):
+    try:
+        for response in stream():
+            if not _put(responses, response, stopped):
+                return
+    finally:
+        _put(responses, _STREAM_DONE, stopped)
+
+
+def _put(responses, response, stopped):
+    while not stopped.is_set():
+        try:
+            responses.put(response, timeout=1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _collect_regions(context, options):
+    region_codes = options.get("region_codes")
+    for region_code in context.list_region_codes():
+        if region_codes and region_code not in region_codes:
+            continue
+
+        region = REGION_INFO[region_code].copy()
+        region.update({"region_code": region_code, "provider": "google_cloud"})
+        yield make_response(
+            region=region,
+            match_keys=[["region_code", "provider"]],
+            resource_type="inventory.Region",
+        )
@@ -36,18 +36,20 @@ class DiskManager(ResourceManager):
     def create_cloud_service(self, options, secret_data, schema):
         project_id = secret_data["project_id"]
         disk_conn = DiskConnector(
-            options=options, secret_data=secret_data, schema=schema
+            options=options,
+            secret_data=secret_data,
+            schema=schema,
+            cache=self.cache,
         )
 
         disks = disk_conn.list_disks()
         resource_policies = disk_conn.list_resource_policies()
         disk_id = ""
 
-        cloud_services = []
-        error_responses = []
         for disk in disks:
             try:
                 disk_id = disk.get("id")
+                disk = disk.copy()
                 disk_type = self.get_param_in_url(disk.get("type", ""), "diskTypes")
                 disk_size = float(disk.get("sizeGb", 0.0))
                 zone = self.get_param_in_url(disk.get("zone", ""), "zones")
@@ -104,34 +106,29 @@ class DiskManager(ResourceManager):
                 )
 
                 self.set_region_code(region)
-                cloud_services.append(
-                    make_cloud_service(
-                        name=disk.get("name", ""),
-                        cloud_service_type=self.cloud_service_type,
-                        cloud_service_group=self.cloud_service_group,
-                        provider=self.provider,
-                        account=project_id,
-                        data=disk,
-                        region_code=disk.get("region"),
-                        reference={
-                            "resource_id": disk.get("selfLink", ""),
-                            "external_link": f"https://console.cloud.google.com/networking/routes/details/{disk.get('name', '')}?project={project_id}",
-                        },
-                    )
+                yield make_cloud_service(
+                    name=disk.get("name", ""),
+                    cloud_service_type=self.cloud_service_type,
+                    cloud_service_group=self.cloud_service_group,
+                    provider=self.provider,
+                    account=project_id,
+                    data=disk,
+                    region_code=disk.get("region"),
+                    reference={
+                        "resource_id": disk.get("selfLink", ""),
+                        "external_link": f"https://console.cloud.google.com/networking/routes/details/{disk.get('name', '')}?project={project_id}",
+                    },
                 )
 
             except Exception as e:
                 _LOGGER.error(f"Error on Disk {disk_id}: {e}")
 
-                error_responses.append(
-                    make_error_response(
-                        error=e,
-                        provider=self.provider,
-                        cloud_service_group=self.cloud_service_group,
-                        cloud_service_type=self.cloud_service_type,
-                    )
+                yield make_error_response(
+                    error=e,
+                    provider=self.provider,
+                    cloud_service_group=self.cloud_service_group,
+                    cloud_service_type=self.cloud_service_type,
                 )
-        return cloud_services, error_responses
 
     def _get_iops_rate(self, disk_type, disk_size, flag):
         const = self._get_iops_constant(disk_type, flag)
@@ -4,6 +4,9 @@ from urllib.parse import urlparse
 from spaceone.inventory.plugin.collector.lib import *
 
 from cloudforet.plugin.config.global_conf import ASSET_URL
+from cloudforet.plugin.connector.compute_engine.instance_group import (
+    InstanceGroupConnector,
+)
 from cloudforet.plugin.connector.compute_engine.vm_instance import VMInstanceConnector
 from cloudforet.plugin.manager import ResourceManager
 from cloudforet.plugin.manager.compute_engine.vm_instance_helper.disk_helper import (
@@ -21,6 +24,9 @@ from cloudforet.plugin.manager.compute_engine.vm_instance_helper.load_balancer_h
 from cloudforet.plugin.manager.compute_engine.vm_instance_helper.nic_helper import (
     NICHelper,
 )
+from cloudforet.plugin.manager.compute_engine.vm_instance_helper.resource_index import (
+    VMInstanceResourceIndex,
+)
 from cloudforet.plugin.manager.compute_engine.vm_instance_helper.vm_instance_helper import (
     VMInstanceHelper,
 )
@@ -41,6 +47,7 @@ class VMInstanceManager(ResourceManager):
         self.cloud_service_type = "Instance"
         self.metadata_path = "plugin/metadata/compute_engine/vm_instance.yaml"
         self.instance_conn = None
+        self.instance_group_conn = None
 
     def create_cloud_service_type(self):
         return make_cloud_service_type(
@@ -59,14 +66,23 @@ class VMInstanceManager(ResourceManager):
         project_id = secret_data["project_id"]
         vm_id = ""
         self.instance_conn = VMInstanceConnector(
-            options=options, secret_data=secret_data, schema=schema
+            options=options,
+            secret_data=secret_data,
+            schema=schema,
+            cache=self.cache,
+        )
+        self.instance_group_conn = InstanceGroupConnector(
+            options=options,
+            secret_data=secret_data,
+            schema=schema,
+            cache=self.cache,
         )
 
-        all_resources = self.get_all_resources(project_id)
         compute_vms = self.instance_conn.list_instances()
+        all_resources, errors = self.get_all_resources(options, project_id, compute_vms)
+        yield from errors
+        resource_index = VMInstanceResourceIndex(all_resources)
 
-        cloud_services = []
-        error_responses = []
         for compute_vm in compute_vms:
             try:
                 vm_id = compute_vm.get("id")
@@ -74,7 +90,7 @@ class VMInstanceManager(ResourceManager):
                 zone_info = {"zone": zone, "region": region, "projectId": project_id}
 
                 resource = self.get_vm_instance_resource(
-                    project_id, zone_info, compute_vm, all_resources
+                    project_id, zone_info, compute_vm, resource_index
                 )
                 path, instance_type = compute_vm.get("machineType").split(
                     "machineTypes/"
@@ -83,58 +99,101 @@ class VMInstanceManager(ResourceManager):
                 labels = resource.get("googleCloud").get("labels", [])
 
                 self.set_region_code(resource.get("region_code", ""))
-                cloud_services.append(
-                    make_cloud_service(
-                        name=_name,
-                        cloud_service_type=self.cloud_service_type,
-                        cloud_service_group=self.cloud_service_group,
-                        provider=self.provider,
-                        account=project_id,
-                        instance_type=instance_type,
-                        instance_size=resource.get("data", {})
-                        .get("hardware", {})
-                        .get("core", 0),
-                        tags=self.convert_labels_to_dict(labels),
-                        data=resource,
-                        region_code=resource.get("region_code", ""),
-                        reference={
-                            "resource_id": resource["googleCloud"]["selfLink"],
-                            "external_link": f"https://console.cloud.google.com/compute/instancesDetail/zones/{zone_info.get('zone')}/instances/{resource['name']}?project={resource['compute']['account']}",
-                        },
-                    )
+                yield make_cloud_service(
+                    name=_name,
+                    cloud_service_type=self.cloud_service_type,
+                    cloud_service_group=self.cloud_service_group,
+                    provider=self.provider,
+                    account=project_id,
+                    instance_type=instance_type,
+                    instance_size=resource.get("data", {})
+                    .get("hardware", {})
+                    .get("core", 0),
+                    tags=self.convert_labels_to_dict(labels),
+                    data=resource,
+                    region_code=resource.get("region_code", ""),
+                    reference={
+                        "resource_id": resource["googleCloud"]["selfLink"],
+                        "external_link": f"https://console.cloud.google.com/compute/instancesDetail/zones/{zone_info.get('zone')}/instances/{resource['name']}?project={resource['compute']['account']}",
+                    },
                 )
 
             except Exception as e:
                 _LOGGER.error(f"Error on Instance: {vm_id} : {e}")
 
-                error_responses.append(
-                    make_error_response(
-                        error=e,
-                        provider=self.provider,
-                        cloud_service_group=self.cloud_service_group,
-                        cloud_service_type=self.cloud_service_type,
-                    )
+                yield make_error_response(
+                    error=e,
+                    provider=self.provider,
+                    cloud_service_group=self.cloud_service_group,
+                    cloud_service_type=self.cloud_service_type,
+                )
+
+    def get_all_resources(self, options, project_id, compute_vms) -> (dict, list):
+        all_resources, errors = self.prefetch(
+            options,
+            {
+                "disk": self.instance_conn.list_disks,
+                "autoscaler": self.instance_conn.list_autoscalers,
+                "instance_type": lambda: list(
+                    self.instance_conn.get_machine_types(
+                        self._list_zone_machine_types(compute_vms)
+                    ).values()
+                ),
+                "instance_group": self.instance_conn.list_instance_group_managers,
+                "public_images": lambda: self.instance_conn.list_images(
+                    project_id, self._list_boot_disk_licenses(compute_vms)
+                ),
+                "vpcs": self.instance_conn.list_vpcs,
+                "subnets": self.instance_conn.list_subnetworks,
+                "firewalls": self.instance_conn.list_firewall,
+                "forwarding_rules": self.instance_conn.list_forwarding_rules,
+                "target_pools": self.instance_conn.list_target_pools,
+                "urlMaps": self.instance_conn.list_url_maps,
+                "backendSvcs": self.instance_conn.list_back_end_services,
+                "instance_group_members": self.instance_group_conn.list_instance_group_members,
+            },
+            required=["disk", "vpcs", "subnets"],
+            defaults={"public_images": {}, "instance_group_members": ({}, {})},
+        )
+
+        # Instances of a group that could not be listed are not known to be in it
+        instance_group_members, failed_instance_groups = all_resources.pop(
+            "instance_group_members"
+        )
+        for error in failed_instance_groups.values():
+            errors.append(
+                make_error_response(
+                    error=error,
+                    provider=self.provider,
+                    cloud_service_group=self.cloud_service_group,
+                    cloud_service_type=self.cloud_service_type,
                 )
-        return cloud_services, error_responses
-
-    def get_all_resources(self, project_id) -> dict:
-        instance_group_helper = InstanceGroupHelper(self.instance_conn)
-
-        return {
-            "disk": self.instance_conn.list_disks(),
-            "autoscaler": self.instance_conn.list_autoscalers(),
-            "instance_type": self.instance_conn.list_machine_types(),
-            "instance_group": self.instance_conn.list_instance_group_managers(),
-            "public_images": self.instance_conn.list_images(project_id),
-            "vpcs": self.instance_conn.list_vpcs(),
-            "subnets": self.instance_conn.list_subnetworks(),
-            "firewalls": self.instance_conn.list_firewall(),
-            "forwarding_rules": self.instance_conn.list_forwarding_rules(),
-            "target_pools": self.instance_conn.list_target_pools(),
-            "urlMaps": self.instance_conn.list_url_maps(),
-            "backendSvcs": self.instance_conn.list_back_end_services(),
-            "managedInstancesInInstanceGroups": instance_group_helper.list_managed_instances_in_instance_groups(),
-        }
+            )
+
+        all_resources["managedInstancesInInstanceGroups"] = (
+            InstanceGroupHelper.list_managed_instances_in_instance_groups(
+                all_resources["instance_group"], instance_group_members
+            )
+        )
+        return all_resources, errors
+
+    @staticmethod
+    def _list_boot_disk_licenses(compute_vms):
+        # The OS of an instance is resolved from the licenses of its boot disk
+        licenses = set()
+        for compute_vm in compute_vms:
+            if disks := compute_vm.get("disks", []):
+                licenses.add(tuple(disks[0].get("licenses", [])))
+        return licenses
+
+    def _list_zone_machine_types(self, compute_vms):
+        zone_machine_types = set()
+        for compute_vm in compute_vms:
+            zone, region = self._get_zone_and_region(compute_vm)
+            machine_type = compute_vm.get("machineType", "").split("/")[-1]
+            if zone and machine_type:
+                zone_machine_types.add((zone, machine_type))
+        return zone_machine_types
 
     def _get_zone_and_region(self, instance) -> (str, str):
         url_zone = instance.get("zone", "")
@@ -166,41 +225,7 @@ class VMInstanceManager(ResourceManager):
         else:
             return ""
 
-    def get_vm_instance_resource(self, project_id, zone_info, instance, all_resources):
-        """Prepare input params for call manager"""
-        # VPC
-        vpcs = all_resources.get("vpcs", [])
-        subnets = all_resources.get("subnets", [])
-
-        # All Public Images
-        public_images = all_resources.get("publicImages", {})
-
-        # URL Maps
-        url_maps = all_resources.get("urlMaps", [])
-        backend_svcs = all_resources.get("backendSvcs", [])
-        target_pools = all_resources.get("targetPools", [])
-
-        # Forwarding Rules
-        forwarding_rules = all_resources.get("forwardingRules", [])
-
-        # Firewall
-        firewalls = all_resources.get("firewalls", [])
-
-        # Get Instance Groups
-        instance_group = all_resources.get("instanceGroup", [])
-
-        # Get Machine Types
-        instance_types = all_resources.get("instanceType", [])
-
-        # Autoscaling group list
-        autoscaler = all_resources.get("autoscaler", [])
-        instance_in_managed_instance_groups = all_resources.get(
-            "managedInstancesInInstanceGroups", []
-        )
-
-        # disks
-        disks = all_resources.get("disk", [])
-
+    def get_vm_instance_resource(self, project_id, zone_info, instance, resource_index):
         """Get related resources from helpers"""
         vm_instance_helper: VMInstanceHelper = VMInstanceHelper(self.instance_conn)
         auto_scaler_helper: InstanceGroupHelper = InstanceGroupHelper(
@@ -211,32 +236,22 @@ class VMInstanceManager(ResourceManager):
         nic_helper: NICHelper = NICHelper()
         vpc_helper: VPCHelper = VPCHelper()
         firewall_helper: FirewallHelper = FirewallHelper()
-        autoscaler_vo = auto_scaler_helper.get_autoscaler_info(
-            instance, instance_group, autoscaler
-        )
+        autoscaler_vo = auto_scaler_helper.get_autoscaler_info(instance, resource_index)
         load_balancer_vos = loadbalancer_helper.get_loadbalancer_info(
-            instance,
-            instance_group,
-            backend_svcs,
-            url_maps,
-            target_pools,
-            forwarding_rules,
+            instance, resource_index
         )
-        disk_vos = disk_helper.get_disk_info(instance, disks)
-        vpc_vo, subnet_vo = vpc_helper.get_vpc_info(instance, vpcs, subnets)
+        disk_vos = disk_helper.get_disk_info(instance, resource_index)
+        vpc_vo, subnet_vo = vpc_helper.get_vpc_info(instance, resource_index)
         nic_vos = nic_helper.get_nic_info(instance, subnet_vo)
-        firewall_vos = firewall_helper.list_firewall_rules_info(instance, firewalls)
+        firewall_vos = firewall_helper.list_firewall_rules_info(
+            instance, resource_index
+        )
 
         firewall_names = [
             d.get("name") for d in firewall_vos if d.get("name", "") != ""
         ]
         server_data = vm_instance_helper.get_server_info(
-            instance,
-            instance_types,
-            disks,
-            zone_info,
-            public_images,
-            instance_in_managed_instance_groups,
+            instance, zone_info, resource_index
         )
         google_cloud_filters = [
             {"key": "resource.labels.instance_id", "value": instance.get("id")}
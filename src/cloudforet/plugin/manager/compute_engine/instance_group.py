@@ -37,20 +37,23 @@ class InstanceGroupManager(ResourceManager):
     def create_cloud_service(self, options, secret_data, schema):
         project_id = secret_data["project_id"]
         instance_group_conn = InstanceGroupConnector(
-            options=options, secret_data=secret_data, schema=schema
+            options=options,
+            secret_data=secret_data,
+            schema=schema,
+            cache=self.cache,
         )
 
         instance_groups = instance_group_conn.list_instance_groups()
         instance_group_managers = instance_group_conn.list_instance_group_managers()
         autoscalers = instance_group_conn.list_autoscalers()
         instance_templates = instance_group_conn.list_instance_templates()
+        instance_group_members, _ = instance_group_conn.list_instance_group_members()
 
-        cloud_services = []
-        error_responses = []
         for instance_group in instance_groups:
             try:
                 instance_group_id = instance_group.get("id")
 
+                instance_group = instance_group.copy()
                 instance_group.update({"project": secret_data["project_id"]})
 
                 scheduler = (
@@ -66,6 +69,7 @@ class InstanceGroupManager(ResourceManager):
                     scheduler.update({"instanceGroupType": instance_group_type})
 
                     # Managed
+                    match_instance_group_manager = match_instance_group_manager.copy()
                     match_instance_group_manager.update(
                         {
                             "statefulPolicy": {
@@ -121,9 +125,12 @@ class InstanceGroupManager(ResourceManager):
                     if location_type == "zone"
                     else location
                 )
-                instances = instance_group_conn.list_instances(
-                    instance_group.get("name"), location, location_type
-                )
+                instances = instance_group_members.get(instance_group.get("selfLink"))
+                if instances is None:
+                    # Listing of the group failed in list_instance_group_members
+                    instances = instance_group_conn.list_instances(
+                        instance_group.get("name"), location, location_type
+                    )
 
                 display_loc = (
                     {"region": location, "zone": ""}
@@ -169,20 +176,18 @@ class InstanceGroupManager(ResourceManager):
                 )
 
                 self.set_region_code(region)
-                cloud_services.append(
-                    make_cloud_service(
-                        name=_name,
-                        cloud_service_type=self.cloud_service_type,
-                        cloud_service_group=self.cloud_service_group,
-                        provider=self.provider,
-                        account=project_id,
-                        data=instance_group,
-                        region_code=region,
-                        reference={
-                            "resource_id": instance_group.get("selfLink", ""),
-                            "external_link": f"https://console.cloud.google.com/compute/instanceGroups/details/{instance_group.get('zone')}/{_name}?authuser=1&project={project_id}",
-                        },
-                    )
+                yield make_cloud_service(
+                    name=_name,
+                    cloud_service_type=self.cloud_service_type,
+                    cloud_service_group=self.cloud_service_group,
+                    provider=self.provider,
+                    account=project_id,
+                    data=instance_group,
+                    region_code=region,
+                    reference={
+                        "resource_id": instance_group.get("selfLink", ""),
+                        "external_link": f"https://console.cloud.google.com/compute/instanceGroups/details/{instance_group.get('zone')}/{_name}?authuser=1&project={project_id}",
+                    },
                 )
 
             except Exception as e:
@@ -190,15 +195,12 @@ class InstanceGroupManager(ResourceManager):
                     f'Error on Instance Group {instance_group.get("name")}: {str(e)}'
                 )
 
-                error_responses.append(
-                    make_error_response(
-                        error=e,
-                        provider=self.provider,
-                        cloud_service_group=self.cloud_service_group,
-                        cloud_service_type=self.cloud_service_type,
-                    )
+                yield make_error_response(
+                    error=e,
+                    provider=self.provider,
+                    cloud_service_group=self.cloud_service_group,
+                    cloud_service_type=self.cloud_service_type,
                 )
-        return cloud_services, error_responses
 
     def _get_location(self, instance_group):
         if "zone" in instance_group:
@@ -215,8 +217,9 @@ class InstanceGroupManager(ResourceManager):
         _instances = []
         for instance in instances:
             url_instance = instance.get("instance", "")
-            instance.update({"name": self.get_param_in_url(url_instance, "instances")})
-            _instances.append(instance)
+            _instances.append(
+                dict(instance, name=self.get_param_in_url(url_instance, "instances"))
+            )
 
         return _instances
 
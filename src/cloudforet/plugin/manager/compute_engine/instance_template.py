@@ -36,17 +36,19 @@ class InstanceTemplateManager(ResourceManager):
     def create_cloud_service(self, options, secret_data, schema):
         project_id = secret_data["project_id"]
         instance_template_conn = InstanceTemplateConnector(
-            options=options, secret_data=secret_data, schema=schema
+            options=options,
+            secret_data=secret_data,
+            schema=schema,
+            cache=self.cache,
         )
 
         instance_templates = instance_template_conn.list_instance_templates()
         instance_groups = instance_template_conn.list_instance_group_managers()
 
-        cloud_services = []
-        error_responses = []
         for inst_template in instance_templates:
             try:
                 inst_template_id = inst_template.get("id")
+                inst_template = inst_template.copy()
                 properties = inst_template.get("properties", {})
                 tags = properties.get("tags", {})
 
@@ -97,21 +99,19 @@ class InstanceTemplateManager(ResourceManager):
                 )
 
                 self.set_region_code("global")
-                cloud_services.append(
-                    make_cloud_service(
-                        name=_name,
-                        cloud_service_type=self.cloud_service_type,
-                        cloud_service_group=self.cloud_service_group,
-                        provider=self.provider,
-                        account=project_id,
-                        tags=tags,
-                        data=inst_template,
-                        region_code="global",
-                        reference={
-                            "resource_id": inst_template.get("selfLink", ""),
-                            "external_link": f"https://console.cloud.google.com/compute/instanceTemplates/details/{_name}?project={project_id}",
-                        },
-                    )
+                yield make_cloud_service(
+                    name=_name,
+                    cloud_service_type=self.cloud_service_type,
+                    cloud_service_group=self.cloud_service_group,
+                    provider=self.provider,
+                    account=project_id,
+                    tags=tags,
+                    data=inst_template,
+                    region_code="global",
+                    reference={
+                        "resource_id": inst_template.get("selfLink", ""),
+                        "external_link": f"https://console.cloud.google.com/compute/instanceTemplates/details/{_name}?project={project_id}",
+                    },
                 )
 
             except Exception as e:
@@ -119,15 +119,12 @@ class InstanceTemplateManager(ResourceManager):
                     f'Error on Instance Template {inst_template.get("name")}: {e}'
                 )
 
-                error_responses.append(
-                    make_error_response(
-                        error=e,
-                        provider=self.provider,
-                        cloud_service_group=self.cloud_service_group,
-                        cloud_service_type=self.cloud_service_type,
-                    )
+                yield make_error_response(
+                    error=e,
+                    provider=self.provider,
+                    cloud_service_group=self.cloud_service_group,
+                    cloud_service_type=self.cloud_service_type,
                 )
-        return cloud_services, error_responses
 
     def _get_disks(self, instance):
         disk_info = []
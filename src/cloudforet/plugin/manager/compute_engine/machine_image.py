@@ -37,13 +37,14 @@ class MachineImageManager(ResourceManager):
     def create_cloud_service(self, options, secret_data, schema):
         project_id = secret_data["project_id"]
         machine_image_conn = MachineImageConnector(
-            options=options, secret_data=secret_data, schema=schema
+            options=options,
+            secret_data=secret_data,
+            schema=schema,
+            cache=self.cache,
         )
 
         machine_images = machine_image_conn.list_machine_images()
 
-        cloud_services = []
-        error_responses = []
         for machine_image in machine_images:
             try:
                 _name = machine_image.get("name", "")
@@ -101,21 +102,19 @@ class MachineImageManager(ResourceManager):
 
                 region = region.get("regionCode")
                 self.set_region_code(region)
-                cloud_services.append(
-                    make_cloud_service(
-                        name=_name,
-                        cloud_service_type=self.cloud_service_type,
-                        cloud_service_group=self.cloud_service_group,
-                        provider=self.provider,
-                        account=project_id,
-                        tags=tags,
-                        data=machine_image,
-                        region_code=region,
-                        reference={
-                            "resource_id": machine_image.get("selfLink", ""),
-                            "external_link": f"https://console.cloud.google.com/compute/machineImages/details/{_name}?project={project_id}",
-                        },
-                    )
+                yield make_cloud_service(
+                    name=_name,
+                    cloud_service_type=self.cloud_service_type,
+                    cloud_service_group=self.cloud_service_group,
+                    provider=self.provider,
+                    account=project_id,
+                    tags=tags,
+                    data=machine_image,
+                    region_code=region,
+                    reference={
+                        "resource_id": machine_image.get("selfLink", ""),
+                        "external_link": f"https://console.cloud.google.com/compute/machineImages/details/{_name}?project={project_id}",
+                    },
                 )
 
             except Exception as e:
@@ -123,15 +122,12 @@ class MachineImageManager(ResourceManager):
                     f'Error on Machine Image {machine_image.get("name"): {e}}'
                 )
 
-                error_responses.append(
-                    make_error_response(
-                        error=e,
-                        provider=self.provider,
-                        cloud_service_group=self.cloud_service_group,
-                        cloud_service_type=self.cloud_service_type,
-                    )
+                yield make_error_response(
+                    error=e,
+                    provider=self.provider,
+                    cloud_service_group=self.cloud_service_group,
+                    cloud_service_type=self.cloud_service_type,
                 )
-        return cloud_services, error_responses
 
     def get_disks(self, instance, boot_image):
         disk_info = []
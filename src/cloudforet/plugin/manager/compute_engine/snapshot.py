@@ -35,13 +35,14 @@ class SnapshotManager(ResourceManager):
         project_id = secret_data["project_id"]
         snapshot_id = ""
         snapshot_conn = SnapshotConnector(
-            options=options, secret_data=secret_data, schema=schema
+            options=options,
+            secret_data=secret_data,
+            schema=schema,
+            cache=self.cache,
         )
 
         snapshots = snapshot_conn.list_snapshot()
 
-        cloud_services = []
-        error_responses = []
         for snapshot in snapshots:
             try:
                 snapshot_id = snapshot.get("id")
@@ -66,35 +67,30 @@ class SnapshotManager(ResourceManager):
                 _name = snapshot.get("name", "")
 
                 self.set_region_code(region_code)
-                cloud_services.append(
-                    make_cloud_service(
-                        name=_name,
-                        cloud_service_type=self.cloud_service_type,
-                        cloud_service_group=self.cloud_service_group,
-                        provider=self.provider,
-                        account=project_id,
-                        tags=labels,
-                        data=snapshot,
-                        region_code=region_code,
-                        reference={
-                            "resource_id": snapshot.get("selfLink", ""),
-                            "external_link": f"https://console.cloud.google.com/compute/snapshotsDetail/projects/{project_id}/global/snapshots/{_name}?authuser=2&project={project_id}",
-                        },
-                    )
+                yield make_cloud_service(
+                    name=_name,
+                    cloud_service_type=self.cloud_service_type,
+                    cloud_service_group=self.cloud_service_group,
+                    provider=self.provider,
+                    account=project_id,
+                    tags=labels,
+                    data=snapshot,
+                    region_code=region_code,
+                    reference={
+                        "resource_id": snapshot.get("selfLink", ""),
+                        "external_link": f"https://console.cloud.google.com/compute/snapshotsDetail/projects/{project_id}/global/snapshots/{_name}?authuser=2&project={project_id}",
+                    },
                 )
 
             except Exception as e:
                 _LOGGER.error(f"Error on Snapshot {snapshot_id}: {e}", exc_info=True)
 
-                error_responses.append(
-                    make_error_response(
-                        error=e,
-                        provider=self.provider,
-                        cloud_service_group=self.cloud_service_group,
-                        cloud_service_type=self.cloud_service_type,
-                    )
+                yield make_error_response(
+                    error=e,
+                    provider=self.provider,
+                    cloud_service_group=self.cloud_service_group,
+                    cloud_service_type=self.cloud_service_type,
                 )
-        return cloud_services, error_responses
 
     def get_matching_region(self, svc_location):
         region_code = svc_location[0] if svc_location else "global"
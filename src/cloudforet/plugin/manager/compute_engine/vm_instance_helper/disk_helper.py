@@ -2,7 +2,7 @@ from cloudforet.plugin.connector.compute_engine.vm_instance import VMInstanceCon
 
 
 class DiskHelper:
-    def get_disk_info(self, instance, disk_list):
+    def get_disk_info(self, instance, resource_index):
         """
         disk_data = {
             "device_index": 0,
@@ -29,8 +29,8 @@ class DiskHelper:
         for int_disk in int_disks:
             single_disk_tag = {}
             disk_sz = float(int_disk.get("diskSizeGb"))
-            matching_single_disk_tag = self._get_matched_disk_tag_info(
-                int_disk, disk_list
+            matching_single_disk_tag = resource_index.disks_by_self_link.get(
+                int_disk.get("source", "")
             )
             if matching_single_disk_tag is not None:
                 single_disk_type = self._get_disk_type(matching_single_disk_tag)
@@ -108,19 +108,6 @@ class DiskHelper:
 
         return constant
 
-    @staticmethod
-    def _get_matched_disk_tag_info(int_disk, disk_list):
-        source_disk = None
-        source = int_disk.get("source", "")
-        disk = [
-            disk_single
-            for disk_single in disk_list
-            if disk_single["selfLink"] == source
-        ]
-        if len(disk) > 0:
-            source_disk = disk[0]
-        return source_disk
-
     @staticmethod
     def _get_disk_type(matching_single_disk_tag):
         type_str = matching_single_disk_tag.get("type", "")
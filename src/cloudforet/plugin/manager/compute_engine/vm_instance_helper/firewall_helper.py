@@ -2,31 +2,21 @@ from cloudforet.plugin.connector.compute_engine.vm_instance import VMInstanceCon
 
 
 class FirewallHelper:
-    def list_firewall_rules_info(self, instance, firewall_rules) -> list:
+    def list_firewall_rules_info(self, instance, resource_index) -> list:
+        """
+        Firewall rules of the instance networks which
+            0. target one of the instance network tags
+            1. target one of the instance service accounts
+            2. apply to all instances in the network
+        """
         firewall_rules_results = []
-        inst_network_info = self._get_instance_network_info(instance)
-
+        firewall_rules = resource_index.list_firewalls(
+            self._get_instance_network_info(instance),
+            instance.get("tags", {}).get("items", []),
+            [sa.get("email", "") for sa in instance.get("serviceAccounts", [])],
+        )
         for firewall_rule in firewall_rules:
-            if firewall_rule.get("network") in inst_network_info:
-                # 0. network target tag matching
-                if self._chk_network_tag_is_matched(instance, firewall_rule):
-                    firewall_rules_results.extend(
-                        self.list_firewall_rule_data(firewall_rule)
-                    )
-                # 1. target service account matching
-                elif self._chk_service_account_is_matched(instance, firewall_rule):
-                    firewall_rules_results.extend(
-                        self.list_firewall_rule_data(firewall_rule)
-                    )
-                # 2. FW rule applies to all instances in subnet
-                elif ("targetTags" not in firewall_rule) & (
-                    "targetServiceAccounts" not in firewall_rule
-                ):
-                    firewall_rules_results.extend(
-                        self.list_firewall_rule_data(firewall_rule)
-                    )
-            else:
-                pass
+            firewall_rules_results.extend(self.list_firewall_rule_data(firewall_rule))
         return firewall_rules_results
 
     def list_firewall_rule_data(self, firewall_rule) -> list:
@@ -121,26 +111,6 @@ class FirewallHelper:
         else:
             return "deny"
 
-    @staticmethod
-    def _chk_network_tag_is_matched(instance, firewall) -> bool:
-        matched = False
-        # compares all fw target tags and instance tags
-        for fw_target_tag in firewall.get("targetTags", []):
-            for tag in instance.get("tags", {}).get("items", []):
-                if tag == fw_target_tag:
-                    matched = True
-        return matched
-
-    @staticmethod
-    def _chk_service_account_is_matched(instance, firewall) -> bool:
-        matched = False
-        # compares all fw target service account and instance service account
-        for instance_service_account in instance.get("serviceAccounts", []):
-            for fw_service_account in firewall.get("targetServiceAccounts", []):
-                if instance_service_account.get("email", "") == fw_service_account:
-                    matched = True
-        return matched
-
     @staticmethod
     def _get_instance_network_info(instance):
         inst_network_interfaces = instance.get("networkInterfaces", [])
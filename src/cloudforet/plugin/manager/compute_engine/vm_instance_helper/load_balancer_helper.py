@@ -2,15 +2,7 @@ class LoadBalancerHelper:
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def get_loadbalancer_info(
-        self,
-        instance,
-        instance_groups,
-        backend_svc,
-        url_maps,
-        target_pools,
-        forwarding_rules,
-    ):
+    def get_loadbalancer_info(self, instance, resource_index):
         """
         load_balancer_data_list = [{
                 "type": 'HTTP'| 'TCP'| 'UDP'
@@ -29,10 +21,10 @@ class LoadBalancerHelper:
         ]
         """
         load_balancer_data_list = []
-        matched_groups = self.get_matched_instance_group(instance, instance_groups)
+        matched_groups = self.get_matched_instance_group(instance, resource_index)
         for matched_group in matched_groups:
             matched_lb_infos = self.get_matched_backend_svc_for_http(
-                matched_group, backend_svc, url_maps
+                matched_group, resource_index
             )
             for matched_lb_info in matched_lb_infos:
                 lb_info = matched_lb_info.get("lbInfo", {})
@@ -51,11 +43,11 @@ class LoadBalancerHelper:
 
                 load_balancer_data_list.append(lb_data)
 
-        matched_target_pools = self._get_matched_target_pool(instance, target_pools)
+        matched_target_pools = self._get_matched_target_pool(instance, resource_index)
 
         if len(matched_target_pools) > 0:
             lbs_by_fd_rules = self._get_matched_forwarding_rules(
-                matched_target_pools, forwarding_rules
+                matched_target_pools, resource_index
             )
             for lbs_by_fd_rule in lbs_by_fd_rules:
                 lb_info = lbs_by_fd_rule.get("lb_info", {})
@@ -74,76 +66,28 @@ class LoadBalancerHelper:
 
         return load_balancer_data_list
 
-    def get_matched_backend_svc_for_http(self, matched_group, backend_svcs, url_maps):
-        matched_backend_svc = []
-        instance_group_key = self._get_matching_str("instanceGroup", matched_group)
-        for backend_svc in backend_svcs:
-            backends = backend_svc.get("backends", [])
-            selected_url_map = self._get_lb_name_from_backend_svc(
-                backend_svc.get("selfLink", ""), url_maps
-            )
-            if (
-                backend_svc.get("protocol", "") in ["HTTP", "HTTPS"]
-                and selected_url_map is not None
-            ):
-                for backend in backends:
-                    group_name = backend.get("group", "")
-                    if instance_group_key in group_name:
-                        backend_svc.update({"lbInfo": selected_url_map})
-                        matched_backend_svc.append(backend_svc)
-                        break
-
-        return matched_backend_svc
-
     @staticmethod
-    def get_matched_instance_group(instance, instance_groups):
-        matched_instance_group = []
-        for instance_group in instance_groups:
-            instance_list = instance_group.get("instanceList", [])
-            for single_inst in instance_list:
-                if instance.get("selfLink", "") == single_inst.get("instance"):
-                    matched_instance_group.append(instance_group)
-                    break
-
-        return matched_instance_group
+    def get_matched_backend_svc_for_http(matched_group, resource_index):
+        # Only HTTP(S) backend services used by a URL map are indexed, with lbInfo set
+        return resource_index.list_http_backend_svcs(matched_group)
 
     @staticmethod
-    def _get_matching_str(key, matching_item):
-        matching_string = matching_item.get(key, "")
-        return (
-            matching_string[matching_string.find("/projects/") : len(matching_string)]
-            if matching_string != ""
-            else None
-        )
-
-    @staticmethod
-    def _get_lb_name_from_backend_svc(self_link, url_maps):
-        selected_url_map = None
-        for url_map in url_maps:
-            if self_link == url_map.get("defaultService", ""):
-                selected_url_map = url_map
-                break
-        return selected_url_map
+    def get_matched_instance_group(instance, resource_index):
+        return resource_index.list_instance_groups(instance.get("selfLink", ""))
 
     @staticmethod
-    def _get_matched_target_pool(instance, target_pools):
-        instance_contained_pools = []
-        for target_pool in target_pools:
-            inst_self_link = instance.get("selfLink", "")
-            if any(inst_self_link in s for s in target_pool.get("instances", [])):
-                instance_contained_pools.append(target_pool)
-        return instance_contained_pools
+    def _get_matched_target_pool(instance, resource_index):
+        return resource_index.list_target_pools(instance.get("selfLink", ""))
 
     @staticmethod
-    def _get_matched_forwarding_rules(target_pools, forwarding_rules):
+    def _get_matched_forwarding_rules(target_pools, resource_index):
         matched_forwarding_rule = []
         for target_pool in target_pools:
             self_link = target_pool.get("selfLink", "")
-            for forwarding_rule in forwarding_rules:
-                target = forwarding_rule.get("target", "")
-                if self_link == target:
-                    forwarding_rule.update({"lbInfo": target_pool})
-                    matched_forwarding_rule.append(forwarding_rule)
+            for forwarding_rule in resource_index.list_forwarding_rules(self_link):
+                matched_forwarding_rule.append(
+                    dict(forwarding_rule, lbInfo=target_pool)
+                )
         return matched_forwarding_rule
 
     @staticmethod
@@ -0,0 +1,164 @@
+class VMInstanceResourceIndex:
+    """Lookup tables of the resources related to VM instances.
+
+    Built once per collection from `VMInstanceManager.get_all_resources`, so the
+    helpers resolve the resources of a VM instance without scanning every list.
+    Lists in the index keep the order of the original resource lists.
+    """
+
+    def __init__(self, all_resources):
+        self.public_images = all_resources.get("public_images", {})
+        self.managed_instances = all_resources.get(
+            "managedInstancesInInstanceGroups", {}
+        )
+
+        # Disks
+        self.disks_by_self_link = {}
+        self.disks_by_name = {}
+        for disk in all_resources.get("disk", []):
+            self.disks_by_self_link.setdefault(disk.get("selfLink", ""), disk)
+            self.disks_by_name.setdefault(disk.get("name", ""), disk)
+
+        # Machine Types
+        self.machine_types_by_self_link = {}
+        self.machine_types_by_name = {}
+        for machine_type in all_resources.get("instance_type", []):
+            self.add_machine_type(machine_type)
+
+        # Public Images by licenses
+        self.images_by_licenses = {}
+        for key, images in self.public_images.items():
+            images_by_licenses = self.images_by_licenses.setdefault(key, {})
+            for image in images:
+                images_by_licenses.setdefault(tuple(image.get("licenses", [])), image)
+
+        # VPC
+        self.subnets_by_self_link = {}
+        for index, subnet in enumerate(all_resources.get("subnets", [])):
+            self.subnets_by_self_link.setdefault(
+                subnet.get("selfLink", ""), (index, subnet)
+            )
+
+        self.vpcs_by_subnetwork = {}
+        for vpc in all_resources.get("vpcs", []):
+            for subnetwork in vpc.get("subnetworks", []):
+                self.vpcs_by_subnetwork.setdefault(subnetwork, vpc)
+
+        # Firewalls (by network, by target tag and by target service account)
+        self.firewalls_by_network = {}
+        self.firewalls_by_target_tag = {}
+        self.firewalls_by_service_account = {}
+        for index, firewall in enumerate(all_resources.get("firewalls", [])):
+            network = firewall.get("network")
+            item = (index, firewall)
+            if "targetTags" in firewall:
+                for tag in set(firewall.get("targetTags", [])):
+                    self.firewalls_by_target_tag.setdefault((network, tag), []).append(
+                        item
+                    )
+            if "targetServiceAccounts" in firewall:
+                for service_account in set(firewall.get("targetServiceAccounts", [])):
+                    self.firewalls_by_service_account.setdefault(
+                        (network, service_account), []
+                    ).append(item)
+            if "targetTags" not in firewall and "targetServiceAccounts" not in firewall:
+                self.firewalls_by_network.setdefault(network, []).append(item)
+
+        # Autoscalers
+        self.autoscalers_by_self_link = {}
+        for autoscaler in all_resources.get("autoscaler", []):
+            self.autoscalers_by_self_link.setdefault(
+                autoscaler.get("selfLink", ""), autoscaler
+            )
+
+        # Load Balancers (HTTP(S) backend services by instance group, target pools by member)
+        url_maps_by_default_service = {}
+        for url_map in all_resources.get("urlMaps", []):
+            url_maps_by_default_service.setdefault(
+                url_map.get("defaultService", ""), url_map
+            )
+
+        self.http_backend_svcs_by_group = {}
+        for backend_svc in all_resources.get("backendSvcs", []):
+            url_map = url_maps_by_default_service.get(backend_svc.get("selfLink", ""))
+            if backend_svc.get("protocol", "") in ["HTTP", "HTTPS"] and url_map:
+                backend_svc = dict(backend_svc, lbInfo=url_map)
+                groups = {
+                    self.get_project_path(backend.get("group", ""))
+                    for backend in backend_svc.get("backends", [])
+                }
+                for group in groups:
+                    self.http_backend_svcs_by_group.setdefault(group, []).append(
+                        backend_svc
+                    )
+
+        self.target_pools_by_member = {}
+        for target_pool in all_resources.get("target_pools", []):
+            for instance in set(target_pool.get("instances", [])):
+                self.target_pools_by_member.setdefault(instance, []).append(target_pool)
+
+        self.forwarding_rules_by_target = {}
+        for forwarding_rule in all_resources.get("forwarding_rules", []):
+            self.forwarding_rules_by_target.setdefault(
+                forwarding_rule.get("target", ""), []
+            ).append(forwarding_rule)
+
+    def add_machine_type(self, machine_type):
+        self.machine_types_by_self_link.setdefault(
+            machine_type.get("selfLink", ""), machine_type
+        )
+        self.machine_types_by_name.setdefault(
+            machine_type.get("name", ""), machine_type
+        )
+
+    def get_machine_type(self, self_link):
+        machine_type = self.machine_types_by_self_link.get(self_link)
+        if machine_type is None:
+            machine_type = self.machine_types_by_name.get(self_link.split("/")[-1])
+        return machine_type
+
+    def get_subnet(self, subnetwork_links):
+        matched = [
+            self.subnets_by_self_link[link]
+            for link in subnetwork_links
+            if link in self.subnets_by_self_link
+        ]
+        return min(matched, key=lambda item: item[0])[1] if matched else {}
+
+    def list_firewalls(self, networks, tags, service_accounts):
+        matched = {}
+        for network in set(networks):
+            keys = [(network, tag) for tag in tags]
+            for item in self._list_items(self.firewalls_by_target_tag, keys):
+                matched.setdefault(item[0], item[1])
+
+            keys = [(network, email) for email in service_accounts]
+            for item in self._list_items(self.firewalls_by_service_account, keys):
+                matched.setdefault(item[0], item[1])
+
+            for item in self.firewalls_by_network.get(network, []):
+                matched.setdefault(item[0], item[1])
+
+        return [matched[index] for index in sorted(matched)]
+
+    def list_instance_groups(self, instance_self_link):
+        return self.managed_instances.get(instance_self_link, [])
+
+    def list_http_backend_svcs(self, instance_group):
+        group = self.get_project_path(instance_group.get("instanceGroup", ""))
+        return self.http_backend_svcs_by_group.get(group, []) if group else []
+
+    def list_target_pools(self, instance_self_link):
+        return self.target_pools_by_member.get(instance_self_link, [])
+
+    def list_forwarding_rules(self, target):
+        return self.forwarding_rules_by_target.get(target, [])
+
+    @staticmethod
+    def get_project_path(self_link):
+        return self_link[self_link.find("/projects/") :] if self_link else ""
+
+    @staticmethod
+    def _list_items(index, keys):
+        for key in keys:
+            yield from index.get(key, [])
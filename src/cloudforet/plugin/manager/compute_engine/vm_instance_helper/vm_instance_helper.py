@@ -7,15 +7,7 @@ class VMInstanceHelper:
         super().__init__(**kwargs)
         self.instance_conn: VMInstanceConnector = gcp_connector
 
-    def get_server_info(
-        self,
-        instance,
-        instance_types,
-        disks,
-        zone_info,
-        public_images,
-        instance_in_managed_instance_groups,
-    ):
+    def get_server_info(self, instance, zone_info, resource_index):
         """
         server_data = {
             "name": '',x
@@ -73,13 +65,11 @@ class VMInstanceHelper:
         }
         """
 
-        os_data = self._get_os_data(instance, public_images)
+        os_data = self._get_os_data(instance, resource_index)
         server_dic = self._get_server_dic(instance, zone_info)
-        google_cloud_data = self._get_google_cloud_data(
-            instance, instance_in_managed_instance_groups
-        )
-        hardware_data = self._get_hardware_data(instance, instance_types, zone_info)
-        compute_data = self._get_compute_data(instance, disks, zone_info)
+        google_cloud_data = self._get_google_cloud_data(instance, resource_index)
+        hardware_data = self._get_hardware_data(instance, resource_index, zone_info)
+        compute_data = self._get_compute_data(instance, resource_index, zone_info)
 
         server_dic.update(
             {
@@ -103,7 +93,7 @@ class VMInstanceHelper:
 
         return server_data
 
-    def _get_os_data(self, instance, public_images):
+    def _get_os_data(self, instance, resource_index):
         disk_info = instance.get("disks", [])
         os_dists = disk_info[0].get("licenses", []) if len(disk_info) > 0 else []
         licenses = disk_info[0].get("licenses", []) if len(disk_info) > 0 else []
@@ -118,41 +108,37 @@ class VMInstanceHelper:
                     os_type = "WINDOWS"
                 break
 
-        os_data = self._get_appropriate_image_info(os_identity, licenses, public_images)
+        os_data = self._get_appropriate_image_info(
+            os_identity, licenses, resource_index
+        )
         os_data["osType"] = os_type
 
         return os_data
 
     @staticmethod
-    def _get_appropriate_image_info(os_identity, licenses, public_images):
+    def _get_appropriate_image_info(os_identity, licenses, resource_index):
         # temp arch lists will be updated when full list has prepared.
         arch_list = ["x86_64", "x86_32", "x64", "x86", "amd64"]
         os_data = {"details": "", "os_distro": "", "os_arch": ""}
-        for key, images in public_images.items():
-            find = False
+        for key, images_by_licenses in resource_index.images_by_licenses.items():
             if key in os_identity:
-                for image in images:
-                    if licenses == image.get("licenses", []):
-                        os_arch_index = [
-                            i
-                            for i, e in enumerate(arch_list)
-                            if e in image.get("description", "")
-                        ]
-                        os_data.update(
-                            {
-                                "os_distro": "windows-server"
-                                if key == "windows"
-                                else key,
-                                "details": image.get("description", ""),
-                                "os_arch": arch_list[os_arch_index[0]]
-                                if len(os_arch_index) > 0
-                                else "",
-                            }
-                        )
-                        find = True
-                        break
-            if find:
-                break
+                image = images_by_licenses.get(tuple(licenses))
+                if image is not None:
+                    os_arch_index = [
+                        i
+                        for i, e in enumerate(arch_list)
+                        if e in image.get("description", "")
+                    ]
+                    os_data.update(
+                        {
+                            "os_distro": "windows-server" if key == "windows" else key,
+                            "details": image.get("description", ""),
+                            "os_arch": arch_list[os_arch_index[0]]
+                            if len(os_arch_index) > 0
+                            else "",
+                        }
+                    )
+                    break
 
         if os_identity == "cos":
             os_data.update(
@@ -160,7 +146,7 @@ class VMInstanceHelper:
             )
         return os_data
 
-    def _get_google_cloud_data(self, instance, instance_in_managed_instance_groups):
+    def _get_google_cloud_data(self, instance, resource_index):
         google_cloud = {
             "selfLink": instance.get("selfLink", ""),
             "fingerprint": instance.get("fingerprint", ""),
@@ -174,13 +160,13 @@ class VMInstanceHelper:
             "serviceAccounts": self._list_service_accounts(instance),
             "labels": self._get_labels(instance.get("labels", {})),
             "isManagedInstance": True
-            if instance.get("selfLink", "") in instance_in_managed_instance_groups
+            if instance.get("selfLink", "") in resource_index.managed_instances
             else False,
         }
 
         return google_cloud
 
-    def _get_hardware_data(self, instance, instance_types, zone_info):
+    def _get_hardware_data(self, instance, resource_index, zone_info):
         """
         core = IntType(default=0)
         memory = FloatType(default=0.0)
@@ -188,11 +174,11 @@ class VMInstanceHelper:
         cpu_model = ListType(StringType(default=""))
         """
 
-        core, memory = self._get_core_and_memory(instance, instance_types)
+        core, memory = self._get_core_and_memory(instance, resource_index)
 
         if core == 0 and memory == 0:
             core, memory = self._get_custom_image_type(
-                instance, zone_info, instance_types
+                instance, zone_info, resource_index
             )
 
         hardware_data = {
@@ -204,7 +190,7 @@ class VMInstanceHelper:
 
         return hardware_data
 
-    def _get_compute_data(self, instance, disks, zone_info):
+    def _get_compute_data(self, instance, resource_index, zone_info):
         """
         {
             'keypair': StringType(default="")
@@ -229,21 +215,21 @@ class VMInstanceHelper:
             "instanceState": instance.get("status"),
             "instanceType": self._get_instance_type(instance),
             "account": zone_info.get("project_id", ""),
-            "image": self._get_images(instance, disks),
+            "image": self._get_images(instance, resource_index),
             "launchedAt": instance.get("creationTimestamp"),
             "tags": self._get_tags_only_string_values(instance),
         }
 
         return compute_data
 
-    def _get_custom_image_type(self, instance, zone_info, instance_types):
+    def _get_custom_image_type(self, instance, zone_info, resource_index):
         machine = instance.get("machineType", "")
         _machine = machine[machine.rfind("/") + 1 :]
 
         custom_image_type = self.instance_conn.get_machine_type(
             zone_info.get("zone"), _machine
         )
-        instance_types.append(custom_image_type)
+        resource_index.add_machine_type(custom_image_type)
 
         cpu = custom_image_type.get("guestCpus", 0)
         memory = round(float((custom_image_type.get("memoryMb", 0)) / 1024), 2)
@@ -258,15 +244,13 @@ class VMInstanceHelper:
         return tags
 
     @staticmethod
-    def _get_images(instance, disks):
+    def _get_images(instance, resource_index):
         image = ""
-        name = instance.get("name", "")
+        disk = resource_index.disks_by_name.get(instance.get("name", ""))
 
-        for disk in disks:
-            if name == disk.get("name", ""):
-                _image = disk.get("sourceImage", "")
-                image = _image[_image.rfind("/") + 1 :]
-                break
+        if disk is not None:
+            _image = disk.get("sourceImage", "")
+            image = _image[_image.rfind("/") + 1 :]
         return image
 
     @staticmethod
@@ -276,19 +260,13 @@ class VMInstanceHelper:
         return machine_split[-1]
 
     @staticmethod
-    def _get_core_and_memory(instance, instance_types):
-        machine_type = instance.get("machineType", "")
-        _machine = machine_type[machine_type.rfind("/") + 1 :]
+    def _get_core_and_memory(instance, resource_index):
         cpu = 0
         memory = 0
-        for i_type in instance_types:
-            if (
-                i_type.get("selfLink", "") == machine_type
-                or i_type.get("name", "") == _machine
-            ):
-                cpu = i_type.get("guestCpus")
-                memory = round(float((i_type.get("memoryMb", 0)) / 1024), 2)
-                break
+        i_type = resource_index.get_machine_type(instance.get("machineType", ""))
+        if i_type is not None:
+            cpu = i_type.get("guestCpus")
+            memory = round(float((i_type.get("memoryMb", 0)) / 1024), 2)
 
         return cpu, memory
 
@@ -2,7 +2,7 @@ from cloudforet.plugin.connector.compute_engine.vm_instance import VMInstanceCon
 
 
 class VPCHelper:
-    def get_vpc_info(self, instance, vpcs, subnets):
+    def get_vpc_info(self, instance, resource_index):
         """
         vpc_data = {
             "vpc_id": "",
@@ -25,8 +25,8 @@ class VPCHelper:
         subnet_data = {}
 
         # To get vpc, subnet related to instance
-        matched_subnet = self._get_matching_subnet(instance, subnets)
-        matched_vpc = self._get_matching_vpc(matched_subnet, vpcs)
+        matched_subnet = self._get_matching_subnet(instance, resource_index)
+        matched_vpc = self._get_matching_vpc(matched_subnet, resource_index)
 
         vpc_data.update(
             {
@@ -51,21 +51,17 @@ class VPCHelper:
         return vpc_data, subnet_data
 
     @staticmethod
-    def _get_matching_vpc(matched_subnet, vpcs) -> dict:
+    def _get_matching_vpc(matched_subnet, resource_index) -> dict:
         matching_vpc = {}
         network = matched_subnet.get("selfLink", None)
-        # Instance cannot be placed in multiple VPCs(Break after first matched result)
+        # Instance cannot be placed in multiple VPCs(First matched result)
         if network is not None:
-            for vpc in vpcs:
-                if network in vpc.get("subnetworks", []):
-                    matching_vpc = vpc
-                    break
+            matching_vpc = resource_index.vpcs_by_subnetwork.get(network, {})
 
         return matching_vpc
 
     @staticmethod
-    def _get_matching_subnet(instance, subnets) -> dict:
-        subnet_data = {}
+    def _get_matching_subnet(instance, resource_index) -> dict:
         subnetwork_links = []
 
         network_interfaces = instance.get("networkInterfaces", [])
@@ -79,9 +75,4 @@ class VPCHelper:
             if subnetwork != "":
                 subnetwork_links.append(subnetwork)
         # Need to enhanced(multiple networkInterface in multiple subnets)
-        for subnet in subnets:
-            if subnet.get("selfLink", "") in subnetwork_links:
-                subnet_data = subnet
-                break
-
-        return subnet_data
+        return resource_index.get_subnet(subnetwork_links)
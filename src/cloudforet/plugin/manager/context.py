@@ -0,0 +1,39 @@
+import copy
+import threading
+
+from cloudforet.plugin.config.global_conf import REGION_INFO
+from cloudforet.plugin.connector.cache import ResourceCache
+
+__all__ = ["CollectionContext"]
+
+
+class CollectionContext:
+    """State shared by every resource manager of one `Collector.collect` call.
+
+    - cache: ResourceCache of Google API list results
+    - region codes of the collected cloud services, reported once per collection
+
+    A multi-project collection has one context per project (`create_project_context`),
+    which share the catalog of the cache and the region codes.
+    """
+
+    def __init__(self):
+        self.cache = ResourceCache()
+        self._lock = threading.Lock()
+        self._region_codes = set()
+
+    def create_project_context(self):
+        context = copy.copy(self)
+        context.cache = ResourceCache(catalog=self.cache.catalog)
+        return context
+
+    def add_region_code(self, region_code):
+        if region_code not in REGION_INFO:
+            region_code = "global"
+
+        with self._lock:
+            self._region_codes.add(region_code)
+
+    def list_region_codes(self):
+        with self._lock:
+            return sorted(self._region_codes)
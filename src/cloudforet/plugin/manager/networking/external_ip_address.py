@@ -4,7 +4,7 @@ from urllib.parse import urlparse
 
 from spaceone.inventory.plugin.collector.lib import *
 
-from cloudforet.plugin.config.global_conf import ASSET_URL
+from cloudforet.plugin.config.global_conf import ASSET_URL, NETWORKING_INSTANCE_FIELDS
 from cloudforet.plugin.connector.networking.external_ip_address import (
     ExternalIPAddressConnector,
 )
@@ -15,6 +15,7 @@ _LOGGER = logging.getLogger("spaceone")
 
 class ExternalIPAddressManager(ResourceManager):
     service = "Networking"
+    instance_fields = NETWORKING_INSTANCE_FIELDS
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -37,11 +38,16 @@ class ExternalIPAddressManager(ResourceManager):
     def create_cloud_service(self, options, secret_data, schema):
         project_id = secret_data["project_id"]
         exp_conn = ExternalIPAddressConnector(
-            options=options, secret_data=secret_data, schema=schema
+            options=options,
+            secret_data=secret_data,
+            schema=schema,
+            cache=self.cache,
         )
 
         all_addresses = exp_conn.list_addresses()
-        vm_instances = exp_conn.list_instance_for_networks()
+        vm_instances = exp_conn.list_instance_for_networks(
+            fields=self.instance_fields
+        )
         forwarding_rule_address = exp_conn.list_forwarding_rule()
 
         # External IP contains, reserved IP(static) + vm IP(ephemeral) + forwarding rule IP
@@ -50,8 +56,6 @@ class ExternalIPAddressManager(ResourceManager):
         )
         external_ip_addr_id = ""
 
-        cloud_services = []
-        error_responses = []
         for external_ip_addr in all_external_ip_addresses:
             try:
                 region = (
@@ -80,20 +84,18 @@ class ExternalIPAddressManager(ResourceManager):
                     )
 
                 self.set_region_code(region)
-                cloud_services.append(
-                    make_cloud_service(
-                        name=external_ip_addr.get("name", ""),
-                        cloud_service_type=self.cloud_service_type,
-                        cloud_service_group=self.cloud_service_group,
-                        provider=self.provider,
-                        account=project_id,
-                        data=external_ip_addr,
-                        region_code=region,
-                        reference={
-                            "resource_id": self_link,
-                            "external_link": f"https://console.cloud.google.com/networking/addresses/list/project={project_id}",
-                        },
-                    )
+                yield make_cloud_service(
+                    name=external_ip_addr.get("name", ""),
+                    cloud_service_type=self.cloud_service_type,
+                    cloud_service_group=self.cloud_service_group,
+                    provider=self.provider,
+                    account=project_id,
+                    data=external_ip_addr,
+                    region_code=region,
+                    reference={
+                        "resource_id": self_link,
+                        "external_link": f"https://console.cloud.google.com/networking/addresses/list/project={project_id}",
+                    },
                 )
 
             except Exception as e:
@@ -101,15 +103,12 @@ class ExternalIPAddressManager(ResourceManager):
                     f"Error on External IP Address {external_ip_addr_id}: {e}"
                 )
 
-                error_responses.append(
-                    make_error_response(
-                        error=e,
-                        provider=self.provider,
-                        cloud_service_group=self.cloud_service_group,
-                        cloud_service_type=self.cloud_service_type,
-                    )
+                yield make_error_response(
+                    error=e,
+                    provider=self.provider,
+                    cloud_service_group=self.cloud_service_group,
+                    cloud_service_type=self.cloud_service_type,
                 )
-        return cloud_services, error_responses
 
     def _get_external_ip_addresses(
         self, all_addresses, all_instances, forwarding_rules
@@ -127,6 +126,7 @@ class ExternalIPAddressManager(ResourceManager):
             if "EXTERNAL" == ip_addr.get("addressType"):
                 url_region = ip_addr.get("region", "")
                 users = ip_addr.get("users", [])
+                ip_addr = ip_addr.copy()
                 ip_addr.update(
                     {
                         "region": self.get_param_in_url(url_region, "regions")
@@ -153,6 +153,7 @@ class ExternalIPAddressManager(ResourceManager):
             ):
                 rule_name = forwarding_rule.get("name")
                 url_region = forwarding_rule.get("region", "")
+                forwarding_rule = forwarding_rule.copy()
                 forwarding_rule.update(
                     {
                         "isEphemeral": "Ephemeral",
@@ -0,0 +1,113 @@
+from urllib.parse import urlparse
+
+from cloudforet.plugin.manager import ResourceManager
+
+
+class NetworkInstanceIndex:
+    """Applicable instances of firewalls and routes, by VPC network and network tag.
+
+    Built once per collection from the instances listed by `FirewallManager` and
+    `RouteManager`. An instance is projected to one record per network it is attached
+    to, with the address and subnetwork of its network interface on that network.
+    Records are shared by every firewall or route they apply to, and keep the order
+    of the instances.
+    """
+
+    def __init__(self, instances, project_id):
+        # {network: [(position, record)]}, {(network, tag): [(position, record)]}
+        self.records_by_network = {}
+        self.records_by_network_tag = {}
+
+        for instance in instances:
+            networks = set()
+            for network_interface in instance.get("networkInterfaces", []):
+                network = network_interface.get("network")
+                if not network or network in networks:
+                    continue
+
+                networks.add(network)
+                record = self._make_record(instance, network_interface, project_id)
+                item = (len(self.records_by_network.get(network, [])), record)
+                self.records_by_network.setdefault(network, []).append(item)
+                for tag in set(record["tags"]):
+                    self.records_by_network_tag.setdefault((network, tag), []).append(
+                        item
+                    )
+
+    def list_instances(self, network, tags=None):
+        """Records of the instances in `network`, having one of `tags` if any"""
+        if not tags:
+            items = self.records_by_network.get(network, [])
+        else:
+            items = {
+                position: record
+                for tag in tags
+                for position, record in self.records_by_network_tag.get(
+                    (network, tag), []
+                )
+            }.items()
+        return [record for _, record in sorted(items, key=lambda item: item[0])]
+
+    def _make_record(self, instance, network_interface, project_id):
+        zone = self.get_param_in_url(instance.get("zone", ""), "zones")
+        labels = instance.get("labels", {})
+        return {
+            "id": instance.get("id"),
+            "name": instance.get("name"),
+            "zone": zone,
+            "region": self.parse_region_from_zone(zone),
+            "address": network_interface.get("networkIP"),
+            "subnetwork": self.get_param_in_url(
+                network_interface.get("subnetwork", ""), "subnetworks"
+            ),
+            "tags": instance.get("tags", {}).get("items", []),
+            "project": project_id,
+            "serviceAccounts": self._get_service_accounts(
+                instance.get("serviceAccounts", [])
+            ),
+            "creationTimestamp": instance.get("creationTimestamp"),
+            "labels": ResourceManager.convert_labels_format(labels),
+            "labelsDisplay": self._get_label_display(labels),
+        }
+
+    @staticmethod
+    def get_param_in_url(url, key):
+        param = ""
+        raw_path = urlparse(url).path
+        list_path = raw_path.split("/")
+        # Google cloud resource representation rules is /{key}/{value}/{key}/{value}
+        if key in list_path:
+            index_key = list_path.index(key)
+            index_value = index_key + 1
+            param = list_path[index_value]
+        return param
+
+    @staticmethod
+    def parse_region_from_zone(zone):
+        """
+        EX> zone = 'ap-northeast2-a'
+        """
+        parsed_zone = zone.split("-")
+        if len(parsed_zone) >= 2:
+            return f"{parsed_zone[0]}-{parsed_zone[1]}"
+
+        else:
+            return ""
+
+    @staticmethod
+    def _get_service_accounts(service_accounts):
+        service_accounts_list = []
+        for service_account in service_accounts:
+            service_accounts_list.append(service_account.get("email"))
+
+        if not service_accounts_list:
+            service_accounts_list.append("None")
+        return service_accounts_list
+
+    @staticmethod
+    def _get_label_display(labels):
+        displays = []
+        for label in labels:
+            value = labels.get(label, "")
+            displays.append(f"{label}: {value}")
+        return displays
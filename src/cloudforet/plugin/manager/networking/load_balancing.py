@@ -7,6 +7,9 @@ from spaceone.inventory.plugin.collector.lib import *
 from cloudforet.plugin.config.global_conf import ASSET_URL
 from cloudforet.plugin.connector.networking.load_balancing import LoadBalancingConnector
 from cloudforet.plugin.manager import ResourceManager
+from cloudforet.plugin.manager.networking.load_balancing_index import (
+    LoadBalancingComponentIndex,
+)
 
 _LOGGER = logging.getLogger("spaceone")
 
@@ -41,53 +44,54 @@ class LoadBalancingManager(ResourceManager):
         project_id = secret_data["project_id"]
         lb_id = ""
         loadbalancing_conn = LoadBalancingConnector(
-            options=options, secret_data=secret_data, schema=schema
+            options=options,
+            secret_data=secret_data,
+            schema=schema,
+            cache=self.cache,
         )
 
         # Getting all components for loadbalancing
-        forwarding_rules = loadbalancing_conn.list_forwarding_rules()
+        components, errors = self.prefetch(
+            options,
+            {
+                "forwarding_rules": loadbalancing_conn.list_forwarding_rules,
+                "grpc_proxies": loadbalancing_conn.list_grpc_proxies,
+                "http_proxies": loadbalancing_conn.list_target_http_proxies,
+                "https_proxies": loadbalancing_conn.list_target_https_proxies,
+                "ssl_proxies": loadbalancing_conn.list_ssl_proxies,
+                "tcp_proxies": loadbalancing_conn.list_tcp_proxies,
+                "ssl_certificates": loadbalancing_conn.list_ssl_certificates,
+                "url_maps": loadbalancing_conn.list_url_maps,
+                "backend_services": loadbalancing_conn.list_backend_services,
+                "backend_buckets": loadbalancing_conn.list_backend_buckets,
+                "health_checks": loadbalancing_conn.list_health_checks,
+                "http_health_checks": loadbalancing_conn.list_http_health_checks,
+                "https_health_checks": loadbalancing_conn.list_https_health_checks,
+                "target_pools": loadbalancing_conn.list_target_pools,
+            },
+            required=[
+                "forwarding_rules",
+                "grpc_proxies",
+                "http_proxies",
+                "https_proxies",
+                "ssl_proxies",
+                "tcp_proxies",
+            ],
+        )
+        yield from errors
+        forwarding_rules = components["forwarding_rules"]
+        component_index = LoadBalancingComponentIndex(components)
 
         # Extend all types of proxies
         load_balancers = []
-        all_proxies = []
-        grpc_proxies = loadbalancing_conn.list_grpc_proxies()
-        load_balancers.extend(grpc_proxies)
-        all_proxies.extend(grpc_proxies)
-
-        http_proxies = loadbalancing_conn.list_target_http_proxies()
-        load_balancers.extend(http_proxies)
-        all_proxies.extend(http_proxies)
-
-        https_proxies = loadbalancing_conn.list_target_https_proxies()
-        load_balancers.extend(https_proxies)
-        all_proxies.extend(https_proxies)
-
-        ssl_proxies = loadbalancing_conn.list_ssl_proxies()
-        load_balancers.extend(ssl_proxies)
-        all_proxies.extend(ssl_proxies)
-
-        tcp_proxies = loadbalancing_conn.list_tcp_proxies()
-        load_balancers.extend(tcp_proxies)
-        all_proxies.extend(tcp_proxies)
-
-        # SSL Cert for proxy
-        ssl_certificates = loadbalancing_conn.list_ssl_certificates()
-
-        url_maps = loadbalancing_conn.list_url_maps()
-        backend_services = loadbalancing_conn.list_backend_services()
-        backend_buckets = loadbalancing_conn.list_backend_buckets()
-
-        # Health Checks
-        legacy_health_checks = []
-        health_checks = loadbalancing_conn.list_health_checks()
-
-        http_health_checks = loadbalancing_conn.list_http_health_checks()
-        legacy_health_checks.extend(http_health_checks)
-
-        https_health_checks = loadbalancing_conn.list_https_health_checks()
-        legacy_health_checks.extend(https_health_checks)
-
-        target_pools = loadbalancing_conn.list_target_pools()
+        for proxy_type in [
+            "grpc_proxies",
+            "http_proxies",
+            "https_proxies",
+            "ssl_proxies",
+            "tcp_proxies",
+        ]:
+            load_balancers.extend(components[proxy_type])
 
         # Extract loadbalancer information from related resources(Target Proxy, Forwarding Rule)
         # Google Cloud Service Does not provider single object of loadbalancer
@@ -96,33 +100,23 @@ class LoadBalancingManager(ResourceManager):
         )
         load_balancers.extend(target_pool_based_load_balancers)
 
-        cloud_services = []
-        error_responses = []
         for load_balancer in load_balancers:
             try:
-                lb_forwarding_rules = self._get_forwarding_rules(
-                    load_balancer, forwarding_rules
+                lb_forwarding_rules = component_index.list_forwarding_rules(
+                    load_balancer
                 )
                 lb_target_proxy = self._get_target_proxy(load_balancer)
-                lb_certificates = self._get_certificates(
-                    lb_target_proxy, ssl_certificates
-                )
-                lb_urlmap = self._get_urlmap(load_balancer, url_maps)
-                lb_backend_services = self._get_backend_services(
-                    lb_urlmap, backend_services
+                lb_certificates = component_index.list_certificates(lb_target_proxy)
+                lb_urlmap = component_index.get_urlmap(load_balancer)
+                lb_backend_services = component_index.list_backend_services(lb_urlmap)
+                lb_health_checks = component_index.list_health_checks(
+                    lb_backend_services
                 )
-                lb_health_checks = self._get_health_checks(
-                    lb_backend_services, health_checks
-                )
-                lb_legacy_health_checks = self._get_legacy_health_checks(
-                    lb_backend_services, legacy_health_checks
-                )
-                lb_bucket_services = self._get_bucket_services(
-                    lb_urlmap, backend_buckets
-                )
-                lb_target_pools = self._get_target_pools(
-                    lb_forwarding_rules, target_pools
+                lb_legacy_health_checks = component_index.list_legacy_health_checks(
+                    lb_backend_services
                 )
+                lb_bucket_services = component_index.list_bucket_services(lb_urlmap)
+                lb_target_pools = component_index.list_target_pools(lb_forwarding_rules)
 
                 loadbalancer_data = {
                     "id": load_balancer.get("id", ""),
@@ -151,34 +145,29 @@ class LoadBalancingManager(ResourceManager):
 
                 self.set_region_code(loadbalancer_data.get("region", ""))
                 print(load_balancer)
-                cloud_services.append(
-                    make_cloud_service(
-                        name=loadbalancer_data.get("name", ""),
-                        cloud_service_type=self.cloud_service_type,
-                        cloud_service_group=self.cloud_service_group,
-                        provider=self.provider,
-                        account=project_id,
-                        data=loadbalancer_data,
-                        region_code=loadbalancer_data.get("region", ""),
-                        reference={
-                            "resource_id": load_balancer.get("selfLink", ""),
-                            "external_link": load_balancer.get("selfLink", ""),
-                        },
-                    )
+                yield make_cloud_service(
+                    name=loadbalancer_data.get("name", ""),
+                    cloud_service_type=self.cloud_service_type,
+                    cloud_service_group=self.cloud_service_group,
+                    provider=self.provider,
+                    account=project_id,
+                    data=loadbalancer_data,
+                    region_code=loadbalancer_data.get("region", ""),
+                    reference={
+                        "resource_id": load_balancer.get("selfLink", ""),
+                        "external_link": load_balancer.get("selfLink", ""),
+                    },
                 )
 
             except Exception as e:
                 _LOGGER.error(f"Error on LoadBalancer {lb_id}: {e}")
 
-                error_responses.append(
-                    make_error_response(
-                        error=e,
-                        provider=self.provider,
-                        cloud_service_group=self.cloud_service_group,
-                        cloud_service_type=self.cloud_service_type,
-                    )
+                yield make_error_response(
+                    error=e,
+                    provider=self.provider,
+                    cloud_service_group=self.cloud_service_group,
+                    cloud_service_type=self.cloud_service_type,
                 )
-        return cloud_services, error_responses
 
     def _get_loadbalancer_from_forwarding_rule(self, forwarding_rules) -> list:
         loadbalancers = []
@@ -260,107 +249,6 @@ class LoadBalancingManager(ResourceManager):
             proxy_type = {}
         return proxy_type
 
-    @staticmethod
-    def _get_certificates(lb_target_proxy, ssl_certificates) -> list:
-        """
-        Get related certificated to target proxy(LoadBalancer)
-        """
-        matched_certificates = []
-        for cert in ssl_certificates:
-            if cert.get("selfLink", "") in lb_target_proxy.get("sslCertificates", []):
-                matched_certificates.append(cert)
-        return matched_certificates
-
-    @staticmethod
-    def _get_urlmap(load_balancer, url_maps):
-        """
-        Get relatred urlmaps to loadbalancer
-        """
-        matched_urlmap = {}
-        for map in url_maps:
-            if map.get("selfLink") == load_balancer.get("urlMap", ""):
-                matched_urlmap = map
-
-        return matched_urlmap
-
-    @staticmethod
-    def _get_backend_services(lb_urlmap, backend_services):
-        """
-        Get related backend services from urlmap
-        """
-        matched_backend_services = []
-        for svc in backend_services:
-            if lb_urlmap.get("defaultService", "") == svc.get("selfLink"):
-                matched_backend_services.append(svc)
-
-        return matched_backend_services
-
-    @staticmethod
-    def _get_health_checks(lb_backend_services, health_checks):
-        """
-        Get related health checks from backend_services
-        """
-        matched_health_checks = []
-        for svc in lb_backend_services:
-            for check in health_checks:
-                if check.get("selfLink") in svc.get("healthChecks", []):
-                    matched_health_checks.append(check)
-
-        return matched_health_checks
-
-    @staticmethod
-    def _get_legacy_health_checks(lb_backend_services, legacy_health_checks):
-        """
-        Get related legacy health checks from backend_services
-        """
-        matched_legacy_health_checks = []
-        for svc in lb_backend_services:
-            for check in legacy_health_checks:
-                if check.get("selfLink") in svc.get("healthChecks", []):
-                    matched_legacy_health_checks.append(check)
-
-        return matched_legacy_health_checks
-
-    @staticmethod
-    def _get_bucket_services(lb_urlmap, backend_buckets):
-        """
-        Get related bucket backend from urlmaps
-        """
-        matched_bucket_service = []
-        for backend in backend_buckets:
-            if backend.get("selfLink") in lb_urlmap.get("defaultService", ""):
-                matched_bucket_service.append(backend)
-
-        return matched_bucket_service
-
-    @staticmethod
-    def _get_target_pools(lb_forwarding_rules, target_pools):
-        """
-        Get related target pool from forwarding rules
-        """
-        matched_target_pools = []
-        for rule in lb_forwarding_rules:
-            for pool in target_pools:
-                if rule.get("target", "") == pool.get("selfLink"):
-                    matched_target_pools.append(pool)
-
-        return matched_target_pools
-
-    @staticmethod
-    def _get_forwarding_rules(loadbalancer, forwarding_rules):
-        matched_forwarding_rules = []
-        """
-        1. LoadBalancer is target of forwarding rule
-        2. LoadBalancer is same as forwarding rules(Target Pool Based)
-        """
-        for rule in forwarding_rules:
-            if loadbalancer.get("selfLink") == rule.get("target", ""):
-                matched_forwarding_rules.append(rule)
-            if loadbalancer.get("selfLink") == rule.get("selfLink", ""):
-                matched_forwarding_rules.append(rule)
-
-        return matched_forwarding_rules
-
     @staticmethod
     def _get_external_internal(forwarding_rules) -> str:
         external_or_internal = "UnKnown"
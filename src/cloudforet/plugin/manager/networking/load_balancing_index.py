@@ -0,0 +1,116 @@
+class LoadBalancingComponentIndex:
+    """Lookup tables of the components of load balancers.
+
+    Built once per collection from the components fetched by `LoadBalancingManager`,
+    so the components of a load balancer are resolved with dictionary lookups instead
+    of scanning every component list. Matched components keep the order of the
+    component lists.
+    """
+
+    def __init__(self, components):
+        forwarding_rules = components.get("forwarding_rules", [])
+        self.forwarding_rules_by_target = self._index(forwarding_rules, "target")
+        self.forwarding_rules_by_self_link = self._index(forwarding_rules, "selfLink")
+
+        self.certificates_by_self_link = self._index(
+            components.get("ssl_certificates", []), "selfLink"
+        )
+
+        # The last url map of the same selfLink wins
+        self.url_maps_by_self_link = {
+            url_map.get("selfLink"): url_map
+            for url_map in components.get("url_maps", [])
+        }
+
+        self.backend_services_by_self_link = self._index(
+            components.get("backend_services", []), "selfLink"
+        )
+        self.backend_buckets_by_self_link = self._index(
+            components.get("backend_buckets", []), "selfLink"
+        )
+        self.health_checks_by_self_link = self._index(
+            components.get("health_checks", []), "selfLink"
+        )
+        self.legacy_health_checks_by_self_link = self._index(
+            components.get("http_health_checks", [])
+            + components.get("https_health_checks", []),
+            "selfLink",
+        )
+        self.target_pools_by_self_link = self._index(
+            components.get("target_pools", []), "selfLink"
+        )
+
+    def list_forwarding_rules(self, load_balancer):
+        """
+        1. LoadBalancer is target of forwarding rule
+        2. LoadBalancer is same as forwarding rules(Target Pool Based)
+        """
+        self_link = load_balancer.get("selfLink")
+        return self._merge(
+            [
+                self.forwarding_rules_by_target.get(self_link, []),
+                self.forwarding_rules_by_self_link.get(self_link, []),
+            ]
+        )
+
+    def list_certificates(self, lb_target_proxy):
+        return self._list_matched(
+            self.certificates_by_self_link, lb_target_proxy.get("sslCertificates", [])
+        )
+
+    def get_urlmap(self, load_balancer):
+        return self.url_maps_by_self_link.get(load_balancer.get("urlMap", ""), {})
+
+    def list_backend_services(self, lb_urlmap):
+        return self._list_matched(
+            self.backend_services_by_self_link, [lb_urlmap.get("defaultService", "")]
+        )
+
+    def list_bucket_services(self, lb_urlmap):
+        return self._list_matched(
+            self.backend_buckets_by_self_link, [lb_urlmap.get("defaultService", "")]
+        )
+
+    def list_health_checks(self, lb_backend_services):
+        return self._list_matched_by_services(
+            self.health_checks_by_self_link, lb_backend_services
+        )
+
+    def list_legacy_health_checks(self, lb_backend_services):
+        return self._list_matched_by_services(
+            self.legacy_health_checks_by_self_link, lb_backend_services
+        )
+
+    def list_target_pools(self, lb_forwarding_rules):
+        target_pools = []
+        for rule in lb_forwarding_rules:
+            target_pools.extend(
+                self._list_matched(
+                    self.target_pools_by_self_link, [rule.get("target", "")]
+                )
+            )
+        return target_pools
+
+    def _list_matched_by_services(self, index, lb_backend_services):
+        matched = []
+        for svc in lb_backend_services:
+            matched.extend(self._list_matched(index, svc.get("healthChecks", [])))
+        return matched
+
+    @classmethod
+    def _list_matched(cls, index, keys):
+        return cls._merge([index.get(key, []) for key in set(keys)])
+
+    @staticmethod
+    def _index(components, key):
+        # {value of key: [(position, component)]}
+        index = {}
+        for position, component in enumerate(components):
+            if value := component.get(key):
+                index.setdefault(value, []).append((position, component))
+        return index
+
+    @staticmethod
+    def _merge(item_lists):
+        items = [item for item_list in item_lists for item in item_list]
+        return [component for _, component in sorted(items, key=lambda item: item[0])]
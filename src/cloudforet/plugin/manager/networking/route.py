@@ -4,15 +4,17 @@ from urllib.parse import urlparse
 
 from spaceone.inventory.plugin.collector.lib import *
 
-from cloudforet.plugin.config.global_conf import ASSET_URL
+from cloudforet.plugin.config.global_conf import ASSET_URL, NETWORKING_INSTANCE_FIELDS
 from cloudforet.plugin.connector.networking.route import RouteConnector
 from cloudforet.plugin.manager import ResourceManager
+from cloudforet.plugin.manager.networking.instance_index import NetworkInstanceIndex
 
 _LOGGER = logging.getLogger("spaceone")
 
 
 class RouteManager(ResourceManager):
     service = "Networking"
+    instance_fields = NETWORKING_INSTANCE_FIELDS
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -35,18 +37,22 @@ class RouteManager(ResourceManager):
     def create_cloud_service(self, options, secret_data, schema):
         project_id = secret_data["project_id"]
         route_conn = RouteConnector(
-            options=options, secret_data=secret_data, schema=schema
+            options=options,
+            secret_data=secret_data,
+            schema=schema,
+            cache=self.cache,
         )
 
         routes = route_conn.list_routes()
-        compute_vms = route_conn.list_instance()
+        instance_index = NetworkInstanceIndex(
+            route_conn.list_instance(fields=self.instance_fields), project_id
+        )
         region = "global"
         route_id = ""
 
-        cloud_services = []
-        error_responses = []
         for route in routes:
             try:
+                route = route.copy()
                 display = {
                     "networkDisplay": self.get_param_in_url(
                         route.get("network", ""), "networks"
@@ -60,8 +66,8 @@ class RouteManager(ResourceManager):
                     {
                         "display": display,
                         "project": secret_data["project_id"],
-                        "applicableInstance": self._get_matched_instance(
-                            route, secret_data["project_id"], compute_vms
+                        "applicableInstance": instance_index.list_instances(
+                            route.get("network"), route.get("tags")
                         ),
                     }
                 )
@@ -70,34 +76,29 @@ class RouteManager(ResourceManager):
                 route_id = route.get("id", "")
 
                 self.set_region_code(region)
-                cloud_services.append(
-                    make_cloud_service(
-                        name=_name,
-                        cloud_service_type=self.cloud_service_type,
-                        cloud_service_group=self.cloud_service_group,
-                        provider=self.provider,
-                        account=project_id,
-                        data=route,
-                        region_code=region,
-                        reference={
-                            "resource_id": route.get("selfLink", ""),
-                            "external_link": f"https://console.cloud.google.com/networking/routes/details/{_name}?project={project_id}",
-                        },
-                    )
+                yield make_cloud_service(
+                    name=_name,
+                    cloud_service_type=self.cloud_service_type,
+                    cloud_service_group=self.cloud_service_group,
+                    provider=self.provider,
+                    account=project_id,
+                    data=route,
+                    region_code=region,
+                    reference={
+                        "resource_id": route.get("selfLink", ""),
+                        "external_link": f"https://console.cloud.google.com/networking/routes/details/{_name}?project={project_id}",
+                    },
                 )
 
             except Exception as e:
                 _LOGGER.error(f"Error on Route {route_id}: {e}")
 
-                error_responses.append(
-                    make_error_response(
-                        error=e,
-                        provider=self.provider,
-                        cloud_service_group=self.cloud_service_group,
-                        cloud_service_type=self.cloud_service_type,
-                    )
+                yield make_error_response(
+                    error=e,
+                    provider=self.provider,
+                    cloud_service_group=self.cloud_service_group,
+                    cloud_service_type=self.cloud_service_type,
                 )
-        return cloud_services, error_responses
 
     @staticmethod
     def get_param_in_url(url, key):
@@ -167,94 +168,3 @@ class RouteManager(ResourceManager):
             else ["This route applies to all instances within the specified network"]
         )
         return contents if not route.get("tags", []) else route.get("tags", [])
-
-    def _get_matched_instance(self, route, project_id, instances_over_region):
-        matched_instances = []
-
-        for instance in instances_over_region:
-            network_interfaces = instance.get("networkInterfaces", [])
-            zone = self.get_param_in_url(instance.get("zone", ""), "zones")
-            region = self.parse_region_from_zone(zone)
-
-            for network_interface in network_interfaces:
-                if self._check_instance_is_matched(route, instance):
-                    instance_name = instance.get("name")
-                    url_subnetwork = instance.get("subnetwork", "")
-                    instance = {
-                        "id": instance.get("id"),
-                        "name": instance_name,
-                        "zone": zone,
-                        "region": region,
-                        "address": network_interface.get("networkIP"),
-                        "subnetwork": self.get_param_in_url(
-                            url_subnetwork, "subnetworks"
-                        ),
-                        "project": project_id,
-                        "serviceAccounts": self._get_service_accounts(
-                            instance.get("serviceAccounts", [])
-                        ),
-                        "creationTimestamp": instance.get("creationTimestamp"),
-                        "labels": self.convert_labels_format(
-                            instance.get("labels", {})
-                        ),
-                        "labelsDisplay": self._get_label_display(
-                            instance.get("labels", {})
-                        ),
-                        "tags": instance.get("tags", {}).get("items", []),
-                    }
-                    matched_instances.append(instance)
-        return matched_instances
-
-    @staticmethod
-    def parse_region_from_zone(zone):
-        """
-        EX> zone = 'ap-northeast2-a'
-        """
-        parsed_zone = zone.split("-")
-        if len(parsed_zone) >= 2:
-            return f"{parsed_zone[0]}-{parsed_zone[1]}"
-
-        else:
-            return ""
-
-    @staticmethod
-    def _check_instance_is_matched(route, instance):
-        """
-        - instance network is matched to route network(VPC network)
-        - instance tags is matched to route tags
-        """
-        matched = False
-        route_network = route.get("network")
-        network_interfaces = instance.get("networkInterfaces", [])
-
-        for network_interface in network_interfaces:
-            if route_network == network_interface.get("network"):
-                if "tags" in route:
-                    if instance.get("tags", {}).get("items", []) in route.get(
-                        "tags", []
-                    ):
-                        matched = True
-                    else:
-                        matched = False
-                else:
-                    matched = True
-
-        return matched
-
-    @staticmethod
-    def _get_service_accounts(service_accounts):
-        service_accounts_list = []
-        for service_account in service_accounts:
-            service_accounts_list.append(service_account.get("email"))
-
-        if not service_accounts_list:
-            service_accounts_list.append("None")
-        return service_accounts_list
-
-    @staticmethod
-    def _get_label_display(labels):
-        displays = []
-        for label in labels:
-            value = labels.get(label, "")
-            displays.append(f"{label}: {value}")
-        return displays
@@ -6,6 +6,9 @@ from spaceone.inventory.plugin.collector.lib import *
 from cloudforet.plugin.config.global_conf import ASSET_URL
 from cloudforet.plugin.connector.networking.vpc_network import VPCNetworkConnector
 from cloudforet.plugin.manager import ResourceManager
+from cloudforet.plugin.manager.networking.vpc_network_index import (
+    VPCNetworkResourceIndex,
+)
 
 _LOGGER = logging.getLogger("spaceone")
 
@@ -39,26 +42,47 @@ class VPCNetworkManager(ResourceManager):
         network_id = ""
         project_id = secret_data["project_id"]
         vpc_conn = VPCNetworkConnector(
-            options=options, secret_data=secret_data, schema=schema
+            options=options,
+            secret_data=secret_data,
+            schema=schema,
+            cache=self.cache,
         )
 
-        networks = vpc_conn.list_networks()
-        firewalls = vpc_conn.list_firewall()
-        subnets = vpc_conn.list_subnetworks()
-        routes = vpc_conn.list_routes()
-        regional_address = vpc_conn.list_regional_addresses()
+        resources, errors = self.prefetch(
+            options,
+            {
+                "networks": vpc_conn.list_networks,
+                "firewalls": vpc_conn.list_firewall,
+                "subnets": vpc_conn.list_subnetworks,
+                "routes": vpc_conn.list_routes,
+                "regional_address": vpc_conn.list_regional_addresses,
+            },
+            required=["networks"],
+        )
+        yield from errors
+        networks = resources["networks"]
+        resource_index = VPCNetworkResourceIndex(
+            networks,
+            resources["firewalls"],
+            resources["routes"],
+            resources["subnets"],
+            resources["regional_address"],
+        )
 
-        cloud_services = []
-        error_responses = []
         for network in networks:
             try:
                 network_id = network.get("id")
+                network = network.copy()
                 network_identifier = network.get("selfLink")
                 matched_firewall = self._get_matched_firewalls(
-                    network_identifier, firewalls
+                    resource_index.list_firewalls(network)
+                )
+                matched_route = self.get_matched_route(
+                    resource_index.list_routes(network)
+                )
+                matched_subnets = self._get_matched_subnets(
+                    resource_index.list_subnets(network)
                 )
-                matched_route = self.get_matched_route(network_identifier, routes)
-                matched_subnets = self._get_matched_subnets(network_identifier, subnets)
                 region = self.match_region_info("global")
                 peerings = self.get_peering(network)
 
@@ -78,7 +102,7 @@ class VPCNetworkManager(ResourceManager):
                         if network.get("autoCreateSubnetworks")
                         else "Custom",
                         "ipAddressData": self.get_internal_ip_address_in_use(
-                            network, regional_address
+                            network, resource_index.list_internal_addresses(network)
                         ),
                         "peerings": peerings,
                         "routeData": {
@@ -99,60 +123,52 @@ class VPCNetworkManager(ResourceManager):
                 _name = network.get("name", "")
 
                 self.set_region_code(region.get("region_code"))
-                cloud_services.append(
-                    make_cloud_service(
-                        name=_name,
-                        cloud_service_type=self.cloud_service_type,
-                        cloud_service_group=self.cloud_service_group,
-                        provider=self.provider,
-                        account=project_id,
-                        data=network,
-                        region_code=region.get("region_code"),
-                        reference={
-                            "resource_id": network_identifier,
-                            "external_link": f"https://console.cloud.google.com/networking/networks/details/{_name}?project={project_id}",
-                        },
-                    )
+                yield make_cloud_service(
+                    name=_name,
+                    cloud_service_type=self.cloud_service_type,
+                    cloud_service_group=self.cloud_service_group,
+                    provider=self.provider,
+                    account=project_id,
+                    data=network,
+                    region_code=region.get("region_code"),
+                    reference={
+                        "resource_id": network_identifier,
+                        "external_link": f"https://console.cloud.google.com/networking/networks/details/{_name}?project={project_id}",
+                    },
                 )
 
             except Exception as e:
                 _LOGGER.error(f"Error on Network {network_id}: {e}")
 
-                error_responses.append(
-                    make_error_response(
-                        error=e,
-                        provider=self.provider,
-                        cloud_service_group=self.cloud_service_group,
-                        cloud_service_type=self.cloud_service_type,
-                    )
+                yield make_error_response(
+                    error=e,
+                    provider=self.provider,
+                    cloud_service_group=self.cloud_service_group,
+                    cloud_service_type=self.cloud_service_type,
                 )
-        return cloud_services, error_responses
 
-    def get_internal_ip_address_in_use(self, network, regional_address):
+    def get_internal_ip_address_in_use(self, network, internal_addresses):
         all_internal_addresses = []
 
-        for ip_address in regional_address:
-            ip_type = ip_address.get("addressType", "")
-            subnetwork = ip_address.get("subnetwork", "")
-
-            if ip_type == "INTERNAL" and subnetwork in network.get("subnetworks", []):
-                url_region = ip_address.get("region")
-                users = ip_address.get("users")
-                ip_address.update(
-                    {
-                        "subnetName": network.get("name"),
-                        "ipVersionDisplay": self._valid_ip_address(
-                            ip_address.get("address")
-                        ),
-                        "region": self.get_param_in_url(url_region, "regions")
-                        if url_region
-                        else "global",
-                        "usedBy": self._get_parse_users(users) if users else ["None"],
-                        "isEphemeral": "Static",
-                    }
-                )
+        for ip_address in internal_addresses:
+            url_region = ip_address.get("region")
+            users = ip_address.get("users")
+            ip_address = ip_address.copy()
+            ip_address.update(
+                {
+                    "subnetName": network.get("name"),
+                    "ipVersionDisplay": self._valid_ip_address(
+                        ip_address.get("address")
+                    ),
+                    "region": self.get_param_in_url(url_region, "regions")
+                    if url_region
+                    else "global",
+                    "usedBy": self._get_parse_users(users) if users else ["None"],
+                    "isEphemeral": "Static",
+                }
+            )
 
-                all_internal_addresses.append(ip_address)
+            all_internal_addresses.append(ip_address)
 
         return all_internal_addresses
 
@@ -187,103 +203,93 @@ class VPCNetworkManager(ResourceManager):
                 "exCustomRoute": ex_custom,
                 "exRoutePublicIpDisplay": ex_route,
             }
-            peer.update({"display": display})
-            updated_peering.append(peer)
+            updated_peering.append(dict(peer, display=display))
         return updated_peering
 
-    def get_matched_route(self, network, routes):
+    def get_matched_route(self, routes):
         route_vos = []
 
         for route in routes:
-            if network == route.get("network", ""):
-                next_hop = ""
-                if "nextHopInstance" in route:
-                    url_next_hop_instance = route.get("nextHopInstance", "")
-                    target = self.get_param_in_url(url_next_hop_instance, "instances")
-                    zone = self.get_param_in_url(url_next_hop_instance, "zones")
-                    next_hop = f"Instance {target} (zone  {zone})"
-
-                elif "nextHopIp" in route:
-                    target = route.get("nextHopIp")
-                    next_hop = f"IP address lie within {target}"
-
-                elif "nextHopNetwork" in route:
-                    url_next_hop_network = route.get("nextHopNetwork", "")
-                    target = self.get_param_in_url(url_next_hop_network, "networks")
-                    next_hop = f"Virtual network {target}"
-
-                elif "nextHopGateway" in route:
-                    url_next_hop_gateway = route.get("nextHopGateway", "")
-                    target = self.get_param_in_url(url_next_hop_gateway, "gateways")
-                    next_hop = f"{target} internet gateway"
-
-                elif "nextHopIlb" in route:
-                    url_next_hop_ilb = route.get("nextHopIlb", "")
-                    target = self.get_param_in_url(url_next_hop_ilb, "forwardingRules")
-                    next_hop = f" Loadbalancer on {target}"
-
-                elif "nextHopPeering" in route:
-                    target = route.get("nextHopPeering")
-                    next_hop = f"Peering : {target}"
-
-                route.update(
-                    {
-                        "nextHop": next_hop,
-                    }
-                )
-                route_vos.append(route)
+            next_hop = ""
+            if "nextHopInstance" in route:
+                url_next_hop_instance = route.get("nextHopInstance", "")
+                target = self.get_param_in_url(url_next_hop_instance, "instances")
+                zone = self.get_param_in_url(url_next_hop_instance, "zones")
+                next_hop = f"Instance {target} (zone  {zone})"
+
+            elif "nextHopIp" in route:
+                target = route.get("nextHopIp")
+                next_hop = f"IP address lie within {target}"
+
+            elif "nextHopNetwork" in route:
+                url_next_hop_network = route.get("nextHopNetwork", "")
+                target = self.get_param_in_url(url_next_hop_network, "networks")
+                next_hop = f"Virtual network {target}"
+
+            elif "nextHopGateway" in route:
+                url_next_hop_gateway = route.get("nextHopGateway", "")
+                target = self.get_param_in_url(url_next_hop_gateway, "gateways")
+                next_hop = f"{target} internet gateway"
+
+            elif "nextHopIlb" in route:
+                url_next_hop_ilb = route.get("nextHopIlb", "")
+                target = self.get_param_in_url(url_next_hop_ilb, "forwardingRules")
+                next_hop = f" Loadbalancer on {target}"
+
+            elif "nextHopPeering" in route:
+                target = route.get("nextHopPeering")
+                next_hop = f"Peering : {target}"
+
+            route_vos.append(dict(route, nextHop=next_hop))
         return route_vos
 
-    def _get_matched_subnets(self, network, subnets):
+    def _get_matched_subnets(self, subnets):
         matched_subnet = []
         for subnet in subnets:
-            if network == subnet.get("network", ""):
-                log_config = subnet.get("logConfig", {})
-                url_region = subnet.get("region")
-                subnet.update(
-                    {
-                        "region": self.get_param_in_url(url_region, "regions"),
-                        "googleAccess": "On"
-                        if subnet.get("privateIpGoogleAccess")
-                        else "Off",
-                        "flowLog": "On" if log_config.get("enable") else "Off",
-                    }
-                )
-                matched_subnet.append(subnet)
+            log_config = subnet.get("logConfig", {})
+            url_region = subnet.get("region")
+            subnet = subnet.copy()
+            subnet.update(
+                {
+                    "region": self.get_param_in_url(url_region, "regions"),
+                    "googleAccess": "On"
+                    if subnet.get("privateIpGoogleAccess")
+                    else "Off",
+                    "flowLog": "On" if log_config.get("enable") else "Off",
+                }
+            )
+            matched_subnet.append(subnet)
         return matched_subnet
 
     @staticmethod
-    def _get_matched_firewalls(network, firewalls):
+    def _get_matched_firewalls(firewalls):
         firewall_vos = []
 
         for firewall in firewalls:
-            if network == firewall.get("network", ""):
-                target_tag = firewall.get("targetTags", [])
-                filter_range = ", ".join(firewall.get("sourceRanges", ""))
-                log_config = firewall.get("logConfig", {})
-
-                protocol_port = []
-                flag = "allowed" if "allowed" in firewall else "denied"
-                for allowed in firewall.get(flag, []):
-                    ip_protocol = allowed.get("IPProtocol", "")
-
-                    for port in allowed.get("ports", []):
-                        protocol_port.append(f"{ip_protocol}: {port}")
-
-                display = {
-                    "typeDisplay": "Ingress"
-                    if firewall.get("direction") == "INGRESS"
-                    else "Egress",
-                    "targetDisplay": ["Apply to all"] if not target_tag else target_tag,
-                    "filter": f"IP ranges: {filter_range}",
-                    "protocolsPort": protocol_port,
-                    "action": "Allow" if "allowed" in firewall else "Deny",
-                    "logs": "On" if log_config.get("enable") else "Off",
-                }
+            target_tag = firewall.get("targetTags", [])
+            filter_range = ", ".join(firewall.get("sourceRanges", ""))
+            log_config = firewall.get("logConfig", {})
+
+            protocol_port = []
+            flag = "allowed" if "allowed" in firewall else "denied"
+            for allowed in firewall.get(flag, []):
+                ip_protocol = allowed.get("IPProtocol", "")
 
-                firewall.update({"display": display})
+                for port in allowed.get("ports", []):
+                    protocol_port.append(f"{ip_protocol}: {port}")
+
+            display = {
+                "typeDisplay": "Ingress"
+                if firewall.get("direction") == "INGRESS"
+                else "Egress",
+                "targetDisplay": ["Apply to all"] if not target_tag else target_tag,
+                "filter": f"IP ranges: {filter_range}",
+                "protocolsPort": protocol_port,
+                "action": "Allow" if "allowed" in firewall else "Deny",
+                "logs": "On" if log_config.get("enable") else "Off",
+            }
 
-                firewall_vos.append(firewall)
+            firewall_vos.append(dict(firewall, display=display))
         return firewall_vos
 
     @staticmethod
@@ -0,0 +1,50 @@
+class VPCNetworkResourceIndex:
+    """Resources of VPC networks, partitioned by network.
+
+    Built in a single pass over the resources fetched by `VPCNetworkManager`, so the
+    resources of a network are looked up instead of scanning every resource list.
+    Firewalls, routes and subnets belong to the network of their `network` field.
+    Internal addresses belong to the network whose `subnetworks` has their subnetwork.
+    Resources of a network keep the order of the resource lists.
+    """
+
+    def __init__(self, networks, firewalls, routes, subnets, regional_addresses):
+        self.firewalls_by_network = self._partition(firewalls, "network")
+        self.routes_by_network = self._partition(routes, "network")
+        self.subnets_by_network = self._partition(subnets, "network")
+
+        # {subnetwork selfLink: network selfLink}
+        networks_by_subnetwork = {
+            subnetwork: network.get("selfLink")
+            for network in networks
+            for subnetwork in set(network.get("subnetworks", []))
+        }
+        self.internal_addresses_by_network = {}
+        for address in regional_addresses:
+            if address.get("addressType", "") != "INTERNAL":
+                continue
+
+            if network := networks_by_subnetwork.get(address.get("subnetwork", "")):
+                self.internal_addresses_by_network.setdefault(network, []).append(
+                    address
+                )
+
+    def list_firewalls(self, network):
+        return self.firewalls_by_network.get(network.get("selfLink"), [])
+
+    def list_routes(self, network):
+        return self.routes_by_network.get(network.get("selfLink"), [])
+
+    def list_subnets(self, network):
+        return self.subnets_by_network.get(network.get("selfLink"), [])
+
+    def list_internal_addresses(self, network):
+        return self.internal_addresses_by_network.get(network.get("selfLink"), [])
+
+    @staticmethod
+    def _partition(resources, key):
+        partitions = {}
+        for resource in resources:
+            if value := resource.get(key):
+                partitions.setdefault(value, []).append(resource)
+        return partitions
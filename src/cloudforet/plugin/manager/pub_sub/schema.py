@@ -34,14 +34,18 @@ class SchemaManager(ResourceManager):
     def create_cloud_service(self, options, secret_data, schema):
         project_id = secret_data["project_id"]
         schema_connector = SchemaConnector(
-            options=options, secret_data=secret_data, schema=schema
+            options=options,
+            secret_data=secret_data,
+            schema=schema,
+            cache=self.cache,
         )
 
-        cloud_services = []
-        error_responses = []
-        for schema_name in schema_connector.list_schema_names():
+        schema_names = schema_connector.list_schema_names()
+        for schema_name, schema in schema_connector.get_schemas(schema_names).items():
             try:
-                schema = schema_connector.get_schema(schema_name)
+                if isinstance(schema, Exception):
+                    raise schema
+
                 schema_id = self._make_schema_id(schema_name, project_id)
 
                 display = {"outputDisplay": "show"}
@@ -55,36 +59,31 @@ class SchemaManager(ResourceManager):
                     }
                 )
                 self.set_region_code("global")
-                cloud_services.append(
-                    make_cloud_service(
-                        name=schema_name,
-                        cloud_service_type=self.cloud_service_type,
-                        cloud_service_group=self.cloud_service_group,
-                        provider=self.provider,
-                        account=project_id,
-                        data=schema,
-                        region_code="global",
-                        instance_type="",
-                        instance_size=0,
-                        reference={
-                            "resource_id": schema_name,
-                            "external_link": f"https://console.cloud.google.com/cloudpubsub/schema/detail/{schema_name}?project={project_id}",
-                        },
-                    )
+                yield make_cloud_service(
+                    name=schema_name,
+                    cloud_service_type=self.cloud_service_type,
+                    cloud_service_group=self.cloud_service_group,
+                    provider=self.provider,
+                    account=project_id,
+                    data=schema,
+                    region_code="global",
+                    instance_type="",
+                    instance_size=0,
+                    reference={
+                        "resource_id": schema_name,
+                        "external_link": f"https://console.cloud.google.com/cloudpubsub/schema/detail/{schema_name}?project={project_id}",
+                    },
                 )
 
             except Exception as e:
                 _LOGGER.error(f"Error on Schema {schema_name}: {e}")
 
-                error_responses.append(
-                    make_error_response(
-                        error=e,
-                        provider=self.provider,
-                        cloud_service_group=self.cloud_service_group,
-                        cloud_service_type=self.cloud_service_type,
-                    )
+                yield make_error_response(
+                    error=e,
+                    provider=self.provider,
+                    cloud_service_group=self.cloud_service_group,
+                    cloud_service_type=self.cloud_service_type,
                 )
-        return cloud_services, error_responses
 
     @staticmethod
     def _make_schema_id(schema_name, project_id):
@@ -34,11 +34,12 @@ class SnapshotManager(ResourceManager):
     def create_cloud_service(self, options, secret_data, schema):
         project_id = secret_data["project_id"]
         snapshot_connector = SnapshotConnector(
-            options=options, secret_data=secret_data, schema=schema
+            options=options,
+            secret_data=secret_data,
+            schema=schema,
+            cache=self.cache,
         )
 
-        cloud_services = []
-        error_responses = []
         for snapshot in snapshot_connector.list_snapshots():
             try:
                 snapshot_name = snapshot.get("name")
@@ -53,37 +54,32 @@ class SnapshotManager(ResourceManager):
                     }
                 )
 
-                cloud_services.append(
-                    make_cloud_service(
-                        name=snapshot_name,
-                        cloud_service_type=self.cloud_service_type,
-                        cloud_service_group=self.cloud_service_group,
-                        provider=self.provider,
-                        account=project_id,
-                        tags=snapshot.get("labels", []),
-                        data=snapshot,
-                        region_code="global",
-                        instance_type="",
-                        instance_size=0,
-                        reference={
-                            "resource_id": snapshot_id,
-                            "external_link": f"https://console.cloud.google.com/cloudpubsub/snapshot/detail/{snapshot_id}?project={project_id}",
-                        },
-                    )
+                yield make_cloud_service(
+                    name=snapshot_name,
+                    cloud_service_type=self.cloud_service_type,
+                    cloud_service_group=self.cloud_service_group,
+                    provider=self.provider,
+                    account=project_id,
+                    tags=snapshot.get("labels", []),
+                    data=snapshot,
+                    region_code="global",
+                    instance_type="",
+                    instance_size=0,
+                    reference={
+                        "resource_id": snapshot_id,
+                        "external_link": f"https://console.cloud.google.com/cloudpubsub/snapshot/detail/{snapshot_id}?project={project_id}",
+                    },
                 )
 
             except Exception as e:
                 _LOGGER.error(f"Error on Snapshot {snapshot.get('name')}: {e}")
 
-                error_responses.append(
-                    make_error_response(
-                        error=e,
-                        provider=self.provider,
-                        cloud_service_group=self.cloud_service_group,
-                        cloud_service_type=self.cloud_service_type,
-                    )
+                yield make_error_response(
+                    error=e,
+                    provider=self.provider,
+                    cloud_service_group=self.cloud_service_group,
+                    cloud_service_type=self.cloud_service_type,
                 )
-        return cloud_services, error_responses
 
     @staticmethod
     def _make_snapshot_id(snapshot_name, project_id):
@@ -34,11 +34,12 @@ class SubscriptionManager(ResourceManager):
     def create_cloud_service(self, options, secret_data, schema):
         project_id = secret_data["project_id"]
         subscription_connector = SubscriptionConnector(
-            options=options, secret_data=secret_data, schema=schema
+            options=options,
+            secret_data=secret_data,
+            schema=schema,
+            cache=self.cache,
         )
 
-        cloud_services = []
-        error_responses = []
         for subscription in subscription_connector.list_subscriptions():
             try:
                 subscription_name = subscription.get("name")
@@ -132,37 +133,32 @@ class SubscriptionManager(ResourceManager):
                     }
                 )
 
-                cloud_services.append(
-                    make_cloud_service(
-                        name=subscription_name,
-                        cloud_service_type=self.cloud_service_type,
-                        cloud_service_group=self.cloud_service_group,
-                        provider=self.provider,
-                        account=project_id,
-                        tags=subscription.get("labels", []),
-                        data=subscription,
-                        region_code="global",
-                        instance_type="",
-                        instance_size=0,
-                        reference={
-                            "resource_id": subscription_id,
-                            "external_link": f"https://console.cloud.google.com/cloudpubsub/subscription/detail/{subscription_id}?project={project_id}",
-                        },
-                    )
+                yield make_cloud_service(
+                    name=subscription_name,
+                    cloud_service_type=self.cloud_service_type,
+                    cloud_service_group=self.cloud_service_group,
+                    provider=self.provider,
+                    account=project_id,
+                    tags=subscription.get("labels", []),
+                    data=subscription,
+                    region_code="global",
+                    instance_type="",
+                    instance_size=0,
+                    reference={
+                        "resource_id": subscription_id,
+                        "external_link": f"https://console.cloud.google.com/cloudpubsub/subscription/detail/{subscription_id}?project={project_id}",
+                    },
                 )
 
             except Exception as e:
                 _LOGGER.error(f"Error on Subscription {subscription.get('name')}: {e}")
 
-                error_responses.append(
-                    make_error_response(
-                        error=e,
-                        provider=self.provider,
-                        cloud_service_group=self.cloud_service_group,
-                        cloud_service_type=self.cloud_service_type,
-                    )
+                yield make_error_response(
+                    error=e,
+                    provider=self.provider,
+                    cloud_service_group=self.cloud_service_group,
+                    cloud_service_type=self.cloud_service_type,
                 )
-        return cloud_services, error_responses
 
     def _make_time_to_dhms_format(self, duration):
         if isinstance(duration, int):
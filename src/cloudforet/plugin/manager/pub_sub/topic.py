@@ -34,11 +34,12 @@ class TopicManager(ResourceManager):
     def create_cloud_service(self, options, secret_data, schema):
         project_id = secret_data["project_id"]
         topic_connector = TopicConnector(
-            options=options, secret_data=secret_data, schema=schema
+            options=options,
+            secret_data=secret_data,
+            schema=schema,
+            cache=self.cache,
         )
 
-        cloud_services = []
-        error_responses = []
         for topic in topic_connector.list_topics():
             try:
                 topic_name = topic.get("name")
@@ -48,8 +49,16 @@ class TopicManager(ResourceManager):
 
                 subscriptions = []
                 subscription_names = topic_connector.list_subscription_names(topic_name)
-                for subscription_name in subscription_names:
-                    subscription = topic_connector.get_subscription(subscription_name)
+                subscriptions_by_name = topic_connector.get_subscriptions(
+                    subscription_names
+                )
+                for subscription_name, subscription in subscriptions_by_name.items():
+                    if isinstance(subscription, Exception):
+                        yield self._make_item_error_response(
+                            "Subscription", subscription_name, subscription
+                        )
+                        continue
+
                     push_config = subscription.get("pushConfig")
                     bigquery_config = subscription.get("bigqueryConfig")
                     subscription.update(
@@ -60,12 +69,20 @@ class TopicManager(ResourceManager):
                             ),
                         }
                     )
+                    subscriptions.append(subscription)
 
                 snapshots = []
                 snapshot_names = topic_connector.list_snapshot_names(topic_name)
-                for snapshot_name in snapshot_names:
-                    snapshot = topic_connector.get_snapshot(snapshot_name)
+                snapshots_by_name = topic_connector.get_snapshots(snapshot_names)
+                for snapshot_name, snapshot in snapshots_by_name.items():
+                    if isinstance(snapshot, Exception):
+                        yield self._make_item_error_response(
+                            "Snapshot", snapshot_name, snapshot
+                        )
+                        continue
+
                     snapshot.update({"id": self._make_snapshot_id(snapshot_name)})
+                    snapshots.append(snapshot)
 
                 display = {
                     "subscriptionCount": len(subscription_names),
@@ -99,37 +116,42 @@ class TopicManager(ResourceManager):
                     }
                 )
 
-                cloud_services.append(
-                    make_cloud_service(
-                        name=topic_name,
-                        cloud_service_type=self.cloud_service_type,
-                        cloud_service_group=self.cloud_service_group,
-                        provider=self.provider,
-                        account=project_id,
-                        tags=labels,
-                        data=topic,
-                        region_code="global",
-                        instance_type="",
-                        instance_size=0,
-                        reference={
-                            "resource_id": topic_id,
-                            "external_link": f"https://console.cloud.google.com/cloudpubsub/topic/detail/{topic_id}?project={project_id}",
-                        },
-                    )
+                yield make_cloud_service(
+                    name=topic_name,
+                    cloud_service_type=self.cloud_service_type,
+                    cloud_service_group=self.cloud_service_group,
+                    provider=self.provider,
+                    account=project_id,
+                    tags=labels,
+                    data=topic,
+                    region_code="global",
+                    instance_type="",
+                    instance_size=0,
+                    reference={
+                        "resource_id": topic_id,
+                        "external_link": f"https://console.cloud.google.com/cloudpubsub/topic/detail/{topic_id}?project={project_id}",
+                    },
                 )
 
             except Exception as e:
                 _LOGGER.error(f"Error on Topic {topic.get('name')}: {e}")
 
-                error_responses.append(
-                    make_error_response(
-                        error=e,
-                        provider=self.provider,
-                        cloud_service_group=self.cloud_service_group,
-                        cloud_service_type=self.cloud_service_type,
-                    )
+                yield make_error_response(
+                    error=e,
+                    provider=self.provider,
+                    cloud_service_group=self.cloud_service_group,
+                    cloud_service_type=self.cloud_service_type,
                 )
-        return cloud_services, error_responses
+
+    def _make_item_error_response(self, kind, name, error):
+        _LOGGER.error(f"Error on Topic {kind} {name}: {error}")
+
+        return make_error_response(
+            error=error,
+            provider=self.provider,
+            cloud_service_group=self.cloud_service_group,
+            cloud_service_type=self.cloud_service_type,
+        )
 
     def _change_duration_to_dhm(self, duration):
         seconds, _ = duration.split("s")
@@ -0,0 +1,128 @@
+import functools
+import importlib
+import logging
+
+__all__ = ["ManagerRegistry"]
+_LOGGER = logging.getLogger("spaceone")
+
+# (cloud service group, cloud service type, manager class), in collection order
+MANAGERS = [
+    ("Pub/Sub", "Schema", "pub_sub.schema.SchemaManager"),
+    ("Pub/Sub", "Snapshot", "pub_sub.snapshot.SnapshotManager"),
+    ("Pub/Sub", "Subscription", "pub_sub.subscription.SubscriptionManager"),
+    ("Pub/Sub", "Topic", "pub_sub.topic.TopicManager"),
+    ("CloudFunctions", "Function", "cloud_functions.function_gen1.FunctionGen1Manager"),
+    ("CloudFunctions", "Function", "cloud_functions.function_gen2.FunctionGen2Manager"),
+    ("CloudSQL", "Instance", "cloud_sql.instance.CloudSQLManager"),
+    ("CloudStorage", "Bucket", "cloud_storage.bucket.BucketManager"),
+    ("BigQuery", "SQLWorkspace", "bigquery.sql_workspace.SQLWorkspaceManager"),
+    ("Networking", "VPCNetwork", "networking.vpc_network.VPCNetworkManager"),
+    ("Networking", "Route", "networking.route.RouteManager"),
+    ("Networking", "LoadBalancing", "networking.load_balancing.LoadBalancingManager"),
+    ("Networking", "Firewall", "networking.firewall.FirewallManager"),
+    (
+        "Networking",
+        "ExternalIPAddress",
+        "networking.external_ip_address.ExternalIPAddressManager",
+    ),
+    ("ComputeEngine", "Disk", "compute_engine.disk.DiskManager"),
+    (
+        "ComputeEngine",
+        "InstanceGroup",
+        "compute_engine.instance_group.InstanceGroupManager",
+    ),
+    (
+        "ComputeEngine",
+        "InstanceTemplate",
+        "compute_engine.instance_template.InstanceTemplateManager",
+    ),
+    (
+        "ComputeEngine",
+        "MachineImage",
+        "compute_engine.machine_image.MachineImageManager",
+    ),
+    ("ComputeEngine", "Snapshot", "compute_engine.snapshot.SnapshotManager"),
+    ("ComputeEngine", "Instance", "compute_engine.instance.VMInstanceManager"),
+]
+
+# Cloud service types whose connectors limit their API calls to options.region_codes.
+# The others list every resource of the project and drop the other regions afterwards.
+REGION_SCOPED = {
+    ("ComputeEngine", "Disk"),
+    ("ComputeEngine", "InstanceGroup"),
+    ("ComputeEngine", "Instance"),
+}
+
+
+class ManagerRegistry:
+    """Resource managers by (cloud service group, cloud service type).
+
+    Manager modules (and their connectors) are imported when a manager is first
+    selected, so a collection only imports the managers it runs.
+    A selection is a cloud service group (e.g. "ComputeEngine") or a cloud service type
+    of a group (e.g. "ComputeEngine.Instance").
+    """
+
+    @staticmethod
+    def list_services():
+        services = []
+        for service, _, _ in MANAGERS:
+            if service not in services:
+                services.append(service)
+        return services
+
+    @classmethod
+    def list_managers(cls, selections=None):
+        """Manager classes of `selections` (all by default), each once, in collection order"""
+        if selections is None:
+            return [cls._load(path) for _, _, path in MANAGERS]
+
+        paths = []
+        for selection in selections:
+            matched = [
+                path
+                for service, cloud_service_type, path in MANAGERS
+                if selection in (service, f"{service}.{cloud_service_type}")
+            ]
+            if not matched:
+                _LOGGER.warning(
+                    f"[ManagerRegistry] unknown cloud service type: {selection}"
+                )
+            paths.extend(path for path in matched if path not in paths)
+
+        return [cls._load(path) for _, _, path in MANAGERS if path in paths]
+
+    @staticmethod
+    def split_region_scoped(selection):
+        """Splits `selection` into (region scoped, other) selections.
+
+        e.g. "ComputeEngine" -> (["ComputeEngine.Disk", "ComputeEngine.InstanceGroup",
+        ...], ["ComputeEngine.InstanceTemplate", ...]), "Networking" -> ([], ["Networking"])
+        """
+        cloud_service_types = []
+        for service, cloud_service_type, _ in MANAGERS:
+            if selection in (service, f"{service}.{cloud_service_type}"):
+                if (service, cloud_service_type) not in cloud_service_types:
+                    cloud_service_types.append((service, cloud_service_type))
+
+        region_scoped = [
+            f"{service}.{cloud_service_type}"
+            for service, cloud_service_type in cloud_service_types
+            if (service, cloud_service_type) in REGION_SCOPED
+        ]
+        if not region_scoped:
+            return [], [selection]
+
+        others = [
+            f"{service}.{cloud_service_type}"
+            for service, cloud_service_type in cloud_service_types
+            if (service, cloud_service_type) not in REGION_SCOPED
+        ]
+        return region_scoped, others
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _load(path):
+        module_name, class_name = path.rsplit(".", 1)
+        module = importlib.import_module(f"cloudforet.plugin.manager.{module_name}")
+        return getattr(module, class_name)